@@ -1,18 +1,16 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from app.dependencies.auth_dependency import get_db
-from app.core.database import get_db
+from app.core.database import get_db_session
 
 from app.schemas.user_schema import RegisterRequest, LoginRequest
-from app.services.auth_service import AuthService
+from app.services.async_auth_service import async_auth_service
+from app.core.request_timing import TimedRoute
 
-router = APIRouter(prefix="/auth", tags=["Auth"])
-auth_service = AuthService()
+router = APIRouter(prefix="/auth", tags=["Auth"], route_class=TimedRoute)
 
 
 @router.post("/register")
-def register(data: RegisterRequest, db: Session = Depends(get_db)):
-    return auth_service.register_user(
+async def register(data: RegisterRequest, db=Depends(get_db_session)):
+    return await async_auth_service.register_user(
         db,
         data.email,
         data.password,
@@ -21,8 +19,8 @@ def register(data: RegisterRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/login")
-def login(data: LoginRequest, db: Session = Depends(get_db)):
-    return auth_service.login_user(
+async def login(data: LoginRequest, db=Depends(get_db_session)):
+    return await async_auth_service.login_user(
         db,
         data.email,
         data.password
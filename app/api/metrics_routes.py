@@ -0,0 +1,60 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.hashing import password_hashing
+from app.core.metrics import metrics
+from app.core.middleware import _DroppingQueueHandler
+from app.core.request_timing import TimedRoute
+from app.core.response_cache import response_cache
+from app.core.token_cache import token_cache
+from app.services.change_feed import change_feed
+from app.services.price_analytics import price_analytics
+
+router = APIRouter(tags=["Monitoring"], route_class=TimedRoute)
+
+
+def _stats_gauge(stats, keys):
+    return lambda: {(("stat", key),): stats()[key] for key in keys}
+
+
+metrics.register_collector(
+    "response_cache",
+    "Read endpoint response cache counters.",
+    _stats_gauge(response_cache.stats, ["entries", "bytes", "hits", "misses", "not_modified"])
+)
+metrics.register_collector(
+    "token_cache",
+    "Verified token cache counters.",
+    _stats_gauge(token_cache.stats, ["entries", "hits", "misses", "evictions"])
+)
+metrics.register_collector(
+    "password_hashing",
+    "Password hashing executor counters.",
+    _stats_gauge(password_hashing.stats, ["in_flight", "completed", "failed", "cancelled", "rejected"])
+)
+metrics.register_collector(
+    "password_hashing_queue_wait_ms",
+    "Recent password hashing queue wait percentiles.",
+    lambda: {(("quantile", key),): value
+             for key, value in password_hashing.stats()["queue_wait_ms"].items()}
+)
+metrics.register_collector(
+    "price_analytics",
+    "Price analytics summary size, age and last compute cost.",
+    _stats_gauge(price_analytics.stats, ["rows", "groups", "age_seconds", "compute_ms"])
+)
+metrics.register_collector(
+    "change_feed",
+    "Change feed broadcaster state.",
+    _stats_gauge(change_feed.stats, ["subscribers", "version", "batches", "resyncs"])
+)
+metrics.register_collector(
+    "access_log_dropped",
+    "Access log records dropped because the writer fell behind.",
+    lambda: _DroppingQueueHandler.dropped
+)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def prometheus_metrics():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
@@ -1,51 +1,268 @@
-from fastapi import APIRouter, Depends
-from app.schemas.property_schema import PropertyCreate, PropertyResponse
-from app.services.property_service import property_service
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from app.schemas.property_schema import PropertyBulkDelete, PropertyBulkUpdate, PropertyCreate, PropertyResponse
+from app.services.property_service import EXPORT_COLUMNS, property_service
+from app.services.async_property_service import async_property_service
+from app.services.change_feed import change_feed
+from app.services.price_analytics import price_analytics
 from app.dependencies.auth_dependency import get_current_user
-from app.core.database import get_db
-from sqlalchemy.orm import Session
+from app.core import change_log
+from app.core.config import settings
+from app.core.database import run_db
+from app.dependencies.db_dependency import get_read_db_session, get_write_db_session, recent_writers
+from app.core.request_timing import TimedRoute
+from app.core.response_cache import response_cache
+from app.core.streaming import iter_csv_records, iter_ndjson_records, stream_export, stream_json_array
 
-router = APIRouter(prefix="/properties")
+router = APIRouter(prefix="/properties", route_class=TimedRoute)
 
 
 @router.post("/", response_model=PropertyResponse)
-def create_property(property: PropertyCreate, db=Depends(get_db), user=Depends(get_current_user)):
-    return property_service.create_property(db, property, user)
+async def create_property(property: PropertyCreate, db=Depends(get_write_db_session), user=Depends(get_current_user)):
+    return await async_property_service.create_property(db, property, user)
+
+
+@router.post("/bulk")
+async def bulk_import(
+    request: Request,
+    format: Literal["ndjson", "csv"] | None = None,
+    batch_size: int | None = Query(None, ge=1, le=10000),
+    user=Depends(get_current_user)
+):
+    # Body is read as a stream, format from ?format= or Content-Type
+    if format is None:
+        format = "csv" if "csv" in request.headers.get("content-type", "") else "ndjson"
+
+    if format == "csv":
+        records = iter_csv_records(request.stream())
+    else:
+        records = iter_ndjson_records(request.stream())
+
+    result = await property_service.bulk_import(records, user, batch_size)
+    recent_writers.note_write(user["id"])
+
+    return result
+
+
+@router.patch("/bulk")
+async def bulk_update(data: PropertyBulkUpdate, db=Depends(get_write_db_session), user=Depends(get_current_user)):
+    return await async_property_service.bulk_update(db, data, user)
+
+
+# Must be declared before DELETE /{property_id}
+@router.delete("/bulk")
+async def bulk_delete(data: PropertyBulkDelete, db=Depends(get_write_db_session), user=Depends(get_current_user)):
+    return await async_property_service.bulk_delete(db, data, user)
 
 
 @router.put("/{property_id}", response_model=PropertyResponse)
-def update_property(property_id: int, property: PropertyCreate, db=Depends(get_db), user=Depends(get_current_user)):
-    return property_service.update_property(db, property_id, property, user)
+async def update_property(property_id: int, property: PropertyCreate, db=Depends(get_write_db_session), user=Depends(get_current_user)):
+    return await async_property_service.update_property(db, property_id, property, user)
 
 
 @router.delete("/{property_id}")
-def delete_property(property_id: int, db=Depends(get_db), user=Depends(get_current_user)):
-    return property_service.delete_property(db, property_id, user)
+async def delete_property(property_id: int, db=Depends(get_write_db_session), user=Depends(get_current_user)):
+    return await async_property_service.delete_property(db, property_id, user)
 
 
 @router.get("/my-properties")
-def my_properties(db=Depends(get_db), user=Depends(get_current_user)):
-    return property_service.get_my_properties(db, user)
+async def my_properties(
+    request: Request,
+    after: str | None = None,
+    limit: int | None = Query(None, ge=1, le=settings.PAGE_SIZE_MAX),
+    stream: bool = False,
+    db=Depends(get_read_db_session),
+    user=Depends(get_current_user)
+):
+    if stream:
+        return stream_json_array(
+            lambda session: property_service.iter_properties(session, owner_id=user["id"]))
+
+    async def build():
+        # Paginated response only when asked for, plain list otherwise
+        if after is not None or limit is not None:
+            return await async_property_service.get_properties_page(db, after, limit, owner_id=user["id"])
+
+        return await async_property_service.get_my_properties(db, user)
+
+    return await response_cache.respond(request, build, owner_id=user["id"])
 
 
 @router.get("/search")
-def search_properties(
+async def search_properties(
+    request: Request,
+    location: str | None = None,
+    min_price: float | None = None,
+    max_price: float | None = None,
+    q: str | None = None,
+    status: str | None = Query(None, description="comma separated statuses"),
+    facets: str | None = Query(None, description="comma separated: status,location,price"),
+    facet_size: int | None = Query(None, ge=1, le=100),
+    price_buckets: str | None = Query(None, description="comma separated price bucket edges"),
+    sort: Literal["id", "price", "-price"] | None = None,
+    after: str | None = None,
+    limit: int | None = Query(None, ge=1, le=settings.PAGE_SIZE_MAX),
+    db=Depends(get_read_db_session)
+):
+    # Sorted keyset page when sort / after / limit is given,
+    # every match in relevance (or id) order otherwise
+    paged = sort is not None or after is not None or limit is not None
+
+    async def build():
+        # {"items", "facets"} only when facets are asked for
+        if facets is not None:
+            return await async_property_service.search_with_facets(
+                db, location, min_price, max_price, q, facets, facet_size, price_buckets,
+                paged, sort, after, limit, status)
+
+        if paged:
+            return await async_property_service.search_page(
+                db, location, min_price, max_price, q, sort, after, limit, status)
+
+        return await async_property_service.search_properties(
+            db, location, min_price, max_price, q, status)
+
+    return await response_cache.respond(request, build)
+
+
+@router.get("/nearby")
+async def nearby_properties(
+    request: Request,
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    radius_km: float = Query(..., gt=0, le=settings.GEO_MAX_RADIUS_KM),
+    min_price: float | None = None,
+    max_price: float | None = None,
+    status: str | None = Query(None, description="comma separated statuses"),
+    limit: int | None = Query(None, ge=1, le=settings.PAGE_SIZE_MAX),
+    db=Depends(get_read_db_session)
+):
+    return await response_cache.respond(
+        request,
+        lambda: async_property_service.nearby_properties(
+            db, lat, lon, radius_km, min_price, max_price, status, limit))
+
+
+@router.get("/within")
+async def properties_within(
+    request: Request,
+    bbox: str = Query(..., description="min_lon,min_lat,max_lon,max_lat"),
+    min_price: float | None = None,
+    max_price: float | None = None,
+    status: str | None = Query(None, description="comma separated statuses"),
+    limit: int | None = Query(None, ge=1, le=settings.PAGE_SIZE_MAX),
+    db=Depends(get_read_db_session)
+):
+    return await response_cache.respond(
+        request,
+        lambda: async_property_service.properties_within(
+            db, bbox, min_price, max_price, status, limit))
+
+
+@router.get("/export")
+def export_properties(
+    format: Literal["ndjson", "csv"] = "ndjson",
     location: str | None = None,
     min_price: float | None = None,
     max_price: float | None = None,
-    db: Session = Depends(get_db)
+    q: str | None = None,
+    status: str | None = Query(None, description="comma separated statuses"),
+    gzip: bool = False,
+    user=Depends(get_current_user)
+):
+    return stream_export(
+        lambda session: property_service.iter_search_results(
+            session, location, min_price, max_price, q, status),
+        EXPORT_COLUMNS,
+        format,
+        gzip=gzip,
+        filename="properties"
+    )
+
+
+@router.get("/locations/suggest")
+def suggest_locations(
+    prefix: str = "",
+    limit: int = Query(10, ge=1, le=50)
+):
+    return property_service.suggest_locations(prefix, limit)
+
+
+@router.get("/changes")
+async def property_changes(
+    since: int = Query(0, ge=0),
+    limit: int | None = Query(None, ge=1, le=settings.PAGE_SIZE_MAX),
+    db=Depends(get_read_db_session),
+    user=Depends(get_current_user)
 ):
-    return property_service.search_properties(db, location, min_price, max_price)
+    return await async_property_service.get_changes(db, since, limit)
+
+
+@router.get("/changes/stream")
+async def property_changes_stream(
+    request: Request,
+    since: int | None = Query(None, ge=0),
+    last_event_id: str | None = Header(None),
+    db=Depends(get_read_db_session),
+    user=Depends(get_current_user)
+):
+    # EventSource reconnects send the last seen version as Last-Event-ID
+    if since is None and last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+
+    if not await run_db(db, change_log.is_available):
+        raise HTTPException(status_code=503, detail="Change feed not installed, run migrations")
+
+    return StreamingResponse(
+        change_feed.stream(request, since),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/analytics/prices")
+async def price_analytics_report(location: str | None = None, status: str | None = None):
+    # Groups per (location, status) and per location with status "*"
+    return await price_analytics.report(location, status)
 
 
 @router.get("/stats")
-def stats(db=Depends(get_db)):
-    return property_service.property_stats(db)
+async def stats(request: Request, db=Depends(get_read_db_session)):
+    return await response_cache.respond(request, lambda: async_property_service.property_stats(db))
 
 
 @router.get("/")
-def get_all_properties(
-    db: Session = Depends(get_db),
+async def get_all_properties(
+    request: Request,
+    after: str | None = None,
+    limit: int | None = Query(None, ge=1, le=settings.PAGE_SIZE_MAX),
+    sort: Literal["id", "price", "-price"] | None = None,
+    stream: bool = False,
+    db=Depends(get_read_db_session),
+    user=Depends(get_current_user)
+):
+    if stream:
+        return stream_json_array(property_service.iter_properties)
+
+    async def build():
+        # Paginated response only when asked for, plain list otherwise
+        if after is not None or limit is not None or sort is not None:
+            return await async_property_service.get_properties_page(db, after, limit, sort=sort)
+
+        return await async_property_service.get_all_properties(db)
+
+    return await response_cache.respond(request, build)
+
+
+# Declared last: "/{property_id}" would otherwise shadow the static GET paths above
+@router.get("/{property_id}")
+async def get_property(
+    request: Request,
+    property_id: int,
+    db=Depends(get_read_db_session),
     user=Depends(get_current_user)
 ):
-    return property_service.get_all_properties(db)
+    return await response_cache.respond(
+        request, lambda: async_property_service.get_property(db, property_id))
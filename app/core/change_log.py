@@ -0,0 +1,91 @@
+"""
+Versioned change log of properties.
+
+`property_versions` holds one row per property id with the version of
+its last write and a `deleted` tombstone flag. Triggers stamp every
+insert, update and delete with max(version) + 1 in the same transaction,
+and SQLite commits one writer at a time, so versions are monotonically
+increasing in commit order. Clients pull "everything with version > N"
+to stay in sync (GET /properties/changes).
+"""
+
+from sqlalchemy import Boolean, Column, Integer, MetaData, Table, func, inspect, select, text
+
+from app.core.database import note_table_available, table_available
+
+
+VERSIONS_TABLE = "property_versions"
+
+# Own MetaData: created and back-filled by migrations only
+property_versions = Table(
+    VERSIONS_TABLE,
+    MetaData(),
+    Column("property_id", Integer, primary_key=True),
+    Column("version", Integer, nullable=False),
+    Column("deleted", Boolean, nullable=False),
+)
+
+_NEXT_VERSION = f"(SELECT coalesce(max(version), 0) + 1 FROM {VERSIONS_TABLE})"
+
+VERSIONS_DDL = [
+    f"""
+    CREATE TABLE IF NOT EXISTS {VERSIONS_TABLE} (
+        property_id INTEGER NOT NULL PRIMARY KEY,
+        version INTEGER NOT NULL,
+        deleted BOOLEAN NOT NULL DEFAULT 0
+    )
+    """,
+    f"CREATE UNIQUE INDEX IF NOT EXISTS ix_{VERSIONS_TABLE}_version ON {VERSIONS_TABLE} (version)",
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {VERSIONS_TABLE}_ai AFTER INSERT ON properties BEGIN
+        INSERT INTO {VERSIONS_TABLE}(property_id, version, deleted)
+        VALUES (new.id, {_NEXT_VERSION}, 0)
+        ON CONFLICT(property_id) DO UPDATE SET version = excluded.version, deleted = 0;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {VERSIONS_TABLE}_au AFTER UPDATE ON properties BEGIN
+        INSERT INTO {VERSIONS_TABLE}(property_id, version, deleted)
+        VALUES (new.id, {_NEXT_VERSION}, 0)
+        ON CONFLICT(property_id) DO UPDATE SET version = excluded.version, deleted = 0;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {VERSIONS_TABLE}_ad AFTER DELETE ON properties BEGIN
+        INSERT INTO {VERSIONS_TABLE}(property_id, version, deleted)
+        VALUES (old.id, {_NEXT_VERSION}, 1)
+        ON CONFLICT(property_id) DO UPDATE SET version = excluded.version, deleted = 1;
+    END
+    """,
+]
+
+def install_change_log(conn):
+    """
+    Create the versions table and triggers on `conn` if missing. A new
+    table is back-filled with one version per existing property, in id
+    order, so the first sync of a client picks up the whole catalogue.
+    """
+    if conn.dialect.name != "sqlite":
+        return False
+
+    created = not inspect(conn).has_table(VERSIONS_TABLE)
+
+    for ddl in VERSIONS_DDL:
+        conn.execute(text(ddl))
+
+    if created:
+        conn.execute(text(f"""
+            INSERT INTO {VERSIONS_TABLE}(property_id, version, deleted)
+            SELECT id, row_number() OVER (ORDER BY id), 0 FROM properties
+        """))
+
+    note_table_available(conn, VERSIONS_TABLE)
+    return True
+
+
+def is_available(db):
+    return table_available(db, VERSIONS_TABLE)
+
+
+def latest_version(db):
+    return db.scalar(select(func.coalesce(func.max(property_versions.c.version), 0)))
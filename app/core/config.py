@@ -5,8 +5,58 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite:///./property.db"
+    DB_ASYNC: bool = False
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_TIMEOUT: int = 30
+    SQLITE_PROFILE: str = "wal"
+    SQLITE_PRAGMAS: dict[str, str | int] = {}
+    DB_READ_ROUTING: bool = True
+    READ_DATABASE_URL: str | None = None
+    READ_YOUR_WRITES_SECONDS: float = 5.0
     SECRET_KEY: str = "secret"
     ALGORITHM: str = "HS256"
+    TOKEN_CACHE_SIZE: int = 10000
+    TOKEN_CACHE_TTL_SECONDS: int = 300
+
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST_KIB: int = 65536
+    ARGON2_PARALLELISM: int = 4
+    HASH_CONCURRENCY: int = 4
+    HASH_QUEUE_DEPTH: int = 32
+
+    ACCESS_LOG_SAMPLE_RATE: float = 1.0
+    ACCESS_LOG_FILE: str | None = None
+    ACCESS_LOG_QUEUE_SIZE: int = 10000
+
+    SLOW_QUERY_MS: float = 200
+    SLOW_QUERY_EXPLAIN: bool = True
+
+    PAGE_SIZE_DEFAULT: int = 50
+    PAGE_SIZE_MAX: int = 500
+    STREAM_CHUNK_SIZE: int = 1000
+
+    AUTO_MIGRATE: bool = True
+
+    RESPONSE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+
+    BULK_BATCH_SIZE: int = 1000
+    BULK_MAX_ERRORS: int = 1000
+
+    GEO_MAX_RADIUS_KM: float = 500
+    GEO_CANDIDATE_FACTOR: int = 4
+
+    FACET_SIZE_DEFAULT: int = 10
+    FACET_PRICE_BUCKETS: list[float] = [2_500_000, 5_000_000, 10_000_000, 20_000_000, 50_000_000]
+
+    PRICE_ANALYTICS_REFRESH_SECONDS: float = 30
+    PRICE_ANALYTICS_MAX_STALENESS_SECONDS: float = 300
+    PRICE_ANALYTICS_BINS: int = 20
+
+    CHANGE_FEED_POLL_SECONDS: float = 2.0
+    CHANGE_FEED_KEEPALIVE_SECONDS: float = 15.0
+    CHANGE_FEED_QUEUE_SIZE: int = 1000
 
 
 settings = Settings()
@@ -14,9 +64,61 @@ settings = Settings()
 # DATABASE_URL defines database connection string
 # SQLite is used here for simplicity and local development
 
+# DB_ASYNC serves routes through an async (aiosqlite) session instead of
+# sync sessions in the threadpool, so both paths can be benchmarked
+
 # SECRET_KEY is used to sign and encrypt JWT tokens
 
 # ALGORITHM defines encryption algorithm for JWT tokens
 
+# TOKEN_CACHE_* bound the cache of verified token payloads
+# (entries are also dropped at the token's own expiry; size 0 disables)
+
+# ARGON2_* are the password hash parameters (existing hashes made with
+# other parameters are upgraded on the next successful login)
+# HASH_CONCURRENCY hashes run at once, HASH_QUEUE_DEPTH more may wait,
+# beyond that login/register answer 503
+
+# ACCESS_LOG_SAMPLE_RATE is the fraction of requests written to the JSON
+# access log (5xx are always logged), to stdout or ACCESS_LOG_FILE,
+# through a queue of ACCESS_LOG_QUEUE_SIZE records (overflow is dropped).
+# Other app.* log records (startup report, slow queries, background
+# tasks) go through the same queue as JSON lines
+
+# SQL statements slower than SLOW_QUERY_MS (execute plus fetching the rows)
+# are logged with parameters and, if SLOW_QUERY_EXPLAIN, their SQLite
+# EXPLAIN QUERY PLAN
+
+# PAGE_SIZE_DEFAULT / PAGE_SIZE_MAX bound cursor-paginated list endpoints
+
+# STREAM_CHUNK_SIZE is how many rows are fetched from the DB cursor
+# (and written to the client) at a time by streaming endpoints
+
+# AUTO_MIGRATE applies pending schema migrations when the app starts
+# (set to false to run them only via `python -m app.manage migrate`)
+
+# RESPONSE_CACHE_MAX_BYTES is the memory budget of the read endpoint
+# response cache (0 disables storing, ETags are still sent)
+
+# BULK_BATCH_SIZE is how many rows /properties/bulk inserts per transaction
+# BULK_MAX_ERRORS caps the per-row error list returned by bulk endpoints
+
+# GEO_MAX_RADIUS_KM caps /properties/nearby. Geo searches read at most
+# GEO_CANDIDATE_FACTOR x limit rows, nearest first by a flat-earth
+# estimate, and re-rank them by exact distance
+
+# FACET_SIZE_DEFAULT is how many top locations /properties/search?facets=
+# returns, FACET_PRICE_BUCKETS the default price bucket edges
+
+# /properties/analytics/prices is recomputed in the background every
+# PRICE_ANALYTICS_REFRESH_SECONDS if properties changed (0 disables), and
+# never served older than PRICE_ANALYTICS_MAX_STALENESS_SECONDS;
+# histograms have PRICE_ANALYTICS_BINS log-spaced bins
+
+# The change feed broadcaster wakes on every write in this process and
+# polls every CHANGE_FEED_POLL_SECONDS for writes made by other processes.
+# SSE clients get a keepalive comment every CHANGE_FEED_KEEPALIVE_SECONDS;
+# one that falls CHANGE_FEED_QUEUE_SIZE batches behind re-reads the database
+
 
 # Creating a global settings object for reuse across project
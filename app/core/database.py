@@ -1,15 +1,239 @@
-from sqlalchemy import create_engine
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
-DATABASE_URL = "sqlite:///./property.db"
+from app.core.config import settings
+from app.core.request_timing import instrument_engine, timed_db_call
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False}
-)
+DATABASE_URL = settings.DATABASE_URL
+
+# Named SQLite tuning profiles, applied with PRAGMA on every new connection.
+#   default    → SQLite defaults, only waits on locks instead of failing
+#   wal        → readers no longer block on writers; fsync at checkpoints only
+#   durable    → WAL, but fsync on every commit
+#   throughput → WAL, no fsync (data survives crashes of the app, not of the OS)
+SQLITE_PROFILES = {
+    "default": {
+        "busy_timeout": 5000,
+    },
+    "wal": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64000,       # KiB → 64 MB page cache
+        "mmap_size": 268435456,     # 256 MB memory-mapped reads
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -64000,
+        "temp_store": "MEMORY",
+        "busy_timeout": 10000,
+    },
+    "throughput": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -262144,      # 256 MB
+        "mmap_size": 1073741824,    # 1 GB
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+}
+
+
+def sqlite_pragmas():
+    """
+    Pragmas of the configured profile, with SQLITE_PRAGMAS overrides.
+    """
+    if settings.SQLITE_PROFILE not in SQLITE_PROFILES:
+        raise ValueError(
+            f"Unknown SQLITE_PROFILE {settings.SQLITE_PROFILE!r}, "
+            f"expected one of {', '.join(SQLITE_PROFILES)}")
+
+    return {**SQLITE_PROFILES[settings.SQLITE_PROFILE], **settings.SQLITE_PRAGMAS}
+
+
+def _engine_options(url, is_async=False):
+    url = make_url(url)
+
+    if url.get_backend_name() != "sqlite":
+        return {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_pre_ping": True,
+        }
+
+    options = {"connect_args": {"check_same_thread": False}}
+
+    # In-memory databases live in a single connection, no pool to size.
+    # File databases get an explicit queue pool (aiosqlite defaults to none)
+    if url.database and url.database != ":memory:":
+        options.update(
+            poolclass=AsyncAdaptedQueuePool if is_async else QueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+
+    return options
+
+
+def _apply_pragmas_on_connect(sync_engine, read_only=False):
+    if sync_engine.dialect.name != "sqlite":
+        return
+
+    pragmas = sqlite_pragmas()
+
+    # journal_mode is a property of the database file, set by writers
+    if read_only:
+        pragmas.pop("journal_mode", None)
+
+    @event.listens_for(sync_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name} = {value}")
+        finally:
+            cursor.close()
+
+
+def create_db_engine(url=None, read_only=False):
+    """
+    Sync engine built from Settings: pool sizing plus SQLite pragma profile.
+    """
+    url = url or DATABASE_URL
+    db_engine = create_engine(url, **_engine_options(url))
+    _apply_pragmas_on_connect(db_engine, read_only)
+    instrument_engine(db_engine)
+    return db_engine
+
+
+def create_async_db_engine(url=None, read_only=False):
+    """
+    Async counterpart of create_db_engine (aiosqlite driver for SQLite).
+    """
+    url = make_url(url or DATABASE_URL)
+    if url.get_backend_name() == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+
+    db_engine = create_async_engine(url, **_engine_options(url, is_async=True))
+    _apply_pragmas_on_connect(db_engine.sync_engine, read_only)
+    instrument_engine(db_engine.sync_engine)
+    return db_engine
+
+
+def read_only_url(url):
+    """
+    URL for read-only connections: READ_DATABASE_URL (e.g. a replica) if
+    set, otherwise the primary SQLite file opened with mode=ro.
+    Returns None when reads should simply use the primary.
+    """
+    if settings.READ_DATABASE_URL:
+        return settings.READ_DATABASE_URL
+
+    url = make_url(url)
+    if url.get_backend_name() != "sqlite" or not url.database or url.database == ":memory:":
+        return None
+
+    if url.database.startswith("file:"):
+        return None
+
+    return url.set(
+        database=f"file:{url.database}",
+        query={**url.query, "mode": "ro", "uri": "true"}
+    ).render_as_string(hide_password=False)
+
+
+def engine_report(db_engine):
+    """
+    Effective pool settings and, for SQLite, the pragma values the
+    database actually reports (e.g. journal_mode can be refused).
+    """
+    pool = db_engine.pool
+    report = {
+        "url": db_engine.url.render_as_string(hide_password=True),
+        "pool": pool.__class__.__name__,
+    }
+
+    if hasattr(pool, "size"):
+        report["pool_size"] = pool.size()
+        report["max_overflow"] = getattr(pool, "_max_overflow", None)
+        report["pool_recycle"] = getattr(pool, "_recycle", None)
+
+    if db_engine.dialect.name == "sqlite":
+        with db_engine.connect() as conn:
+            report["profile"] = settings.SQLITE_PROFILE
+            report["pragmas"] = {
+                name: conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+                for name in sqlite_pragmas()
+            }
+
+    return report
+
+
+# (bind url, table) pairs known to exist. Only hits are cached: a table
+# created later (e.g. by `python -m app.manage migrate` while the app
+# runs with AUTO_MIGRATE=false) is picked up on the next check.
+_tables_present = set()
+
+
+def table_available(db, table):
+    """
+    True when the SQLite-only `table` (FTS, R*Tree, trigger-maintained
+    tables) exists in this session's database.
+    """
+    bind = db.get_bind()
+
+    if bind.dialect.name != "sqlite":
+        return False
+
+    key = (str(bind.url), table)
+    if key not in _tables_present and inspect(bind).has_table(table):
+        _tables_present.add(key)
+
+    return key in _tables_present
+
+
+def note_table_available(conn, table):
+    """
+    Record that `table` now exists, after creating it on `conn`.
+    """
+    _tables_present.add((str(conn.engine.url), table))
+
+
+engine = create_db_engine()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_db_engine()
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False)
+
+# Read-only connections for GET routes, so reads don't queue behind
+# writers for the primary's connections and locks
+READ_DATABASE_URL = read_only_url(DATABASE_URL) if settings.DB_READ_ROUTING else None
+
+if READ_DATABASE_URL:
+    read_engine = create_db_engine(READ_DATABASE_URL, read_only=True)
+    async_read_engine = create_async_db_engine(READ_DATABASE_URL, read_only=True)
+else:
+    read_engine = engine
+    async_read_engine = async_engine
+
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+AsyncReadSessionLocal = async_sessionmaker(
+    bind=async_read_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 
@@ -20,3 +244,31 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# ✅ Dependency to get async DB session
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Session dependency used by the routes: settings.DB_ASYNC switches
+# between the threadpool (sync) and the aiosqlite (async) path
+get_db_session = get_async_db if settings.DB_ASYNC else get_db
+
+
+async def run_db(db, fn, *args, **kwargs):
+    """
+    Run sync ORM code `fn(session, *args)` without blocking the event loop.
+
+    With an AsyncSession, SQLAlchemy runs it in a greenlet and awaits the
+    async driver for every round trip; with a sync Session it goes to
+    the threadpool. Either way the whole call counts as the request's DB
+    time, since rows are fetched inside `fn`.
+    """
+    fn = timed_db_call(fn)
+
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+
+    return await run_in_threadpool(fn, db, *args, **kwargs)
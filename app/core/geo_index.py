@@ -0,0 +1,145 @@
+"""
+SQLite R*Tree index over property coordinates.
+
+`properties_geo` holds one (degenerate) box per geocoded property and is
+kept in sync by triggers, like the FTS index. R*Tree coordinates are
+32-bit floats rounded outwards, so it is used for candidate selection
+only; distances are then refined exactly with haversine.
+"""
+
+import math
+
+from sqlalchemy import Column, Float, Integer, MetaData, Table, inspect, text
+
+from app.core.database import note_table_available, table_available
+
+
+GEO_TABLE = "properties_geo"
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Own MetaData: created and back-filled by migrations only
+properties_geo = Table(
+    GEO_TABLE,
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("min_lat", Float),
+    Column("max_lat", Float),
+    Column("min_lon", Float),
+    Column("max_lon", Float),
+)
+
+GEO_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {GEO_TABLE} USING rtree(
+        id, min_lat, max_lat, min_lon, max_lon
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {GEO_TABLE}_ai AFTER INSERT ON properties
+    WHEN new.latitude IS NOT NULL AND new.longitude IS NOT NULL BEGIN
+        INSERT INTO {GEO_TABLE}(id, min_lat, max_lat, min_lon, max_lon)
+        VALUES (new.id, new.latitude, new.latitude, new.longitude, new.longitude);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {GEO_TABLE}_ad AFTER DELETE ON properties BEGIN
+        DELETE FROM {GEO_TABLE} WHERE id = old.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {GEO_TABLE}_au AFTER UPDATE OF latitude, longitude ON properties BEGIN
+        DELETE FROM {GEO_TABLE} WHERE id = old.id;
+        INSERT INTO {GEO_TABLE}(id, min_lat, max_lat, min_lon, max_lon)
+        SELECT new.id, new.latitude, new.latitude, new.longitude, new.longitude
+        WHERE new.latitude IS NOT NULL AND new.longitude IS NOT NULL;
+    END
+    """,
+]
+
+def install_geo_index(conn):
+    """
+    Create the R*Tree and triggers on `conn` if missing, back-filling it
+    from already geocoded rows. Returns False when the database can't
+    host the index (not SQLite, or built without R*Tree).
+    """
+    if conn.dialect.name != "sqlite":
+        return False
+
+    inspector = inspect(conn)
+    if not inspector.has_table("properties"):
+        return False
+
+    if not conn.execute(text("SELECT sqlite_compileoption_used('ENABLE_RTREE')")).scalar():
+        return False
+
+    created = not inspector.has_table(GEO_TABLE)
+
+    for ddl in GEO_DDL:
+        conn.execute(text(ddl))
+
+    if created:
+        conn.execute(text(f"""
+            INSERT INTO {GEO_TABLE}(id, min_lat, max_lat, min_lon, max_lon)
+            SELECT id, latitude, latitude, longitude, longitude FROM properties
+            WHERE latitude IS NOT NULL AND longitude IS NOT NULL
+        """))
+
+    note_table_available(conn, GEO_TABLE)
+    return True
+
+
+def is_available(db):
+    """
+    True when the R*Tree can be used for this session's database.
+    """
+    return table_available(db, GEO_TABLE)
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """
+    Great-circle distance in km between two points given in degrees.
+    """
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (math.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def radius_bbox(lat, lon, radius_km):
+    """
+    Smallest (min_lat, min_lon, max_lat, max_lon) box containing the circle.
+    Longitude spans the whole globe near the poles or across the antimeridian.
+    """
+    delta_lat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    min_lat, max_lat = lat - delta_lat, lat + delta_lat
+
+    if min_lat <= -90 or max_lat >= 90:
+        return max(min_lat, -90.0), -180.0, min(max_lat, 90.0), 180.0
+
+    delta_lon = math.degrees(math.asin(
+        min(1.0, math.sin(radius_km / EARTH_RADIUS_KM) / math.cos(math.radians(lat)))))
+    min_lon, max_lon = lon - delta_lon, lon + delta_lon
+
+    if min_lon < -180 or max_lon > 180:
+        return min_lat, -180.0, max_lat, 180.0
+
+    return min_lat, min_lon, max_lat, max_lon
+
+
+def parse_bbox(value: str):
+    """
+    Parse `min_lon,min_lat,max_lon,max_lat` (GeoJSON order).
+    Returns (min_lat, min_lon, max_lat, max_lon) or raises ValueError.
+    """
+    parts = [float(part) for part in value.split(",")]
+
+    if len(parts) != 4:
+        raise ValueError("bbox needs 4 numbers: min_lon,min_lat,max_lon,max_lat")
+
+    min_lon, min_lat, max_lon, max_lat = parts
+
+    if not (-90 <= min_lat <= max_lat <= 90 and -180 <= min_lon <= max_lon <= 180):
+        raise ValueError("bbox out of range or min > max")
+
+    return min_lat, min_lon, max_lat, max_lon
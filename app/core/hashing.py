@@ -0,0 +1,123 @@
+"""
+Dedicated, admission-controlled executor for password hashing.
+
+argon2 is deliberately slow and memory hungry. Running it inline would
+let a login burst occupy the shared threadpool that also serves property
+reads, so hashes run on their own small pool instead. At most
+HASH_CONCURRENCY hashes run and HASH_QUEUE_DEPTH wait; anything beyond
+that fails fast with 503 rather than queueing without bound.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.security import hash_password, password_needs_rehash, verify_dummy_password, verify_password
+
+
+class HashingExecutor:
+
+    def __init__(self, concurrency, queue_depth):
+        self.concurrency = concurrency
+        self.queue_depth = queue_depth
+        # argon2-cffi releases the GIL, so threads hash in parallel
+        self._executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waits = deque(maxlen=1000)   # recent queue waits, seconds
+        self.completed = 0
+        self.failed = 0         # raised an exception
+        self.cancelled = 0      # caller went away before the result
+        self.rejected = 0
+
+    async def hash(self, password: str):
+        return await self._submit(hash_password, password)
+
+    async def verify(self, password: str, hashed_password: str):
+        """
+        Returns (matches, needs_rehash).
+        """
+        return await self._submit(self._verify, password, hashed_password)
+
+    async def verify_dummy(self, password: str):
+        """
+        Same cost as verify(), against no account; always (False, False).
+        """
+        matches = await self._submit(verify_dummy_password, password)
+        return matches, False
+
+    @staticmethod
+    def _verify(password, hashed_password):
+        matches = verify_password(password, hashed_password)
+        return matches, matches and password_needs_rehash(hashed_password)
+
+    async def _submit(self, fn, *args):
+        with self._lock:
+            if self._in_flight >= self.concurrency + self.queue_depth:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Authentication is busy, retry shortly",
+                    headers={"Retry-After": "1"}
+                )
+            self._in_flight += 1
+
+        submitted = time.perf_counter()
+
+        def run():
+            self._waits.append(time.perf_counter() - submitted)
+            return fn(*args)
+
+        cancelled = failed = False
+        try:
+            return await asyncio.wrap_future(self._executor.submit(run))
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                if cancelled:
+                    self.cancelled += 1
+                elif failed:
+                    self.failed += 1
+                else:
+                    self.completed += 1
+
+    def stats(self):
+        waits = sorted(self._waits)
+
+        def percentile(p):
+            if not waits:
+                return 0.0
+            return round(waits[min(len(waits) - 1, int(p * len(waits)))] * 1000, 3)
+
+        return {
+            "concurrency": self.concurrency,
+            "queue_depth": self.queue_depth,
+            "in_flight": self._in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "rejected": self.rejected,
+            "queue_wait_ms": {
+                "p50": percentile(0.50),
+                "p95": percentile(0.95),
+                "max": round(waits[-1] * 1000, 3) if waits else 0.0,
+            },
+        }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hashing = HashingExecutor(settings.HASH_CONCURRENCY, settings.HASH_QUEUE_DEPTH)
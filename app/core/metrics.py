@@ -0,0 +1,106 @@
+"""
+In-process request metrics rendered in Prometheus text format.
+
+Routes are labelled by their template (/properties/{property_id}), never
+the raw URL, so label cardinality stays bounded.
+"""
+
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Metrics:
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._requests = defaultdict(int)      # (method, route, status) -> count
+        self._latency = {}                     # (method, route) -> [bucket counts..., sum, count]
+        self._in_flight = 0
+        self._collectors = []
+
+    def request_started(self):
+        with self._lock:
+            self._in_flight += 1
+
+    def request_finished(self, method, route, status_code, seconds):
+        with self._lock:
+            self._in_flight -= 1
+            self._requests[(method, route, status_code)] += 1
+
+            series = self._latency.get((method, route))
+            if series is None:
+                series = self._latency[(method, route)] = [0] * (len(self.buckets) + 2)
+
+            # Non-cumulative here, summed up when rendering
+            index = bisect_left(self.buckets, seconds)
+            if index < len(self.buckets):
+                series[index] += 1
+            series[-2] += seconds
+            series[-1] += 1
+
+    def register_collector(self, name, help_text, collect):
+        """
+        Expose an extra gauge: `collect()` returns a plain number, or
+        {((label, value), ...): number} for labelled series.
+        """
+        self._collectors.append((name, help_text, collect))
+
+    def render(self):
+        lines = []
+
+        with self._lock:
+            requests = dict(self._requests)
+            latency = {key: list(series) for key, series in self._latency.items()}
+            in_flight = self._in_flight
+
+        lines += [
+            "# HELP http_requests_total HTTP requests by method, route template and status.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route, status_code), count in sorted(requests.items()):
+            lines.append(
+                f'http_requests_total{{method="{method}",route="{_escape(route)}",status="{status_code}"}} {count}')
+
+        lines += [
+            "# HELP http_request_duration_seconds Time to response start by method and route template.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, route), series in sorted(latency.items()):
+            labels = f'method="{method}",route="{_escape(route)}"'
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {series[-1]}')
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {series[-2]:.6f}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {series[-1]}")
+
+        lines += [
+            "# HELP http_requests_in_flight Requests currently being processed.",
+            "# TYPE http_requests_in_flight gauge",
+            f"http_requests_in_flight {in_flight}",
+        ]
+
+        for name, help_text, collect in self._collectors:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+            values = collect()
+
+            if isinstance(values, dict):
+                for labels, value in values.items():
+                    label_text = ",".join(f'{key}="{_escape(val)}"' for key, val in labels)
+                    lines.append(f"{name}{{{label_text}}} {value}")
+            else:
+                lines.append(f"{name} {values}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+metrics = Metrics()
@@ -1,20 +1,143 @@
+import json
+import logging
+import queue
+import random
+import sys
 import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
 from fastapi import Request
 
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.request_timing import RequestTiming, current_timing
+
+access_logger = logging.getLogger("app.access")
+access_logger.propagate = False
+
+# Parent of the app's other loggers (app.main, app.sql.slow, ...)
+app_logger = logging.getLogger("app")
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """
+    Hands records to the background writer as they are: no formatting on
+    the event loop, and records are dropped (and counted) when the
+    writer falls behind instead of blocking requests.
+    """
+
+    dropped = 0
+
+    def prepare(self, record):
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _DroppingQueueHandler.dropped += 1
+
+
+class _JsonFormatter(logging.Formatter):
+
+    def format(self, record):
+        # Access records are already a dict; other app records get the basics
+        if isinstance(record.msg, dict):
+            return json.dumps(record.msg)
+
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(entry)
+
+
+_listener = None
+
+
+def start_access_log():
+    """
+    Route access records, and the records of every other `app.*` logger,
+    through a bounded queue to a background writer thread.
+    """
+    global _listener
+
+    if _listener is not None:
+        return
+
+    records = queue.Queue(maxsize=settings.ACCESS_LOG_QUEUE_SIZE)
+
+    if settings.ACCESS_LOG_FILE:
+        handler = logging.FileHandler(settings.ACCESS_LOG_FILE)
+    else:
+        handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(_JsonFormatter())
+
+    access_logger.handlers = [_DroppingQueueHandler(records)]
+    access_logger.setLevel(logging.INFO)
+
+    app_logger.handlers = [_DroppingQueueHandler(records)]
+    app_logger.setLevel(logging.INFO)
+
+    _listener = QueueListener(records, handler)
+    _listener.start()
+
+
+def stop_access_log():
+    """
+    Flush queued records and stop the writer thread.
+    """
+    global _listener
+
+    if _listener is not None:
+        access_logger.handlers = []
+        app_logger.handlers = []
+        _listener.stop()
+        _listener = None
+
 
 async def logging_middleware(request: Request, call_next):
-    start_time = time.time()
+    start_time = time.perf_counter()
+    metrics.request_started()
+
+    timing = RequestTiming()
+    token = current_timing.set(timing)
+
+    status_code = 500
+    try:
+        # Process request
+        response = await call_next(request)
+        status_code = response.status_code
+        response.headers["Server-Timing"] = timing.server_timing_header()
+        return response
+    finally:
+        current_timing.reset(token)
 
-    # Process request
-    response = await call_next(request)
+        # Time taken until the response starts
+        process_time = time.perf_counter() - start_time
 
-    # Calculate time taken
-    process_time = time.time() - start_time
+        # Route template, set on the scope by the router once matched
+        route = request.scope.get("route")
+        route_path = getattr(route, "path", "<unmatched>")
 
-    print(
-        f"{request.method} {request.url} "
-        f"Status: {response.status_code} "
-        f"Completed in {process_time:.4f}s"
-    )
+        metrics.request_finished(request.method, route_path, status_code, process_time)
 
-    return response
+        # Errors are always logged, the rest sampled under load
+        if status_code >= 500 or random.random() < settings.ACCESS_LOG_SAMPLE_RATE:
+            access_logger.info({
+                "ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+                "method": request.method,
+                "route": route_path,
+                "path": request.url.path,
+                "status": status_code,
+                "duration_ms": round(process_time * 1000, 3),
+                "db_ms": round(timing.db_seconds * 1000, 3),
+                "db_statements": timing.statements,
+                "client": request.client.host if request.client else None,
+            })
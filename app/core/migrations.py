@@ -0,0 +1,173 @@
+"""
+Versioned schema bootstrap / migrations.
+
+Each migration is applied once, in order, and recorded in the
+`schema_migrations` table. Steps must be idempotent (IF NOT EXISTS) so a
+database created by an older build, such as the shipped property.db,
+upgrades to the same schema and indexes as a fresh one.
+
+Usage:
+    python -m app.manage migrate
+    python -m app.manage db-status
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, inspect, select, text
+
+from app.core.database import Base
+from app.core.change_log import VERSIONS_TABLE, install_change_log
+from app.core.geo_index import GEO_TABLE, install_geo_index
+from app.core.search_index import install_search_index
+from app.core.status_counts import COUNTS_TABLE, install_status_counts
+
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("name", String),
+    Column("applied_at", DateTime),
+)
+
+
+def _create_schema(conn):
+    # Import models so they are registered on Base.metadata
+    from app.models import property_model, user_model  # noqa: F401
+
+    Base.metadata.create_all(bind=conn, checkfirst=True)
+
+
+def _property_indexes(conn):
+    # /my-properties → owner_id filter, keyset ordered by id
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_properties_owner_id_id ON properties (owner_id, id)"))
+    # /stats → group by status
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_properties_status ON properties (status)"))
+    # location + price range search
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_properties_location_price ON properties (location, price)"))
+
+
+def _search_index(conn):
+    install_search_index(conn)
+
+
+def _status_counts(conn):
+    install_status_counts(conn)
+
+
+def _coordinates(conn):
+    # Fresh databases already got the columns from create_all
+    columns = {column["name"] for column in inspect(conn).get_columns("properties")}
+    for column in ("latitude", "longitude"):
+        if column not in columns:
+            conn.execute(text(f"ALTER TABLE properties ADD COLUMN {column} FLOAT"))
+
+    install_geo_index(conn)
+
+
+def _price_sort_index(conn):
+    # sort=price / -price → ORDER BY price, id LIMIT n walks this index
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_properties_price_id ON properties (price, id)"))
+
+
+def _change_log(conn):
+    install_change_log(conn)
+
+
+# (version, name, step) — append only, never renumber
+MIGRATIONS = [
+    (1, "create base schema", _create_schema),
+    (2, "property access path indexes", _property_indexes),
+    (3, "full-text search index", _search_index),
+    (4, "property status counters", _status_counts),
+    (5, "property coordinates and R*Tree", _coordinates),
+    (6, "price sort index", _price_sort_index),
+    (7, "property change log", _change_log),
+]
+
+
+def current_version(conn):
+    if not inspect(conn).has_table(schema_migrations.name):
+        return 0
+
+    version = conn.execute(
+        select(schema_migrations.c.version).order_by(schema_migrations.c.version.desc())
+    ).scalar()
+
+    return version or 0
+
+
+def _lock_for_write(conn):
+    """
+    Start the transaction with SQLite's write lock (BEGIN IMMEDIATE)
+    instead of on its first write. Other writers wait up to busy_timeout.
+    """
+    if conn.dialect.name == "sqlite":
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+def run_migrations(engine, analyze=True):
+    """
+    Apply every pending migration, each in its own transaction.
+    Returns the list of applied (version, name).
+    """
+    with engine.begin() as conn:
+        _lock_for_write(conn)
+        schema_migrations.create(conn, checkfirst=True)
+
+    applied = []
+
+    for version, name, step in MIGRATIONS:
+        with engine.begin() as conn:
+            # Version is checked under the write lock, so when several
+            # workers start together one applies the step, the rest skip it
+            _lock_for_write(conn)
+
+            if current_version(conn) >= version:
+                continue
+
+            step(conn)
+
+            conn.execute(schema_migrations.insert().values(
+                version=version, name=name, applied_at=datetime.utcnow()))
+
+        applied.append((version, name))
+
+    if analyze and applied:
+        analyze_database(engine)
+
+    return applied
+
+
+def analyze_database(engine):
+    """
+    Refresh planner statistics so new indexes actually get picked.
+    """
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+
+
+def schema_report(engine):
+    """
+    Current schema version, pending migrations and indexes per table.
+    """
+    inspector = inspect(engine)
+
+    with engine.connect() as conn:
+        version = current_version(conn)
+
+    return {
+        "version": version,
+        "latest": MIGRATIONS[-1][0],
+        "pending": [name for v, name, _ in MIGRATIONS if v > version],
+        "indexes": {
+            table: sorted(index["name"] for index in inspector.get_indexes(table))
+            for table in inspector.get_table_names()
+            if table not in (schema_migrations.name, COUNTS_TABLE, VERSIONS_TABLE)
+            and not table.startswith(("properties_fts", GEO_TABLE))
+        },
+    }
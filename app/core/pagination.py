@@ -0,0 +1,43 @@
+"""
+Opaque cursor helpers for keyset pagination.
+
+A cursor is the URL-safe base64 of a small JSON object holding the sort
+key of the last row a client has seen, e.g. {"id": 42}. Clients must
+treat it as opaque and just send it back as `after`.
+"""
+
+import base64
+import binascii
+import json
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+
+
+def encode_cursor(values: dict) -> str:
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        values = None
+
+    if not isinstance(values, dict):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return values
+
+
+def page_size(limit: int | None) -> int:
+    """
+    Resolve the requested page size against the configured bounds.
+    """
+    if limit is None:
+        return settings.PAGE_SIZE_DEFAULT
+
+    return max(1, min(limit, settings.PAGE_SIZE_MAX))
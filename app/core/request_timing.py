@@ -0,0 +1,227 @@
+"""
+Per-request timing: DB time (via run_db spans and SQLAlchemy engine
+events), serialization time (ResponseCache and TimedRoute) and the
+slow-query log.
+
+The middleware puts a RequestTiming in a contextvar; engine events and
+the route wrapper add to it from whichever thread or task runs the work.
+
+cursor.execute() returns before SQLite has produced most rows, so the
+execute events alone miss the fetch. Work run through run_db is timed
+as a whole instead (execute, fetch and building the result), and a
+statement's slow-query time runs until the next statement or the end
+of that call.
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from contextvars import ContextVar
+
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+
+from app.core.config import settings
+
+slow_query_logger = logging.getLogger("app.sql.slow")
+
+# Longest parameter repr written to the slow-query log
+MAX_LOGGED_PARAMS = 500
+
+
+class RequestTiming:
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.db_seconds = 0.0
+        self.statements = 0
+        self.encode_seconds = None      # body encoding inside the endpoint
+        self.endpoint_done = None
+        self.handler_done = None
+
+    @property
+    def serialize_seconds(self):
+        if self.endpoint_done is None or self.handler_done is None:
+            return self.encode_seconds
+        return (self.encode_seconds or 0.0) + self.handler_done - self.endpoint_done
+
+    def server_timing_header(self):
+        total = time.perf_counter() - self.started
+        parts = [f'db;dur={self.db_seconds * 1000:.2f};desc="{self.statements} queries"']
+
+        if self.serialize_seconds is not None:
+            parts.append(f"serialize;dur={self.serialize_seconds * 1000:.2f}")
+
+        parts.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(parts)
+
+
+current_timing: ContextVar[RequestTiming | None] = ContextVar("current_timing", default=None)
+
+
+class _DbSpan:
+    """
+    One timed run_db call and the statements it ran, in order.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.statements = []    # [started, conn, statement, parameters, executemany, logged]
+
+
+_current_span: ContextVar[_DbSpan | None] = ContextVar("_current_span", default=None)
+
+
+def timed_db_call(fn):
+    """
+    Wrap `fn(session, ...)` so its whole run, row fetching included,
+    counts as the request's DB time.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if _current_span.get() is not None:
+            return fn(*args, **kwargs)
+
+        span = _DbSpan()
+        token = _current_span.set(span)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _current_span.reset(token)
+            _close_span(span)
+
+    return wrapper
+
+
+def _close_span(span):
+    ended = time.perf_counter()
+
+    timing = current_timing.get()
+    if timing is not None:
+        timing.db_seconds += ended - span.started
+
+    # A statement's rows are fetched until the next statement starts
+    ends = [entry[0] for entry in span.statements[1:]] + [ended]
+    for (started, conn, statement, parameters, executemany, logged), end in zip(span.statements, ends):
+        if not logged and (end - started) * 1000 >= settings.SLOW_QUERY_MS:
+            _log_slow_query(conn, statement, parameters, end - started, executemany)
+
+
+def instrument_engine(sync_engine):
+    """
+    Count statements and DB time per request, and log slow statements
+    (with their query plan on SQLite).
+    """
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = time.perf_counter()
+        conn.info.setdefault("query_started", []).append(started)
+
+        span = _current_span.get()
+        if span is not None:
+            span.statements.append([started, conn, statement, parameters, executemany, False])
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        span = _current_span.get()
+
+        timing = current_timing.get()
+        if timing is not None:
+            timing.statements += 1
+            # Inside a run_db call the span accounts for the time instead
+            if span is None:
+                timing.db_seconds += elapsed
+
+        if elapsed * 1000 >= settings.SLOW_QUERY_MS:
+            _log_slow_query(conn, statement, parameters, elapsed, executemany)
+            if span is not None:
+                span.statements[-1][-1] = True
+
+
+def record_encode(seconds):
+    """
+    Add time spent encoding a response body inside the endpoint.
+    """
+    timing = current_timing.get()
+    if timing is not None:
+        timing.encode_seconds = (timing.encode_seconds or 0.0) + seconds
+
+
+def _log_slow_query(conn, statement, parameters, elapsed, executemany):
+    plan = None
+
+    if (settings.SLOW_QUERY_EXPLAIN and not executemany
+            and conn.dialect.name == "sqlite"
+            and statement.lstrip().upper().startswith(("SELECT", "WITH"))):
+        try:
+            cursor = conn.connection.dbapi_connection.cursor()
+            try:
+                cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+                plan = [row[-1] for row in cursor.fetchall()]
+            finally:
+                cursor.close()
+        except Exception as e:  # never fail the request because of logging
+            plan = [f"EXPLAIN failed: {e}"]
+
+    slow_query_logger.warning(
+        "Slow query (%.1f ms): %s | params=%s | plan=%s",
+        elapsed * 1000, " ".join(statement.split()), _params_summary(parameters, executemany), plan
+    )
+
+
+def _params_summary(parameters, executemany):
+    # executemany batches can carry thousands of rows; log the size + a prefix
+    if executemany:
+        text = f"{len(parameters)} rows, first={parameters[0]!r}" if parameters else "0 rows"
+    else:
+        text = repr(parameters)
+
+    if len(text) > MAX_LOGGED_PARAMS:
+        text = text[:MAX_LOGGED_PARAMS] + "..."
+    return text
+
+
+class TimedRoute(APIRoute):
+    """
+    Route class recording when the endpoint returned and when the
+    response was built, so Server-Timing can report serialization.
+    """
+
+    def get_route_handler(self):
+        call = self.dependant.call
+
+        if not getattr(call, "_timed", False):
+            if asyncio.iscoroutinefunction(call):
+                async def timed_call(*args, **kwargs):
+                    try:
+                        return await call(*args, **kwargs)
+                    finally:
+                        _mark("endpoint_done")
+            else:
+                def timed_call(*args, **kwargs):
+                    try:
+                        return call(*args, **kwargs)
+                    finally:
+                        _mark("endpoint_done")
+
+            timed_call._timed = True
+            self.dependant.call = timed_call
+
+        handler = super().get_route_handler()
+
+        async def timed_handler(request):
+            response = await handler(request)
+            _mark("handler_done")
+            return response
+
+        return timed_handler
+
+
+def _mark(attribute):
+    timing = current_timing.get()
+    if timing is not None:
+        setattr(timing, attribute, time.perf_counter())
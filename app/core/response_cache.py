@@ -0,0 +1,168 @@
+"""
+In-process HTTP response cache for read endpoints.
+
+Responses are cached by route + query string (+ owner for per-user
+routes) together with a generation counter. PropertyService bumps the
+table generation, and the owner's generation, on every write, so stale
+entries are never served again and simply age out of the LRU.
+
+Every cached response carries a strong ETag (hash of the body), and a
+matching If-None-Match is answered with 304 Not Modified.
+
+Generations live in process memory: with several workers, each worker
+only sees the writes it handled itself.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+import orjson
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from app.core.config import settings
+from app.core.request_timing import record_encode
+
+
+class CacheGenerations:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._table = 0
+        self._owners = defaultdict(int)
+        self._listeners = []
+
+    def bump(self, owner_ids=()):
+        """
+        Called after a committed write touching properties of `owner_ids`.
+        """
+        with self._lock:
+            self._table += 1
+            for owner_id in owner_ids:
+                self._owners[owner_id] += 1
+
+        for listener in self._listeners:
+            listener()
+
+    def add_listener(self, callback):
+        """
+        Call `callback()` after every bump, e.g. to wake the change feed.
+        Runs on the writer's thread, so it must be cheap and thread-safe.
+        """
+        self._listeners.append(callback)
+
+    def table(self):
+        return self._table
+
+    def owner(self, owner_id):
+        return self._owners.get(owner_id, 0)
+
+
+class ResponseCache:
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()   # key -> (etag, body)
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    async def respond(self, request: Request, build, owner_id=None):
+        """
+        Return the cached response for this request, or await `build()`.
+        `owner_id` scopes the entry to one user's data (and generation).
+        """
+        if owner_id is None:
+            generation = cache_generations.table()
+        else:
+            generation = cache_generations.owner(owner_id)
+
+        key = (
+            request.url.path,
+            tuple(sorted(request.query_params.multi_items())),
+            owner_id,
+            generation,
+        )
+
+        entry = self._get(key)
+
+        if entry is None:
+            data = await build()
+
+            # Plain dicts / lists encode natively; anything else via jsonable_encoder
+            started = time.perf_counter()
+            body = orjson.dumps(data, default=jsonable_encoder, option=orjson.OPT_NON_STR_KEYS)
+            record_encode(time.perf_counter() - started)
+            entry = ('"' + hashlib.sha256(body).hexdigest()[:32] + '"', body)
+            self._put(key, entry)
+
+        etag, body = entry
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+
+        return Response(body, media_type="application/json", headers=headers)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "not_modified": self.not_modified,
+            }
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def _put(self, key, entry):
+        size = len(entry[1])
+
+        # Don't let one huge response flush the whole cache
+        if size > self.max_bytes // 4:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                return
+
+            self._entries[key] = entry
+            self._size += size
+
+            while self._size > self.max_bytes:
+                _, (_, body) = self._entries.popitem(last=False)
+                self._size -= len(body)
+
+
+def _etag_matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    # If-None-Match uses weak comparison: ignore W/ prefixes
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
+cache_generations = CacheGenerations()
+response_cache = ResponseCache(settings.RESPONSE_CACHE_MAX_BYTES)
@@ -0,0 +1,133 @@
+"""
+SQLite FTS5 full-text index over property title and location.
+
+`properties_fts` is an external-content FTS5 table: it stores only the
+index, reads the text from `properties`, and is kept in sync by triggers
+so every write path (ORM or Core, single or bulk) updates it in the same
+transaction.
+"""
+
+import re
+
+from sqlalchemy import Column, Float, Integer, MetaData, String, Table, inspect, text
+
+from app.core.database import note_table_available, table_available
+
+
+FTS_TABLE = "properties_fts"
+
+# Lightweight table definition for building queries.
+# Lives in its own MetaData so Base.metadata.create_all never touches it.
+properties_fts = Table(
+    FTS_TABLE,
+    MetaData(),
+    Column("rowid", Integer),
+    Column("title", String),
+    Column("location", String),
+    Column("rank", Float),
+)
+
+FTS_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, location,
+        content='properties', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS properties_fts_ai AFTER INSERT ON properties BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, location)
+        VALUES (new.id, new.title, new.location);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS properties_fts_ad AFTER DELETE ON properties BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, location)
+        VALUES ('delete', old.id, old.title, old.location);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS properties_fts_au AFTER UPDATE OF title, location ON properties BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, location)
+        VALUES ('delete', old.id, old.title, old.location);
+        INSERT INTO {FTS_TABLE}(rowid, title, location)
+        VALUES (new.id, new.title, new.location);
+    END
+    """,
+]
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+def install_search_index(conn):
+    """
+    Create the FTS table and triggers on `conn` if missing.
+    A freshly created index is populated from the existing rows.
+    Returns False when the database can't host the index.
+    """
+    if conn.dialect.name != "sqlite":
+        return False
+
+    inspector = inspect(conn)
+    if not inspector.has_table("properties"):
+        return False
+
+    created = not inspector.has_table(FTS_TABLE)
+
+    for ddl in FTS_DDL:
+        conn.execute(text(ddl))
+
+    if created:
+        conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+
+    note_table_available(conn, FTS_TABLE)
+    return True
+
+
+def ensure_search_index(engine):
+    with engine.begin() as conn:
+        return install_search_index(conn)
+
+
+def rebuild_search_index(engine):
+    """
+    Recreate the index from scratch, e.g. after rows were changed with
+    the triggers missing. Returns the number of indexed rows.
+    """
+    if not ensure_search_index(engine):
+        return 0
+
+    with engine.begin() as conn:
+        conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+        return conn.execute(text("SELECT count(*) FROM properties")).scalar()
+
+
+def is_available(db):
+    """
+    True when full-text search can be used for this session's database.
+    """
+    return table_available(db, FTS_TABLE)
+
+
+def has_terms(text: str | None):
+    """
+    True when `text` has at least one word FTS can match.
+    """
+    return bool(_TOKEN_RE.search(text or ""))
+
+
+def match_expression(q: str | None = None, location: str | None = None):
+    """
+    Build an FTS5 MATCH expression from free text.
+
+    Every word becomes a quoted prefix term, so user input can never
+    inject FTS syntax. `location` terms are restricted to the location
+    column. Returns None when there is nothing to match.
+    """
+    terms = [f'"{token}"*' for token in _TOKEN_RE.findall(q or "")]
+    terms += [f'location : "{token}"*' for token in _TOKEN_RE.findall(location or "")]
+
+    if not terms:
+        return None
+
+    return " AND ".join(terms)
@@ -1,20 +1,75 @@
 from datetime import datetime, timedelta
 from jose import jwt, JWTError
 from fastapi import HTTPException, status
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 import hashlib
+import hmac
+import secrets
+
+from app.core.config import settings
+from app.core.token_cache import token_cache
 
 SECRET_KEY = "secret123"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
+# Memory-hard password hashing (argon2id)
+password_hasher = PasswordHasher(
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_COST_KIB,
+    parallelism=settings.ARGON2_PARALLELISM,
+)
+
+
+def _is_legacy_hash(hashed_password: str):
+    # Old accounts store a bare sha256 hex digest
+    return not hashed_password.startswith("$argon2")
 
-# ✅ SIMPLE HASH FUNCTION (NO BCRYPT / NO PASSLIB)
+
+# ✅ HASH FUNCTION (ARGON2ID)
 def hash_password(password: str):
-    return hashlib.sha256(password.encode()).hexdigest()
+    return password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str):
-    return hash_password(plain_password) == hashed_password
+    if not hashed_password:
+        return False
+
+    if _is_legacy_hash(hashed_password):
+        legacy = hashlib.sha256(plain_password.encode()).hexdigest()
+        return hmac.compare_digest(legacy, hashed_password)
+
+    try:
+        return password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+# argon2 hash (current parameters) of a random password, made on first use
+_dummy_hash = None
+
+
+def verify_dummy_password(plain_password: str):
+    """
+    Run a full argon2 verify that always fails, for logins with an unknown
+    email, so they cost as much as a wrong password for a known one and
+    timing doesn't reveal which emails are registered.
+    """
+    global _dummy_hash
+
+    if _dummy_hash is None:
+        _dummy_hash = password_hasher.hash(secrets.token_urlsafe(16))
+
+    verify_password(plain_password, _dummy_hash)
+    return False
+
+
+def password_needs_rehash(hashed_password: str):
+    """
+    True for legacy sha256 hashes and argon2 hashes made with older parameters.
+    """
+    return _is_legacy_hash(hashed_password) or password_hasher.check_needs_rehash(hashed_password)
 
 
 # ✅ CREATE TOKEN
@@ -37,3 +92,12 @@ def decode_access_token(token: str):
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token"
         )
+
+
+# ✅ DECODE TOKEN (CACHED)
+def decode_access_token_cached(token: str):
+    """
+    Same as decode_access_token, but reuses the verified payload of a
+    token seen before (until its exp or the cache TTL).
+    """
+    return token_cache.get_or_verify(token, decode_access_token)
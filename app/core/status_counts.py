@@ -0,0 +1,137 @@
+"""
+Incrementally maintained property counts per status.
+
+`property_status_counts` holds one row per status and is updated by
+triggers in the same transaction as every insert, update and delete on
+`properties`, so /properties/stats reads a handful of rows instead of
+grouping the whole table.
+"""
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, func, inspect, select, text
+
+from app.core.database import note_table_available, table_available
+
+
+COUNTS_TABLE = "property_status_counts"
+
+# Own MetaData: the table is created (and back-filled) by migrations only
+property_status_counts = Table(
+    COUNTS_TABLE,
+    MetaData(),
+    Column("status", String, primary_key=True),
+    Column("count", Integer, nullable=False),
+)
+
+COUNTS_DDL = [
+    f"""
+    CREATE TABLE IF NOT EXISTS {COUNTS_TABLE} (
+        status VARCHAR NOT NULL PRIMARY KEY,
+        count INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {COUNTS_TABLE}_ai AFTER INSERT ON properties
+    WHEN new.status IS NOT NULL BEGIN
+        INSERT INTO {COUNTS_TABLE}(status, count) VALUES (new.status, 1)
+        ON CONFLICT(status) DO UPDATE SET count = count + 1;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {COUNTS_TABLE}_ad AFTER DELETE ON properties
+    WHEN old.status IS NOT NULL BEGIN
+        UPDATE {COUNTS_TABLE} SET count = count - 1 WHERE status = old.status;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {COUNTS_TABLE}_au AFTER UPDATE OF status ON properties
+    WHEN old.status IS NOT new.status BEGIN
+        UPDATE {COUNTS_TABLE} SET count = count - 1 WHERE status = old.status;
+        INSERT INTO {COUNTS_TABLE}(status, count)
+        SELECT new.status, 1 WHERE new.status IS NOT NULL
+        ON CONFLICT(status) DO UPDATE SET count = count + 1;
+    END
+    """,
+]
+
+def install_status_counts(conn):
+    """
+    Create the counters table and triggers on `conn` if missing,
+    back-filling it from the existing rows.
+    """
+    if conn.dialect.name != "sqlite":
+        return False
+
+    created = not inspect(conn).has_table(COUNTS_TABLE)
+
+    for ddl in COUNTS_DDL:
+        conn.execute(text(ddl))
+
+    if created:
+        _write_counts(conn, _actual_counts(conn))
+
+    note_table_available(conn, COUNTS_TABLE)
+    return True
+
+
+def is_available(db):
+    return table_available(db, COUNTS_TABLE)
+
+
+def read_counts(db):
+    rows = db.execute(
+        select(property_status_counts.c.status, property_status_counts.c.count)
+        .where(property_status_counts.c.count > 0)
+    ).all()
+
+    return {status: count for status, count in rows}
+
+
+def reconcile_status_counts(engine, fix=True):
+    """
+    Recompute the counters from `properties` and report drift as
+    {status: {"stored": n, "actual": m}}. Overwrites the stored counters
+    unless `fix` is False.
+    """
+    with engine.begin() as conn:
+        if not install_status_counts(conn):
+            return {}
+
+        actual = _actual_counts(conn)
+        stored = {
+            status: count
+            for status, count in conn.execute(
+                select(property_status_counts.c.status, property_status_counts.c.count))
+            if count
+        }
+
+        drift = {
+            status: {"stored": stored.get(status, 0), "actual": actual.get(status, 0)}
+            for status in set(stored) | set(actual)
+            if stored.get(status, 0) != actual.get(status, 0)
+        }
+
+        if drift and fix:
+            _write_counts(conn, actual)
+
+    return drift
+
+
+def _actual_counts(conn):
+    from app.models.property_model import Property
+
+    rows = conn.execute(
+        select(Property.status, func.count(Property.id))
+        .where(Property.status.isnot(None))
+        .group_by(Property.status)
+    ).all()
+
+    return {status: count for status, count in rows}
+
+
+def _write_counts(conn, counts):
+    conn.execute(property_status_counts.delete())
+
+    if counts:
+        conn.execute(property_status_counts.insert(), [
+            {"status": status, "count": count} for status, count in counts.items()
+        ])
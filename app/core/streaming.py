@@ -0,0 +1,286 @@
+"""
+Helpers for streaming large result sets, in and out.
+
+FastAPI closes `get_db` sessions before a StreamingResponse body is
+consumed, so streaming bodies open (and close) their own read session.
+"""
+
+import codecs
+import csv
+import io
+import zlib
+from collections import deque
+
+import orjson
+
+from fastapi.responses import StreamingResponse
+
+from app.core import database
+from app.core.config import settings
+
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _session_rows(produce):
+    db = database.ReadSessionLocal()
+    try:
+        yield from produce(db)
+    finally:
+        db.close()
+
+
+def stream_json_array(produce, chunk_size: int | None = None):
+    """
+    Stream `produce(db)` (an iterator of dicts) as one JSON array.
+
+    Rows are encoded and flushed in chunks, so memory stays flat no
+    matter how many rows the iterator yields.
+    """
+    chunk_size = chunk_size or settings.STREAM_CHUNK_SIZE
+
+    def body():
+        yield b"["
+        separator = b""
+        chunk = []
+
+        for item in _session_rows(produce):
+            chunk.append(orjson.dumps(item))
+
+            if len(chunk) >= chunk_size:
+                yield separator + b",".join(chunk)
+                separator = b","
+                chunk = []
+
+        if chunk:
+            yield separator + b",".join(chunk)
+
+        yield b"]"
+
+    return StreamingResponse(body(), media_type="application/json")
+
+
+def stream_export(produce, columns, fmt: str, gzip: bool = False,
+                  chunk_size: int | None = None, filename: str = "export"):
+    """
+    Stream `produce(db)` (an iterator of row tuples matching `columns`)
+    as NDJSON or CSV, optionally gzip-encoded.
+
+    The first row is flushed on its own so the client gets bytes right
+    away, after that rows go out `chunk_size` at a time.
+    """
+    chunk_size = chunk_size or settings.STREAM_CHUNK_SIZE
+
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        def encode(rows):
+            writer.writerows(rows)
+            data = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            return data.encode()
+
+        header = encode([columns])
+    else:
+        def encode(rows):
+            return b"".join(
+                orjson.dumps(dict(zip(columns, row))) + b"\n" for row in rows
+            )
+
+        header = b""
+
+    def chunks():
+        if header:
+            yield header
+
+        rows = []
+        flush_at = 1
+
+        for row in _session_rows(produce):
+            rows.append(row)
+
+            if len(rows) >= flush_at:
+                yield encode(rows)
+                rows = []
+                flush_at = chunk_size
+
+        if rows:
+            yield encode(rows)
+
+    def gzipped(source):
+        compressor = zlib.compressobj(wbits=31)  # 31 → gzip container
+
+        for data in source:
+            # Sync flush so every chunk reaches the client immediately
+            yield compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+        yield compressor.flush()
+
+    headers = {"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'}
+
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+        body = gzipped(chunks())
+    else:
+        body = chunks()
+
+    return StreamingResponse(body, media_type=EXPORT_MEDIA_TYPES[fmt], headers=headers)
+
+
+class RecordError:
+    """
+    Stands in for a streamed import record that couldn't be parsed.
+    """
+
+    def __init__(self, message):
+        self.message = message
+
+    def __repr__(self):
+        return f"RecordError({self.message!r})"
+
+
+async def iter_line_batches(chunks):
+    """
+    Split an async stream of byte chunks (e.g. `request.stream()`) into
+    text lines, one list per chunk, without buffering the whole body.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+
+        if lines:
+            yield [line.rstrip("\r") for line in lines]
+
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield [pending.rstrip("\r")]
+
+
+async def iter_lines(chunks):
+    """
+    Text lines of an async stream of byte chunks, one at a time.
+    """
+    async for lines in iter_line_batches(chunks):
+        for line in lines:
+            yield line
+
+
+async def iter_ndjson_records(chunks):
+    """
+    Yield (row number, record) for every non-blank NDJSON line.
+    Lines that aren't a JSON object yield a RecordError instead.
+    """
+    row = 0
+
+    async for line in iter_lines(chunks):
+        if not line.strip():
+            continue
+
+        row += 1
+        try:
+            record = orjson.loads(line)
+        except ValueError as e:
+            record = RecordError(f"Invalid JSON: {e}")
+        else:
+            if not isinstance(record, dict):
+                record = RecordError("Expected a JSON object")
+
+        yield row, record
+
+
+class _LineFeed:
+    """
+    Input lines for one csv.reader, topped up as the body streams in.
+
+    Running dry only ends the current next(reader) call, so the same
+    reader keeps parsing once more lines are added. `taken` holds the
+    lines handed out since it was last reset.
+    """
+
+    def __init__(self):
+        self.lines = deque()
+        self.taken = []
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if not self.lines:
+            raise StopIteration
+        line = self.lines.popleft()
+        self.taken.append(line)
+        return line
+
+
+async def iter_csv_records(chunks):
+    """
+    Yield (row number, record) for every CSV data row, using the first
+    row as header. Empty cells are dropped so schema defaults apply.
+
+    Quoted fields may span lines and chunks. Malformed rows, including
+    one still inside a quoted field at the end of the body, yield a
+    RecordError.
+    """
+    feed = _LineFeed()
+    # strict: a quoted field cut off by the end of the feed raises
+    # instead of coming back silently truncated
+    reader = csv.reader(feed, strict=True)
+
+    def parse(final):
+        nonlocal reader
+        parsed = []
+
+        while feed.lines:
+            feed.taken = []
+            try:
+                parsed.append(next(reader))
+            except StopIteration:
+                break
+            except csv.Error as e:
+                if not feed.lines and not final:
+                    # Cut off by the end of this chunk: parse it again with more lines
+                    feed.lines.extendleft(reversed(feed.taken))
+                    reader = csv.reader(feed, strict=True)
+                    break
+                parsed.append(RecordError(f"Invalid CSV: {e}"))
+
+        return parsed
+
+    header = None
+    row = 0
+
+    async def batches():
+        async for lines in iter_line_batches(chunks):
+            # csv.reader keeps a quoted newline only if the line ends with one
+            feed.lines.extend(line + "\n" for line in lines)
+            yield parse(final=False)
+        yield parse(final=True)
+
+    async for parsed in batches():
+        for values in parsed:
+            if isinstance(values, RecordError):
+                row += 1
+                yield row, values
+                continue
+
+            if not any(value.strip() for value in values):
+                continue
+
+            if header is None:
+                header = [name.strip() for name in values]
+                continue
+
+            row += 1
+            if len(values) > len(header):
+                yield row, RecordError(f"Expected {len(header)} columns, got {len(values)}")
+                continue
+
+            yield row, {name: value for name, value in zip(header, values) if value != ""}
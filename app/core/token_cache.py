@@ -0,0 +1,83 @@
+"""
+Bounded cache of verified JWT payloads.
+
+Verifying a token means re-parsing it and re-checking its HMAC, while
+clients replay the same token on every request. Payloads are cached by
+token digest and never outlive the token's own `exp`.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from app.core.config import settings
+
+
+class TokenCache:
+
+    def __init__(self, max_entries, ttl_seconds):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()   # digest -> (payload, expires_at)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_verify(self, token: str, verify):
+        """
+        Cached payload for `token`, or `verify(token)` and cache the result.
+        Errors raised by `verify` propagate and are not cached.
+        """
+        if self.max_entries <= 0:
+            return verify(token)
+
+        key = hashlib.sha256(token.encode()).digest()
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return dict(entry[0])
+
+            if entry is not None:
+                del self._entries[key]
+
+            self.misses += 1
+
+        payload = verify(token)
+
+        expires_at = now + self.ttl_seconds
+        if isinstance(payload.get("exp"), (int, float)):
+            expires_at = min(expires_at, payload["exp"])
+
+        with self._lock:
+            self._entries[key] = (payload, expires_at)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return dict(payload)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+token_cache = TokenCache(settings.TOKEN_CACHE_SIZE, settings.TOKEN_CACHE_TTL_SECONDS)
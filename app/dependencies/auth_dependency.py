@@ -5,7 +5,7 @@ Shows simple token input in Swagger.
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from app.core.security import decode_access_token
+from app.core.security import decode_access_token_cached
 from app.core.database import get_db
 
 # This creates simple Bearer token input in Swagger
@@ -19,7 +19,7 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
 
     token = credentials.credentials
 
-    payload = decode_access_token(token)
+    payload = decode_access_token_cached(token)
 
     if payload is None:
         raise HTTPException(
@@ -0,0 +1,94 @@
+"""
+Read/write session routing for routes.
+
+GET routes take `get_read_db_session` (read-only connections), writes
+take `get_write_db_session`. A user who just wrote is sent to the
+primary for a few seconds so they always see their own changes.
+"""
+
+import threading
+import time
+
+from fastapi import Depends
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+
+from app.core import database
+from app.core.config import settings
+from app.core.database import get_db_session
+from app.core.security import decode_access_token_cached
+from app.dependencies.auth_dependency import get_current_user
+
+optional_security = HTTPBearer(auto_error=False)
+
+
+class RecentWriters:
+    """
+    Remembers when each user last wrote (per process).
+    """
+
+    def __init__(self, window_seconds):
+        self.window_seconds = window_seconds
+        self._lock = threading.Lock()
+        self._last_write = {}
+
+    def note_write(self, user_id):
+        if self.window_seconds <= 0:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            self._last_write[user_id] = now
+
+            # Keep the map bounded by forgetting expired entries
+            if len(self._last_write) > 10000:
+                self._last_write = {
+                    uid: at for uid, at in self._last_write.items()
+                    if now - at < self.window_seconds
+                }
+
+    def wrote_recently(self, user_id):
+        at = self._last_write.get(user_id)
+        return at is not None and time.monotonic() - at < self.window_seconds
+
+
+recent_writers = RecentWriters(settings.READ_YOUR_WRITES_SECONDS)
+
+
+def get_optional_user(credentials: HTTPAuthorizationCredentials | None = Depends(optional_security)):
+    """
+    Token payload when a valid bearer token is sent, None otherwise.
+    """
+    if credentials is None:
+        return None
+
+    try:
+        return decode_access_token_cached(credentials.credentials)
+    except Exception:
+        return None
+
+
+def _use_primary(user):
+    return user is not None and recent_writers.wrote_recently(user.get("id"))
+
+
+async def get_read_db_session(user=Depends(get_optional_user)):
+    if settings.DB_ASYNC:
+        factory = database.AsyncSessionLocal if _use_primary(user) else database.AsyncReadSessionLocal
+
+        async with factory() as db:
+            yield db
+    else:
+        factory = database.SessionLocal if _use_primary(user) else database.ReadSessionLocal
+
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+
+async def get_write_db_session(user=Depends(get_current_user), db=Depends(get_db_session)):
+    yield db
+
+    # Only reached when the request didn't raise
+    recent_writers.note_write(user["id"])
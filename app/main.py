@@ -1,18 +1,73 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordBearer
-from app.api import auth_routes, property_routes
-from app.core.database import Base, engine
-from app.core.middleware import logging_middleware
+from app.api import auth_routes, metrics_routes, property_routes
+from app.core.config import settings
+from app.core.database import Base, SessionLocal, async_engine, async_read_engine, engine, engine_report
+from app.core.hashing import password_hashing
+from app.core.middleware import logging_middleware, start_access_log, stop_access_log
+from app.core.migrations import run_migrations, schema_report
+from app.services.change_feed import change_feed
+from app.services.location_index import location_index
+from app.services.price_analytics import price_analytics
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    start_access_log()
+
+    logger.info("Database engine: %s", engine_report(engine))
+
+    # Create / upgrade database tables and indexes
+    if settings.AUTO_MIGRATE:
+        for version, name in run_migrations(engine):
+            logger.info("Applied migration %s: %s", version, name)
+
+    report = schema_report(engine)
+    logger.info("Schema version %s, indexes: %s", report["version"], report["indexes"])
+
+    # In-memory location typeahead index
+    db = SessionLocal()
+    try:
+        location_index.rebuild(db)
+    finally:
+        db.close()
+
+    # Dummy hash for unknown-email logins, so the first one isn't slower
+    await password_hashing.verify_dummy("")
+
+    # Background refresh of the precomputed price analytics
+    price_analytics.start()
+
+    # Single broadcaster behind /properties/changes/stream
+    change_feed.start()
+
+    yield
+
+    await change_feed.stop()
+    await price_analytics.stop()
+
+    await async_engine.dispose()
+    await async_read_engine.dispose()
+    password_hashing.shutdown()
+    stop_access_log()
 
-# Create database tables
-# Base.metadata.create_all(bind=engine)
 
 app = FastAPI(
     title="Property Portal API",
     version="0.1.0",
-    description="Secure Property Management API with JWT Authentication"
+    description="Secure Property Management API with JWT Authentication",
+    lifespan=lifespan,
+    # orjson encodes responses several times faster than the stdlib json
+    default_response_class=ORJSONResponse
 )
 app.middleware("http")(logging_middleware)
 # Include routers
 app.include_router(auth_routes.router)
 app.include_router(property_routes.router)
+app.include_router(metrics_routes.router)
@@ -0,0 +1,93 @@
+"""
+Maintenance commands.
+
+Usage:
+    python -m app.manage migrate
+    python -m app.manage db-status
+    python -m app.manage rebuild-search-index
+    python -m app.manage reconcile-stats [--dry-run]
+"""
+
+import argparse
+
+from app.core.database import engine
+from app.core.migrations import analyze_database, run_migrations, schema_report
+from app.core.search_index import rebuild_search_index
+from app.core.status_counts import reconcile_status_counts
+
+
+def migrate(args):
+    applied = run_migrations(engine, analyze=False)
+
+    for version, name in applied:
+        print(f"Applied migration {version}: {name}")
+
+    if not applied:
+        print("Schema is up to date")
+
+    analyze_database(engine)
+    db_status(args)
+
+
+def db_status(args):
+    report = schema_report(engine)
+
+    print(f"Schema version: {report['version']} (latest {report['latest']})")
+    for name in report["pending"]:
+        print(f"  pending: {name}")
+
+    for table, indexes in report["indexes"].items():
+        print(f"{table}: {', '.join(indexes) or '(no indexes)'}")
+
+
+def rebuild_search(args):
+    count = rebuild_search_index(engine)
+    print(f"Search index rebuilt: {count} properties indexed")
+
+
+def reconcile_stats(args):
+    drift = reconcile_status_counts(engine, fix=not args.dry_run)
+
+    if not drift:
+        print("Status counters are consistent")
+        return
+
+    for status, counts in sorted(drift.items()):
+        print(f"{status}: stored {counts['stored']}, actual {counts['actual']}")
+
+    print("Dry run, counters left unchanged" if args.dry_run else "Counters corrected")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m app.manage")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser(
+        "migrate",
+        help="Apply pending schema migrations and refresh planner statistics"
+    ).set_defaults(func=migrate)
+
+    commands.add_parser(
+        "db-status",
+        help="Show schema version and existing indexes"
+    ).set_defaults(func=db_status)
+
+    commands.add_parser(
+        "rebuild-search-index",
+        help="Recreate the full-text search index from the properties table"
+    ).set_defaults(func=rebuild_search)
+
+    reconcile = commands.add_parser(
+        "reconcile-stats",
+        help="Recompute property status counters and report drift"
+    )
+    reconcile.add_argument("--dry-run", action="store_true",
+                           help="Only report drift, don't fix it")
+    reconcile.set_defaults(func=reconcile_stats)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
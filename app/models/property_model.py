@@ -1,10 +1,19 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, Index
 from app.core.database import Base
 
 
 class Property(Base):
     __tablename__ = "properties"
 
+    # Access paths used by /my-properties, /stats, price-range search and price sorting
+    # (existing databases get them from app/core/migrations.py)
+    __table_args__ = (
+        Index("ix_properties_owner_id_id", "owner_id", "id"),
+        Index("ix_properties_status", "status"),
+        Index("ix_properties_location_price", "location", "price"),
+        Index("ix_properties_price_id", "price", "id"),
+    )
+
     # Primary key of property
     id = Column(Integer, primary_key=True)
 
@@ -17,6 +26,10 @@ class Property(Base):
     # Property price
     price = Column(Float)
 
+    # Coordinates in degrees (optional), indexed by the properties_geo R*Tree
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+
     # Stores user who created property
     # Links property with users table
     owner_id = Column(Integer, ForeignKey("users.id"))
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 # Schema used when creating or updating property
@@ -17,6 +17,10 @@ class PropertyCreate(BaseModel):
     # Default automatically becomes "available"
     status: str = "available"
 
+    # Optional coordinates, used by /properties/nearby and /within
+    latitude: float | None = Field(None, ge=-90, le=90)
+    longitude: float | None = Field(None, ge=-180, le=180)
+
 
 # Schema used for API response
 class PropertyResponse(PropertyCreate):
@@ -27,3 +31,42 @@ class PropertyResponse(PropertyCreate):
     class Config:
         # Allows FastAPI to convert SQLAlchemy object to JSON
         from_attributes = True
+
+
+# Filter selecting properties for bulk operations
+class PropertyFilter(BaseModel):
+
+    # Exact location match
+    location: str | None = None
+
+    status: str | None = None
+
+    min_price: float | None = None
+
+    max_price: float | None = None
+
+
+# Schema used for PATCH /properties/bulk
+# Select rows by ids and/or filter, then set the given fields
+class PropertyBulkUpdate(BaseModel):
+
+    ids: list[int] | None = None
+
+    filter: PropertyFilter | None = None
+
+    # New status for every selected property
+    status: str | None = None
+
+    # New absolute price
+    price: float | None = None
+
+    # Relative repricing, e.g. -5 → 5% cheaper
+    price_change_pct: float | None = None
+
+
+# Schema used for DELETE /properties/bulk
+class PropertyBulkDelete(BaseModel):
+
+    ids: list[int] | None = None
+
+    filter: PropertyFilter | None = None
@@ -0,0 +1,44 @@
+"""
+Async facade over AuthService for async routes (see async_property_service).
+
+Password hashing goes to the dedicated hashing executor instead of the
+request's thread, so a login burst can't starve other routes.
+"""
+
+from fastapi import HTTPException
+
+from app.core.database import run_db
+from app.core.hashing import password_hashing
+from app.services.auth_service import auth_service
+
+
+class AsyncAuthService:
+
+    async def register_user(self, db, email: str, password: str, role: str):
+        await run_db(db, auth_service.ensure_email_free, email)
+
+        password_hash = await password_hashing.hash(password)
+
+        return await run_db(db, auth_service.create_user, email, password_hash, role)
+
+    async def login_user(self, db, email: str, password: str):
+        user = await run_db(db, auth_service.get_user_by_email, email)
+
+        # Unknown emails pay for a verify too: no timing difference to probe
+        if not user:
+            matches, needs_rehash = await password_hashing.verify_dummy(password)
+        else:
+            matches, needs_rehash = await password_hashing.verify(password, user.password)
+
+        if not matches:
+            raise HTTPException(status_code=401, detail="Invalid credentials")
+
+        # Transparently upgrade legacy sha256 / outdated argon2 hashes
+        if needs_rehash:
+            password_hash = await password_hashing.hash(password)
+            await run_db(db, auth_service.update_password_hash, user.id, password_hash)
+
+        return auth_service.issue_token(user)
+
+
+async_auth_service = AsyncAuthService()
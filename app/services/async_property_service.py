@@ -0,0 +1,74 @@
+"""
+Async facade over PropertyService for async routes.
+
+Works with both session kinds from `get_db_session`: AsyncSession runs
+the ORM code through SQLAlchemy's greenlet bridge on the event loop,
+a sync Session runs it in the threadpool.
+"""
+
+from app.core.database import run_db
+from app.services.property_service import property_service
+
+
+class AsyncPropertyService:
+
+    async def create_property(self, db, property_data, user):
+        return await run_db(db, property_service.create_property, property_data, user)
+
+    async def update_property(self, db, property_id, property_data, user):
+        return await run_db(db, property_service.update_property, property_id, property_data, user)
+
+    async def delete_property(self, db, property_id, user):
+        return await run_db(db, property_service.delete_property, property_id, user)
+
+    async def bulk_update(self, db, data, user):
+        return await run_db(db, property_service.bulk_update, data, user)
+
+    async def bulk_delete(self, db, data, user):
+        return await run_db(db, property_service.bulk_delete, data, user)
+
+    async def get_my_properties(self, db, user):
+        return await run_db(db, property_service.get_my_properties, user)
+
+    async def get_property(self, db, property_id):
+        return await run_db(db, property_service.get_property, property_id)
+
+    async def get_all_properties(self, db):
+        return await run_db(db, property_service.get_all_properties)
+
+    async def get_properties_page(self, db, after=None, limit=None, owner_id=None, sort=None):
+        return await run_db(db, property_service.get_properties_page, after, limit, owner_id, sort)
+
+    async def search_properties(self, db, location=None, min_price=None, max_price=None, q=None,
+                                status=None):
+        return await run_db(db, property_service.search_properties, location, min_price, max_price, q,
+                            status)
+
+    async def search_page(self, db, location=None, min_price=None, max_price=None, q=None,
+                          sort=None, after=None, limit=None, status=None):
+        return await run_db(db, property_service.search_page, location, min_price, max_price, q,
+                            sort, after, limit, status)
+
+    async def search_with_facets(self, db, location=None, min_price=None, max_price=None, q=None,
+                                 facets=None, facet_size=None, price_buckets=None,
+                                 paged=False, sort=None, after=None, limit=None, status=None):
+        return await run_db(db, property_service.search_with_facets, location, min_price, max_price, q,
+                            facets, facet_size, price_buckets, paged, sort, after, limit, status)
+
+    async def nearby_properties(self, db, lat, lon, radius_km, min_price=None, max_price=None,
+                                status=None, limit=None):
+        return await run_db(db, property_service.nearby_properties, lat, lon, radius_km,
+                            min_price, max_price, status, limit)
+
+    async def properties_within(self, db, bbox, min_price=None, max_price=None, status=None, limit=None):
+        return await run_db(db, property_service.properties_within, bbox,
+                            min_price, max_price, status, limit)
+
+    async def get_changes(self, db, since=0, limit=None):
+        return await run_db(db, property_service.get_changes, since, limit)
+
+    async def property_stats(self, db):
+        return await run_db(db, property_service.property_stats)
+
+
+async_property_service = AsyncPropertyService()
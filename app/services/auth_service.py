@@ -2,7 +2,9 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
 from app.models.user_model import User
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.security import (
+    hash_password, verify_password, verify_dummy_password, password_needs_rehash, create_access_token
+)
 
 
 class AuthService:
@@ -10,15 +12,43 @@ class AuthService:
     # ✅ REGISTER
     def register_user(self, db: Session, email: str, password: str, role: str):
 
-        existing_user = db.query(User).filter(User.email == email).first()
+        self.ensure_email_free(db, email)
 
-        if existing_user:
+        return self.create_user(db, email, hash_password(password), role)
+
+    # ✅ LOGIN
+    def login_user(self, db: Session, email: str, password: str):
+
+        user = self.get_user_by_email(db, email)
+
+        # Unknown emails pay for a verify too: no timing difference to probe
+        if not user:
+            verify_dummy_password(password)
+            raise HTTPException(status_code=401, detail="Invalid credentials")
+
+        if not verify_password(password, user.password):
+            raise HTTPException(status_code=401, detail="Invalid credentials")
+
+        # Upgrade legacy sha256 / outdated argon2 hashes
+        if password_needs_rehash(user.password):
+            self.update_password_hash(db, user.id, hash_password(password))
+
+        return self.issue_token(user)
+
+    # Building blocks, also used by AsyncAuthService which hashes off-thread
+
+    def get_user_by_email(self, db: Session, email: str):
+        return db.query(User).filter(User.email == email).first()
+
+    def ensure_email_free(self, db: Session, email: str):
+        if self.get_user_by_email(db, email):
             raise HTTPException(
                 status_code=400, detail="Email already registered")
 
+    def create_user(self, db: Session, email: str, password_hash: str, role: str):
         new_user = User(
             email=email,
-            password=hash_password(password),
+            password=password_hash,
             role=role
         )
 
@@ -31,14 +61,12 @@ class AuthService:
             "user_id": new_user.id
         }
 
-    # ✅ LOGIN
-    def login_user(self, db: Session, email: str, password: str):
-
-        user = db.query(User).filter(User.email == email).first()
-
-        if not user or not verify_password(password, user.password):
-            raise HTTPException(status_code=401, detail="Invalid credentials")
+    def update_password_hash(self, db: Session, user_id: int, password_hash: str):
+        db.query(User).filter(User.id == user_id).update(
+            {User.password: password_hash}, synchronize_session=False)
+        db.commit()
 
+    def issue_token(self, user):
         token = create_access_token({
             "id": user.id,
             "email": user.email,
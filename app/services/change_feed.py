@@ -0,0 +1,192 @@
+"""
+Live fan-out of property changes to Server-Sent Events clients.
+
+One broadcaster task per process reads new versions from the change log
+and hands each batch to every connected client's queue, so the database
+sees one query per batch of writes no matter how many clients listen.
+It wakes right after writes made by this process (via the cache
+generation listener) and polls every CHANGE_FEED_POLL_SECONDS for writes
+made elsewhere.
+
+A client starting from an older version first catches up from the
+database, then switches to the broadcast. A client whose queue
+overflows is sent back to the database to catch up again, rather than
+holding up everybody else.
+"""
+
+import asyncio
+import logging
+
+import orjson
+from fastapi.concurrency import run_in_threadpool
+
+from app.core import change_log, database
+from app.core.config import settings
+from app.core.response_cache import cache_generations
+from app.services.property_service import property_service
+
+logger = logging.getLogger("app.change_feed")
+
+# Queue marker: the subscriber fell behind and must re-read the database
+_RESYNC = None
+
+
+class ChangeFeed:
+
+    def __init__(self):
+        self._subscribers = set()
+        self._loop = None
+        self._wakeup = None
+        self._task = None
+        self.version = 0
+        self.batches = 0
+        self.resyncs = 0
+
+    # Broadcaster
+
+    def notify(self):
+        """
+        Wake the broadcaster. Safe to call from any thread.
+        """
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._wakeup.set)
+
+    def start(self):
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._broadcast_loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._loop = None
+
+    async def _broadcast_loop(self):
+        self.version = await run_in_threadpool(_latest_version)
+
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), settings.CHANGE_FEED_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                # Nobody listening: just keep up with the latest version
+                if not self._subscribers:
+                    self.version = await run_in_threadpool(_latest_version)
+                    continue
+
+                while True:
+                    page = await run_in_threadpool(_read_changes, self.version)
+                    if page["changes"]:
+                        self.version = page["version"]
+                        self._publish(page["changes"])
+                    if not page["has_more"]:
+                        break
+            except Exception:
+                logger.exception("Change feed broadcast failed")
+
+    def _publish(self, changes):
+        self.batches += 1
+
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(changes)
+            except asyncio.QueueFull:
+                self.resyncs += 1
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(_RESYNC)
+
+    # Subscribers
+
+    async def stream(self, request, since=None):
+        """
+        SSE body: every change after `since` (default: from now on),
+        one `change` event each, with the version as event id.
+        """
+        queue = asyncio.Queue(maxsize=settings.CHANGE_FEED_QUEUE_SIZE)
+        self._subscribers.add(queue)
+
+        try:
+            last = self.version if since is None else since
+
+            # Announce the starting point, so clients can resume from it
+            yield f"event: ready\ndata: {orjson.dumps({'version': last}).decode()}\n\n"
+
+            resync = since is not None and since < self.version
+
+            while True:
+                if resync:
+                    resync = False
+                    while True:
+                        page = await run_in_threadpool(_read_changes, last)
+                        for change in page["changes"]:
+                            last = change["version"]
+                            yield _event(change)
+                        if not page["has_more"]:
+                            break
+
+                try:
+                    changes = await asyncio.wait_for(
+                        queue.get(), settings.CHANGE_FEED_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    yield ": keepalive\n\n"
+                    continue
+
+                if changes is _RESYNC:
+                    resync = True
+                    continue
+
+                for change in changes:
+                    # Already sent while catching up
+                    if change["version"] <= last:
+                        continue
+                    last = change["version"]
+                    yield _event(change)
+        finally:
+            self._subscribers.discard(queue)
+
+    def stats(self):
+        return {
+            "subscribers": len(self._subscribers),
+            "version": self.version,
+            "batches": self.batches,
+            "resyncs": self.resyncs,
+        }
+
+
+def _event(change):
+    return f"id: {change['version']}\nevent: change\ndata: {orjson.dumps(change).decode()}\n\n"
+
+
+def _read_changes(since):
+    db = database.ReadSessionLocal()
+    try:
+        return property_service.get_changes(db, since, settings.PAGE_SIZE_MAX)
+    finally:
+        db.close()
+
+
+def _latest_version():
+    db = database.ReadSessionLocal()
+    try:
+        if not change_log.is_available(db):
+            return 0
+        return change_log.latest_version(db)
+    finally:
+        db.close()
+
+
+change_feed = ChangeFeed()
+cache_generations.add_listener(change_feed.notify)
@@ -0,0 +1,94 @@
+"""
+In-memory prefix index of distinct property locations.
+
+Keeps a sorted list of normalised locations and a listing count per
+location, so typeahead suggestions are a bisect plus a short scan and
+never touch the database. Built at startup and updated by
+PropertyService on every write.
+"""
+
+import heapq
+import threading
+from bisect import bisect_left, insort
+
+from sqlalchemy import func
+
+from app.models.property_model import Property
+
+
+class LocationIndex:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._keys = []      # sorted normalised locations
+        self._entries = {}   # key -> [display name, count]
+
+    @staticmethod
+    def _normalise(location):
+        return " ".join(str(location or "").split()).lower()
+
+    def rebuild(self, db):
+        """
+        Load distinct locations and their counts from the database.
+        """
+        rows = db.query(Property.location, func.count(Property.id)) \
+            .group_by(Property.location).all()
+
+        entries = {}
+        for location, count in rows:
+            key = self._normalise(location)
+            if not key:
+                continue
+            entry = entries.setdefault(key, [location.strip(), 0])
+            entry[1] += count
+
+        with self._lock:
+            self._entries = entries
+            self._keys = sorted(entries)
+
+    def add(self, location, count=1):
+        key = self._normalise(location)
+        if not key:
+            return
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                entry[1] += count
+            else:
+                self._entries[key] = [location.strip(), count]
+                insort(self._keys, key)
+
+    def remove(self, location, count=1):
+        key = self._normalise(location)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry:
+                return
+
+            entry[1] -= count
+            if entry[1] <= 0:
+                del self._entries[key]
+                del self._keys[bisect_left(self._keys, key)]
+
+    def suggest(self, prefix, limit=10):
+        """
+        Locations starting with `prefix` (case-insensitive),
+        most listed first.
+        """
+        key = self._normalise(prefix)
+
+        with self._lock:
+            start = bisect_left(self._keys, key)
+            # Every key with this prefix sorts before prefix + U+10FFFF
+            end = bisect_left(self._keys, key + "\U0010ffff", start)
+
+            matches = [self._entries[k] for k in self._keys[start:end]]
+
+        top = heapq.nsmallest(limit, matches, key=lambda e: (-e[1], e[0].lower()))
+
+        return [{"location": name, "count": count} for name, count in top]
+
+
+location_index = LocationIndex()
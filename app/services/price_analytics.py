@@ -0,0 +1,262 @@
+"""
+Precomputed price analytics per location and status.
+
+The summary (count, min, p10, median, p90, max, mean and a histogram per
+(location, status), plus per location over all statuses) is recomputed
+in one vectorized numpy pass over (location, status, price) columns:
+rows are sorted by group and price once, percentiles are read off by
+index and histograms come from a single bincount.
+
+A background task recomputes it every PRICE_ANALYTICS_REFRESH_SECONDS
+when properties were written since the last pass. Independently of
+that, a summary older than PRICE_ANALYTICS_MAX_STALENESS_SECONDS is
+never served: the request recomputes it first (this also covers writes
+made by other worker processes, which the write generation can't see).
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+
+from app.core import database
+from app.core.config import settings
+from app.core.response_cache import cache_generations
+from app.models.property_model import Property
+
+logger = logging.getLogger("app.analytics")
+
+PERCENTILES = {"p10": 0.10, "median": 0.50, "p90": 0.90}
+
+
+class PriceAnalytics:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._summary = None
+        self._task = None
+
+    # Computation
+
+    def refresh(self, max_age=None):
+        """
+        Recompute the summary from the database (blocking; run it off the
+        event loop). With `max_age`, a summary at most that old is kept,
+        so concurrent callers wait for one computation instead of each
+        running their own.
+        """
+        with self._lock:
+            age = self.age_seconds()
+            if max_age is not None and age is not None and age <= max_age:
+                return self._summary
+
+            generation = cache_generations.table()
+            started = time.perf_counter()
+
+            db = database.ReadSessionLocal()
+            try:
+                rows = db.execute(
+                    select(Property.location, Property.status, Property.price)
+                    .where(Property.price.isnot(None))
+                ).all()
+            finally:
+                db.close()
+
+            query_seconds = time.perf_counter() - started
+            summary = self._compute(rows)
+            elapsed = time.perf_counter() - started
+
+            summary.update({
+                "computed_at": time.time(),
+                "generation": generation,
+                "rows": len(rows),
+                "compute_ms": {
+                    "query": round(query_seconds * 1000, 2),
+                    "numpy": round((elapsed - query_seconds) * 1000, 2),
+                    "total": round(elapsed * 1000, 2),
+                },
+            })
+            self._summary = summary
+
+            return summary
+
+    @staticmethod
+    def _compute(rows):
+        bins = settings.PRICE_ANALYTICS_BINS
+
+        if not rows:
+            return {"histogram_edges": [], "groups": []}
+
+        locations, statuses, prices = zip(*rows)
+        prices = np.asarray(prices, dtype=np.float64)
+
+        # None can't be sorted against strings: group it under ""
+        location_names, location_codes = np.unique(
+            np.array([value or "" for value in locations], dtype=object), return_inverse=True)
+        status_names, status_codes = np.unique(
+            np.array([value or "" for value in statuses], dtype=object), return_inverse=True)
+
+        # Log-spaced edges suit prices spanning orders of magnitude
+        low, high = prices.min(), prices.max()
+        if low > 0 and high > low:
+            edges = np.geomspace(low, high, bins + 1)
+        else:
+            edges = np.linspace(low, high if high > low else low + 1, bins + 1)
+        bin_index = np.clip(np.searchsorted(edges, prices, side="right") - 1, 0, bins - 1)
+
+        groups = []
+        n_status = len(status_names)
+
+        # Per (location, status), then per location over every status ("*")
+        for codes, named in (
+            (location_codes * n_status + status_codes,
+             lambda code: (location_names[code // n_status], status_names[code % n_status])),
+            (location_codes,
+             lambda code: (location_names[code], "*")),
+        ):
+            for code, stats, histogram in _group_stats(prices, codes, bin_index, bins):
+                location, status = named(code)
+                groups.append({
+                    "location": location or None,
+                    "status": status or None,
+                    **stats,
+                    "histogram": histogram,
+                })
+
+        return {"histogram_edges": [round(float(edge), 2) for edge in edges], "groups": groups}
+
+    # Serving
+
+    def age_seconds(self):
+        if self._summary is None:
+            return None
+        return time.time() - self._summary["computed_at"]
+
+    def is_current(self):
+        """
+        True when no property was written (in this process) since the last pass.
+        """
+        return self._summary is not None and self._summary["generation"] == cache_generations.table()
+
+    async def report(self, location=None, status=None):
+        """
+        The summary, filtered to `location` / `status` (case-insensitive),
+        with its age and cost. Recomputes first if missing or too stale.
+        """
+        max_age = settings.PRICE_ANALYTICS_MAX_STALENESS_SECONDS
+
+        age = self.age_seconds()
+        if age is None or age > max_age:
+            await run_in_threadpool(self.refresh, max_age)
+
+        summary = self._summary
+        groups = summary["groups"]
+
+        if location:
+            wanted = location.strip().lower()
+            groups = [g for g in groups if (g["location"] or "").lower() == wanted]
+
+        if status:
+            wanted = status.strip().lower()
+            groups = [g for g in groups if (g["status"] or "").lower() == wanted]
+
+        return {
+            "computed_at": datetime.fromtimestamp(summary["computed_at"], timezone.utc).isoformat(),
+            "age_seconds": round(self.age_seconds(), 3),
+            "max_staleness_seconds": settings.PRICE_ANALYTICS_MAX_STALENESS_SECONDS,
+            "up_to_date": self.is_current(),
+            "rows": summary["rows"],
+            "compute_ms": summary["compute_ms"],
+            "histogram_edges": summary["histogram_edges"],
+            "groups": groups,
+        }
+
+    def stats(self):
+        summary = self._summary
+        return {
+            "rows": summary["rows"] if summary else 0,
+            "groups": len(summary["groups"]) if summary else 0,
+            "age_seconds": round(self.age_seconds() or 0, 3),
+            "compute_ms": summary["compute_ms"]["total"] if summary else 0,
+        }
+
+    # Background refresh
+
+    def start(self):
+        if self._task is None and settings.PRICE_ANALYTICS_REFRESH_SECONDS > 0:
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(settings.PRICE_ANALYTICS_REFRESH_SECONDS)
+
+            age = self.age_seconds()
+            if age is not None and self.is_current() \
+                    and age < settings.PRICE_ANALYTICS_MAX_STALENESS_SECONDS:
+                continue
+
+            try:
+                await run_in_threadpool(self.refresh)
+            except Exception:
+                logger.exception("Price analytics refresh failed")
+
+
+def _group_stats(prices, codes, bin_index, bins):
+    """
+    Yield (group code, stats, histogram counts) for every group in `codes`.
+    """
+    order = np.lexsort((prices, codes))
+    sorted_prices = prices[order]
+    sorted_codes = codes[order]
+
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    counts = np.diff(np.r_[starts, len(sorted_prices)])
+    group_codes = sorted_codes[starts]
+
+    stats = {
+        "count": counts,
+        "min": sorted_prices[starts],
+        "max": sorted_prices[starts + counts - 1],
+        "mean": np.add.reduceat(sorted_prices, starts) / counts,
+    }
+
+    # Linear interpolation between closest ranks (numpy's default method)
+    for name, q in PERCENTILES.items():
+        position = starts + q * (counts - 1)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.minimum(lower + 1, starts + counts - 1)
+        fraction = position - lower
+        stats[name] = sorted_prices[lower] + (sorted_prices[upper] - sorted_prices[lower]) * fraction
+
+    # One bincount for every group's histogram
+    _, dense = np.unique(codes, return_inverse=True)
+    histograms = np.bincount(dense * bins + bin_index, minlength=len(group_codes) * bins) \
+        .reshape(len(group_codes), bins)
+
+    for i, code in enumerate(group_codes):
+        yield int(code), {
+            "count": int(stats["count"][i]),
+            "min": float(stats["min"][i]),
+            "p10": round(float(stats["p10"][i]), 2),
+            "median": round(float(stats["median"][i]), 2),
+            "p90": round(float(stats["p90"][i]), 2),
+            "max": float(stats["max"][i]),
+            "mean": round(float(stats["mean"][i]), 2),
+        }, histograms[i].tolist()
+
+
+price_analytics = PriceAnalytics()
@@ -3,27 +3,59 @@ Property business logic.
 Handles role-based access and ownership.
 """
 
+import math
+from collections import Counter
+
 from app.models.property_model import Property
 from app.models.property_model import Property
-from sqlalchemy import func
+from app.schemas.property_schema import PropertyCreate
+from app.core import database
+from app.core.config import settings
+from app.core.pagination import decode_cursor, encode_cursor, page_size
+from app.core import search_index
+from app.core.search_index import properties_fts
+from app.core import change_log
+from app.core.change_log import property_versions
+from app.core import geo_index
+from app.core.geo_index import haversine_km, parse_bbox, properties_geo, radius_bbox
+from app.core import status_counts
+from app.core.response_cache import cache_generations
+from app.core.streaming import RecordError
+from app.services.location_index import location_index
+from sqlalchemy import case, delete, func, insert, literal_column, or_, select, tuple_, update
+from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
 
+# Column order of catalogue exports
+EXPORT_COLUMNS = ("id", "title", "location", "price", "status", "owner_id", "latitude", "longitude")
+
+# Keys (in order) of the property JSON returned by list / search endpoints
+PROPERTY_COLUMNS = ("id", "title", "price", "location", "status", "owner_id", "latitude", "longitude")
+
+# Facets /properties/search can return
+SEARCH_FACETS = ("status", "location", "price")
+
+# Orders supported by paginated list / search endpoints ("-" = descending)
+SORT_KEYS = ("id", "price", "-price")
+
+
 class PropertyService:
 
     def create_property(self, db: Session, property_data, user):
 
-        # ✅ user is dict → use []
-        if user["role"] not in ["admin", "agent"]:
-            raise HTTPException(
-                status_code=403, detail="Not allowed to create property")
+        self._check_can_create(user)
 
         new_property = Property(
             title=property_data.title,
             location=property_data.location,
             price=property_data.price,
             status=property_data.status,
+            latitude=property_data.latitude,
+            longitude=property_data.longitude,
             owner_id=user["id"]
         )
 
@@ -31,6 +63,9 @@ class PropertyService:
         db.commit()
         db.refresh(new_property)
 
+        location_index.add(new_property.location)
+        cache_generations.bump([new_property.owner_id])
+
         return new_property
         """
         Only admin or agent can create property.
@@ -38,11 +73,88 @@ class PropertyService:
 
         # FIX: user is dict → use ["role"]
 
+    def _check_can_create(self, user):
+        # ✅ user is dict → use []
+        if user["role"] not in ["admin", "agent"]:
+            raise HTTPException(
+                status_code=403, detail="Not allowed to create property")
+
+    async def bulk_import(self, records, user, batch_size=None):
+        """
+        Validate and insert streamed listings in batches.
+        `records` is an async iterator of (row number, dict or RecordError).
+        Role is checked once; each batch is one executemany insert in its
+        own transaction. Returns counts plus per-row errors.
+        """
+        self._check_can_create(user)
+
+        batch_size = batch_size or settings.BULK_BATCH_SIZE
+        result = {"inserted": 0, "failed": 0, "errors": []}
+        batch = []
+
+        def report(row, error):
+            result["failed"] += 1
+            if len(result["errors"]) < settings.BULK_MAX_ERRORS:
+                result["errors"].append({"row": row, "error": error})
+
+        async def flush():
+            error = await run_in_threadpool(self._insert_batch, [values for _, values in batch])
+
+            if error:
+                for row, _ in batch:
+                    report(row, error)
+            else:
+                result["inserted"] += len(batch)
+
+            batch.clear()
+
+        async for row, record in records:
+            if isinstance(record, RecordError):
+                report(row, record.message)
+                continue
+
+            try:
+                data = PropertyCreate.model_validate(record)
+            except ValidationError as e:
+                report(row, "; ".join(
+                    f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()))
+                continue
+
+            batch.append((row, {**data.model_dump(), "owner_id": user["id"]}))
+
+            if len(batch) >= batch_size:
+                await flush()
+
+        if batch:
+            await flush()
+
+        if result["inserted"]:
+            cache_generations.bump([user["id"]])
+
+        return result
+
+    def _insert_batch(self, rows):
+        db = database.SessionLocal()
+        try:
+            db.execute(insert(Property), rows)
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            return f"Batch insert failed: {e.__class__.__name__}"
+        finally:
+            db.close()
+
+        for location, count in Counter(values["location"] for values in rows).items():
+            location_index.add(location, count)
+
+        return None
+
     def get_my_properties(self, db, user):
         """
         Get properties owned by user.
         """
-        return db.query(Property).filter(Property.owner_id == user["id"]).all()
+        return self._property_dicts(db.execute(
+            self._property_select().where(Property.owner_id == user["id"]).order_by(Property.id)))
 
     def delete_property(self, db, property_id, user):
         """
@@ -58,16 +170,143 @@ class PropertyService:
         if user["role"] != "admin" and prop.owner_id != user["id"]:
             raise Exception("Not authorized")
 
+        location = prop.location
+        owner_id = prop.owner_id
+
         db.delete(prop)
         db.commit()
 
+        location_index.remove(location)
+        cache_generations.bump([owner_id])
+
         return prop
 
+    def bulk_update(self, db, data, user):
+        """
+        Set status / price on every selected property the user may edit.
+        One set-based UPDATE per id batch, all in one transaction.
+        """
+        values = {}
+
+        if data.status is not None:
+            values["status"] = data.status
+
+        if data.price is not None and data.price_change_pct is not None:
+            raise HTTPException(
+                status_code=400, detail="Give either price or price_change_pct, not both")
+
+        if data.price is not None:
+            values["price"] = data.price
+
+        if data.price_change_pct is not None:
+            values["price"] = Property.price * (1 + data.price_change_pct / 100)
+
+        if not values:
+            raise HTTPException(status_code=400, detail="Nothing to update")
+
+        rows = self._bulk_execute(
+            db,
+            lambda conditions: update(Property).where(*conditions).values(**values)
+            .returning(Property.id, Property.owner_id, Property.location),
+            data, user
+        )
+
+        cache_generations.bump({owner_id for _, owner_id, _ in rows})
+
+        return self._bulk_result("updated", rows, data.ids)
+
+    def bulk_delete(self, db, data, user):
+        """
+        Delete every selected property the user may delete.
+        One set-based DELETE per id batch, all in one transaction.
+        """
+        rows = self._bulk_execute(
+            db,
+            lambda conditions: delete(Property).where(*conditions)
+            .returning(Property.id, Property.owner_id, Property.location),
+            data, user
+        )
+
+        for location, count in Counter(location for _, _, location in rows).items():
+            location_index.remove(location, count)
+
+        cache_generations.bump({owner_id for _, owner_id, _ in rows})
+
+        return self._bulk_result("deleted", rows, data.ids)
+
+    def _bulk_execute(self, db, statement, data, user):
+        if data.ids is not None and not data.ids:
+            raise HTTPException(status_code=400, detail="ids must not be empty")
+
+        conditions = self._bulk_conditions(data.filter)
+
+        # Never turn a missing selection into "every property"
+        if not conditions and not data.ids:
+            raise HTTPException(
+                status_code=400, detail="Select properties with ids and/or filter")
+
+        # Ownership enforced in SQL: non-admins only touch their own rows
+        if user["role"] != "admin":
+            conditions.append(Property.owner_id == user["id"])
+
+        rows = []
+
+        if data.ids:
+            ids = sorted(set(data.ids))
+            for start in range(0, len(ids), settings.BULK_BATCH_SIZE):
+                batch = ids[start:start + settings.BULK_BATCH_SIZE]
+                rows += db.execute(
+                    statement(conditions + [Property.id.in_(batch)]),
+                    execution_options={"synchronize_session": False}
+                ).all()
+        else:
+            rows = db.execute(
+                statement(conditions),
+                execution_options={"synchronize_session": False}
+            ).all()
+
+        db.commit()
+
+        return rows
+
+    def _bulk_conditions(self, selector):
+        conditions = []
+
+        if selector is not None:
+            if selector.location is not None:
+                conditions.append(Property.location == selector.location)
+
+            if selector.status is not None:
+                conditions.append(Property.status == selector.status)
+
+            if selector.min_price is not None:
+                conditions.append(Property.price >= selector.min_price)
+
+            if selector.max_price is not None:
+                conditions.append(Property.price <= selector.max_price)
+
+        return conditions
+
+    @staticmethod
+    def _bulk_result(action, rows, ids=None):
+        result = {action: len(rows)}
+
+        if ids:
+            affected = {row[0] for row in rows}
+            # Missing or not owned by the user
+            result["skipped_ids"] = sorted(set(ids) - affected)
+
+        return result
+
     def property_stats(self, db):
         """
        Returns property statistics count by status.
        Used for dashboard / analytics.
+       Served from the trigger-maintained counters when available.
        """
+        if status_counts.is_available(db):
+            return status_counts.read_counts(db)
+
         stats = db.query(
             Property.status,
             func.count(Property.id)
@@ -88,47 +327,497 @@ class PropertyService:
         if user["role"] != "admin" and prop.owner_id != user["id"]:
             raise Exception("Not authorized to update property")
 
+        old_location = prop.location
+
         # Update fields
         prop.title = property_data.title
         prop.location = property_data.location
         prop.price = property_data.price
         prop.status = property_data.status
 
+        # Coordinates are optional: keep the stored ones unless sent (null clears them)
+        for field in ("latitude", "longitude"):
+            if field in property_data.model_fields_set:
+                setattr(prop, field, getattr(property_data, field))
+
         db.commit()
         db.refresh(prop)
 
+        if prop.location != old_location:
+            location_index.remove(old_location)
+            location_index.add(prop.location)
+
+        cache_generations.bump([prop.owner_id])
+
         return prop
         # ✅ SEARCH PROPERTIES
 
-    def search_properties(self, db, location=None, min_price=None, max_price=None):
+    def search_properties(self, db, location=None, min_price=None, max_price=None, q=None,
+                          status=None):
+        """
+        Search by free text (`q` over title + location) and/or `location`.
+        Uses the FTS5 index ranked by relevance when available,
+        falls back to LIKE scans otherwise. `status` is a comma separated
+        list of statuses to keep.
+        """
+        query = self._search_query(db, location, min_price, max_price, q, status).with_entities(
+            *self._property_columns())
 
-        query = db.query(Property)
+        return self._property_dicts(query)
+
+    def search_page(self, db, location=None, min_price=None, max_price=None, q=None,
+                    sort=None, after=None, limit=None, status=None):
+        """
+        One keyset page of search results in `sort` order (default id).
+        """
+        query = self._search_query(db, location, min_price, max_price, q, status).with_entities(
+            *self._property_columns())
+
+        return self._keyset_page(db, query.statement, sort, after, limit)
+
+    def search_with_facets(self, db, location=None, min_price=None, max_price=None, q=None,
+                           facets=None, facet_size=None, price_buckets=None,
+                           paged=False, sort=None, after=None, limit=None, status=None):
+        """
+        Search results (a keyset page if `paged`) plus facet counts for
+        the same filters.
+        """
+        # Facets first: invalid facet parameters fail before the item query
+        facet_counts = self.search_facets(
+            db, location, min_price, max_price, q, facets, facet_size, price_buckets, status)
+
+        if paged:
+            result = self.search_page(
+                db, location, min_price, max_price, q, sort, after, limit, status)
+        else:
+            result = {"items": self.search_properties(db, location, min_price, max_price, q, status)}
+
+        result["facets"] = facet_counts
+
+        return result
+
+    def search_facets(self, db, location=None, min_price=None, max_price=None, q=None,
+                      facets=None, facet_size=None, price_buckets=None, status=None):
+        """
+        Counts per status, top locations and price buckets (plus the price
+        range) of the rows matching the search filters, so UIs can render
+        filter options without the full catalogue.
+        `facets` is a comma separated subset of SEARCH_FACETS; all the
+        requested facets come from a single GROUP BY over the matches.
+        """
+        wanted = self._parse_facets(facets)
+        edges = self._parse_price_buckets(price_buckets)
+        facet_size = facet_size or settings.FACET_SIZE_DEFAULT
+
+        # Bucket i holds edges[i-1] <= price < edges[i]
+        bucket = case(
+            (Property.price.is_(None), None),
+            *((Property.price < edge, index) for index, edge in enumerate(edges)),
+            else_=len(edges)
+        )
+        keys = {"status": Property.status, "location": Property.location, "price": bucket}
+        group = [keys[name] for name in wanted]
+
+        rows = self._search_query(db, location, min_price, max_price, q, status).with_entities(
+            *group, func.count(), func.min(Property.price), func.max(Property.price)
+        ).order_by(None).group_by(*group).all()
+
+        total = 0
+        lowest = highest = None
+        counts = {name: Counter() for name in wanted}
+
+        for *values, count, row_min, row_max in rows:
+            total += count
 
-        if location:
+            for name, value in zip(wanted, values):
+                counts[name][value] += count
+
+            if row_min is not None:
+                lowest = row_min if lowest is None else min(lowest, row_min)
+                highest = row_max if highest is None else max(highest, row_max)
+
+        def ranked(counter, limit=None):
+            values = sorted(counter.items(), key=lambda item: (-item[1], str(item[0])))
+            return [{"value": value, "count": count} for value, count in values[:limit]]
+
+        result = {"total": total}
+
+        if "status" in counts:
+            result["status"] = ranked(counts["status"])
+
+        if "location" in counts:
+            result["location"] = ranked(counts["location"], facet_size)
+
+        if "price" in counts:
+            bounds = zip([None, *edges], [*edges, None])
+            result["price"] = {
+                "min": lowest,
+                "max": highest,
+                "buckets": [
+                    {"min": low, "max": high, "count": counts["price"].get(index, 0)}
+                    for index, (low, high) in enumerate(bounds)
+                ],
+            }
+
+        return result
+
+    @staticmethod
+    def _parse_facets(facets):
+        if not facets:
+            return list(SEARCH_FACETS)
+
+        names = {name.strip() for name in facets.split(",") if name.strip()}
+        unknown = names - set(SEARCH_FACETS)
+
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown facet(s): {', '.join(sorted(unknown))}; use {', '.join(SEARCH_FACETS)}")
+
+        return [name for name in SEARCH_FACETS if name in names]
+
+    @staticmethod
+    def _parse_statuses(status):
+        # "available, sold" -> ["available", "sold"]
+        return [value.strip() for value in (status or "").split(",") if value.strip()]
+
+    @staticmethod
+    def _parse_price_buckets(price_buckets):
+        if not price_buckets:
+            return list(settings.FACET_PRICE_BUCKETS)
+
+        try:
+            edges = [float(edge) for edge in price_buckets.split(",")]
+        except ValueError:
+            raise HTTPException(status_code=400, detail="price_buckets must be comma separated numbers")
+
+        if len(edges) > 50 or any(low >= high for low, high in zip(edges, edges[1:])):
+            raise HTTPException(
+                status_code=400, detail="price_buckets must be at most 50 increasing edges")
+
+        return edges
+
+    def iter_search_results(self, db, location=None, min_price=None, max_price=None, q=None,
+                            status=None, chunk_size=None):
+        """
+        Same filters as search_properties, but yields plain rows
+        `chunk_size` at a time from the DB cursor (used by /export).
+        """
+        query = self._search_query(db, location, min_price, max_price, q, status).with_entities(
+            *(getattr(Property, column) for column in EXPORT_COLUMNS))
+
+        for row in query.yield_per(chunk_size or settings.STREAM_CHUNK_SIZE):
+            yield row
+
+    def _search_query(self, db, location, min_price, max_price, q, status=None):
+        query = db.query(Property)
+        ranked = False
+
+        # FTS takes the inputs that contain a word; the rest (no index, or
+        # input like "***") keeps its LIKE filter rather than being dropped
+        fts_q = fts_location = None
+        if (location or q) and search_index.is_available(db):
+            fts_q = q if search_index.has_terms(q) else None
+            fts_location = location if search_index.has_terms(location) else None
+
+        match = search_index.match_expression(fts_q, fts_location)
+
+        if match:
+            query = query.join(
+                properties_fts, properties_fts.c.rowid == Property.id
+            ).filter(
+                literal_column(search_index.FTS_TABLE).match(match)
+            ).order_by(properties_fts.c.rank, Property.id)
+            ranked = True
+
+        if location and not fts_location:
             query = query.filter(Property.location.ilike(f"%{location}%"))
 
+        if q and not fts_q:
+            query = query.filter(or_(
+                Property.title.ilike(f"%{q}%"),
+                Property.location.ilike(f"%{q}%")
+            ))
+
         if min_price:
             query = query.filter(Property.price >= min_price)
 
         if max_price:
             query = query.filter(Property.price <= max_price)
 
-        return query.all()
+        statuses = self._parse_statuses(status)
+        if statuses:
+            query = query.filter(Property.status.in_(statuses))
+
+        if not ranked:
+            query = query.order_by(Property.id)
+
+        return query
+
+    def nearby_properties(self, db, lat, lon, radius_km, min_price=None, max_price=None,
+                          status=None, limit=None):
+        """
+        Properties within `radius_km` of (lat, lon), nearest first,
+        each with its `distance_km`.
+        """
+        return self._geo_search(
+            db, radius_bbox(lat, lon, radius_km), (lat, lon), radius_km,
+            min_price, max_price, status, limit)
+
+    def properties_within(self, db, bbox, min_price=None, max_price=None, status=None, limit=None):
+        """
+        Properties inside `bbox` ("min_lon,min_lat,max_lon,max_lat"),
+        ordered by distance from the box centre.
+        """
+        try:
+            box = parse_bbox(bbox)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid bbox: {e}")
+
+        min_lat, min_lon, max_lat, max_lon = box
+        centre = ((min_lat + max_lat) / 2, (min_lon + max_lon) / 2)
+
+        return self._geo_search(db, box, centre, None, min_price, max_price, status, limit)
+
+    def _geo_search(self, db, box, origin, radius_km, min_price, max_price, status, limit):
+        min_lat, min_lon, max_lat, max_lon = box
+
+        query = self._property_select().where(
+            Property.latitude.between(min_lat, max_lat),
+            Property.longitude.between(min_lon, max_lon),
+        )
+
+        # Candidates from the R*Tree; the exact bounds above still apply
+        # because R*Tree boxes are rounded outwards
+        if geo_index.is_available(db):
+            query = query.join(properties_geo, properties_geo.c.id == Property.id).where(
+                properties_geo.c.max_lat >= min_lat,
+                properties_geo.c.min_lat <= max_lat,
+                properties_geo.c.max_lon >= min_lon,
+                properties_geo.c.min_lon <= max_lon,
+            )
+
+        if min_price:
+            query = query.where(Property.price >= min_price)
+
+        if max_price:
+            query = query.where(Property.price <= max_price)
+
+        statuses = self._parse_statuses(status)
+        if statuses:
+            query = query.where(Property.status.in_(statuses))
+
+        limit = page_size(limit)
+
+        # Nearest candidates by squared equirectangular distance (shortest
+        # way around the antimeridian), so SQLite keeps a bounded top-N
+        # instead of every row in the box reaching Python
+        lat, lon = origin
+        delta_lon = func.abs(Property.longitude - lon)
+        delta_lon = func.min(delta_lon, 360 - delta_lon) * math.cos(math.radians(lat))
+        delta_lat = Property.latitude - lat
+        query = query.order_by(delta_lat * delta_lat + delta_lon * delta_lon, Property.id) \
+            .limit(limit * settings.GEO_CANDIDATE_FACTOR)
+
+        # Exact haversine refinement, nearest first
+        results = []
+        for item in self._property_dicts(db.execute(query)):
+            distance = haversine_km(lat, lon, item["latitude"], item["longitude"])
+
+            if radius_km is None or distance <= radius_km:
+                item["distance_km"] = round(distance, 3)
+                results.append(item)
+
+        results.sort(key=lambda item: (item["distance_km"], item["id"]))
+
+        return results[:limit]
+
+    def get_changes(self, db, since=0, limit=None):
+        """
+        Writes after version `since`, oldest first: the current row for
+        inserts / updates, a tombstone for deletes. The returned `version`
+        is the `since` of the next call.
+        """
+        if not change_log.is_available(db):
+            raise HTTPException(status_code=503, detail="Change feed not installed, run migrations")
+
+        limit = page_size(limit)
+
+        rows = db.execute(
+            select(
+                property_versions.c.property_id,
+                property_versions.c.version,
+                property_versions.c.deleted,
+                *self._property_columns()
+            )
+            .select_from(property_versions.outerjoin(
+                Property, Property.id == property_versions.c.property_id))
+            .where(property_versions.c.version > since)
+            .order_by(property_versions.c.version)
+            .limit(limit + 1)
+        ).all()
+
+        has_more = len(rows) > limit
+        changes = []
+
+        for property_id, version, deleted, *values in rows[:limit]:
+            deleted = bool(deleted) or values[0] is None
+            changes.append({
+                "id": property_id,
+                "version": version,
+                "deleted": deleted,
+                "property": None if deleted else dict(zip(PROPERTY_COLUMNS, values)),
+            })
+
+        return {
+            "changes": changes,
+            "version": changes[-1]["version"] if changes else since,
+            "has_more": has_more,
+        }
+
+    def suggest_locations(self, prefix, limit=10):
+        """
+        Typeahead for locations, served from the in-memory prefix index.
+        """
+        return location_index.suggest(prefix, limit)
+
+    def get_property(self, db, property_id):
+        row = db.execute(self._property_select().where(Property.id == property_id)).first()
+
+        if row is None:
+            raise HTTPException(status_code=404, detail="Property not found")
+
+        return self._property_dicts([row])[0]
 
     def get_all_properties(self, db):
-        properties = db.query(Property).all()
-
-        return [
-            {
-                "id": p.id,
-                "title": p.title,
-                "price": p.price,
-                "location": p.location,
-                "status": p.status,
-                "owner_id": p.owner_id
-            }
-            for p in properties
-        ]
+        return self._property_dicts(db.execute(self._property_select()))
+
+    def get_properties_page(self, db, after=None, limit=None, owner_id=None, sort=None):
+        """
+        Keyset pagination in `sort` order (id, price or -price; default id).
+        `after` is the opaque cursor returned as `next_cursor` by the previous page.
+        """
+        query = self._property_select()
+
+        if owner_id is not None:
+            query = query.where(Property.owner_id == owner_id)
+
+        return self._keyset_page(db, query, sort, after, limit)
+
+    def _keyset_page(self, db, stmt, sort, after, limit):
+        """
+        ORDER BY <sort key>, id LIMIT n over `stmt` (a select of
+        PROPERTY_COLUMNS), continuing after the cursor's row. The key and
+        id are compared as one row value so SQLite can seek
+        ix_properties_price_id instead of sorting.
+        Price sorts list the rows without a price last (by id, in the
+        same direction); their cursor then carries "price": null.
+        """
+        limit = page_size(limit)
+        sort = sort or "id"
+
+        if sort not in SORT_KEYS:
+            raise HTTPException(
+                status_code=400, detail=f"sort must be one of {', '.join(SORT_KEYS)}")
+
+        cursor = self._decode_sort_cursor(after, sort) if after else None
+        descending = sort.startswith("-")
+
+        # One extra row tells whether another page exists
+        wanted = limit + 1
+
+        if sort == "id":
+            rows = self._keyset_rows(
+                db, stmt, [Property.id], cursor and [cursor["id"]], descending, wanted)
+        else:
+            rows = []
+
+            if cursor is None or cursor["price"] is not None:
+                rows = self._keyset_rows(
+                    db, stmt.where(Property.price.isnot(None)), [Property.price, Property.id],
+                    cursor and [cursor["price"], cursor["id"]], descending, wanted)
+
+            # Priced rows ran out: continue with the unpriced ones
+            if len(rows) < wanted:
+                last = [cursor["id"]] if cursor and cursor["price"] is None else None
+                rows += self._keyset_rows(
+                    db, stmt.where(Property.price.is_(None)), [Property.id],
+                    last, descending, wanted - len(rows))
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        next_cursor = None
+        if has_more:
+            last_row = rows[-1]
+            next_cursor = encode_cursor(
+                {"id": last_row["id"]} if sort == "id"
+                else {"sort": sort, "price": last_row["price"], "id": last_row["id"]})
+
+        return {"items": rows, "next_cursor": next_cursor}
+
+    def _keyset_rows(self, db, stmt, columns, last, descending, limit):
+        """
+        Up to `limit` rows of `stmt` ordered by `columns`, after `last`
+        (their values in the previous row) when given.
+        """
+        if last is not None:
+            if len(columns) == 1:
+                key, value = columns[0], last[0]
+            else:
+                key, value = tuple_(*columns), tuple_(*last)
+
+            stmt = stmt.where(key < value if descending else key > value)
+
+        order = [column.desc() if descending else column for column in columns]
+
+        return self._property_dicts(db.execute(stmt.order_by(None).order_by(*order).limit(limit)))
+
+    @staticmethod
+    def _decode_sort_cursor(after, sort):
+        cursor = decode_cursor(after)
+
+        def is_number(value):
+            return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+        # id cursors predate sorting and carry no "sort" key
+        valid = cursor.get("sort", "id") == sort and isinstance(cursor.get("id"), int) \
+            and not isinstance(cursor.get("id"), bool)
+
+        if sort != "id":
+            valid = valid and "price" in cursor and (cursor["price"] is None or is_number(cursor["price"]))
+
+        if not valid:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        return cursor
+
+    def iter_properties(self, db, owner_id=None, chunk_size=None):
+        """
+        Yield properties one by one, fetching `chunk_size` rows at a time
+        from the DB cursor instead of loading the whole table.
+        """
+        stmt = self._property_select().order_by(Property.id).execution_options(
+            yield_per=chunk_size or settings.STREAM_CHUNK_SIZE)
+
+        if owner_id is not None:
+            stmt = stmt.where(Property.owner_id == owner_id)
+
+        for row in db.execute(stmt):
+            yield dict(zip(PROPERTY_COLUMNS, row))
+
+    # Read path: plain column tuples, no ORM instances / identity map
+
+    @staticmethod
+    def _property_columns():
+        return [getattr(Property, column) for column in PROPERTY_COLUMNS]
+
+    def _property_select(self):
+        return select(*self._property_columns())
+
+    @staticmethod
+    def _property_dicts(rows):
+        return [dict(zip(PROPERTY_COLUMNS, row)) for row in rows]
 
 
 property_service = PropertyService()
@@ -0,0 +1,60 @@
+"""
+Per-request auth overhead of get_current_user, with and without the
+verified-token cache.
+
+Usage:
+    python -m benchmarks.bench_auth [--iterations 20000]
+"""
+
+import argparse
+import json
+import time
+
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.core.security import create_access_token
+from app.core.token_cache import token_cache
+from app.dependencies.auth_dependency import get_current_user
+
+
+def time_per_call(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_auth")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    token = create_access_token({"id": 1, "email": "bench@example.com", "role": "agent"})
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    def authenticate():
+        get_current_user(credentials)
+
+    max_entries = token_cache.max_entries
+
+    # Before: every request verifies the signature
+    token_cache.max_entries = 0
+    uncached = time_per_call(authenticate, args.iterations)
+
+    # After: the same token is replayed, as the Streamlit app does
+    token_cache.max_entries = max_entries
+    token_cache.clear()
+    cached = time_per_call(authenticate, args.iterations)
+
+    print(json.dumps({
+        "benchmark": "get_current_user",
+        "iterations": args.iterations,
+        "uncached_us_per_request": round(uncached * 1e6, 2),
+        "cached_us_per_request": round(cached * 1e6, 2),
+        "speedup": round(uncached / cached, 1),
+        "cache": token_cache.stats(),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+Micro-benchmarks for every PropertyService / AuthService method,
+run directly against a seeded scratch database (no HTTP layer).
+
+Each call gets its own session, as a request would. Writes act on rows
+inserted untimed just before the call, so the seeded catalogue keeps its
+shape between runs. Password hashing dominates register/login, so those
+run fewer iterations.
+
+Usage:
+    python -m benchmarks.seed --db bench.db
+    python -m benchmarks.bench_services [--db bench.db] [--iterations 200] [--only search]
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import random
+import time
+
+from benchmarks.support import DEFAULT_DB, emit, summarize, use_database
+
+
+def run(fn, iterations, setup=None):
+    samples = []
+    for _ in range(iterations):
+        args = setup() if setup else ()
+        start = time.perf_counter()
+        fn(*args)
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_services")
+    parser.add_argument("--db", default=DEFAULT_DB)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--only", help="run benchmarks whose name contains this text")
+    parser.add_argument("--password", default=None, help="password the database was seeded with")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        parser.error(f"{args.db} not found; create it with python -m benchmarks.seed --db {args.db}")
+
+    use_database(args.db)
+
+    from sqlalchemy import func, insert, select
+
+    from app.core.database import SessionLocal, engine
+    from app.models.property_model import Property
+    from app.models.user_model import User
+    from app.schemas.property_schema import PropertyBulkDelete, PropertyBulkUpdate, PropertyCreate
+    from app.services.auth_service import auth_service
+    from app.services.location_index import location_index
+    from app.services.property_service import property_service
+    from benchmarks.seed import CITIES, CITY_CENTRES, DEFAULT_PASSWORD
+
+    rng = random.Random(args.seed)
+    password = args.password or DEFAULT_PASSWORD
+    emails = itertools.count()
+
+    with SessionLocal() as db:
+        total = db.scalar(select(func.count(Property.id)))
+        max_id = db.scalar(select(func.max(Property.id)))
+        admin = db.query(User).filter(User.role == "admin").first()
+        agent = db.query(User).filter(User.role == "agent").first()
+        location_index.rebuild(db)
+
+    if admin is None or agent is None or not total:
+        parser.error("database needs an admin, an agent and some properties (see benchmarks.seed)")
+
+    admin_user = {"id": admin.id, "email": admin.email, "role": admin.role}
+    agent_user = {"id": agent.id, "email": agent.email, "role": agent.role}
+
+    def listing():
+        city = rng.choice(CITIES)[0]
+        return {"title": f"Bench listing in {city}", "location": city,
+                "price": float(rng.randint(1_000_000, 30_000_000)), "status": "available"}
+
+    def scratch_ids(n):
+        # Untimed setup rows owned by the agent, removed by the timed call
+        with engine.begin() as conn:
+            rows = conn.execute(
+                insert(Property).returning(Property.id),
+                [{**listing(), "owner_id": agent_user["id"]} for _ in range(n)])
+            return [row.id for row in rows]
+
+    def random_ids(n):
+        return [rng.randint(1, max_id) for _ in range(n)]
+
+    def with_session(fn):
+        def call(*args):
+            with SessionLocal() as db:
+                return fn(db, *args)
+        return call
+
+    def consume(iterator_fn):
+        def call(db, *args):
+            for _ in iterator_fn(db, *args):
+                pass
+        return call
+
+    async def records(n):
+        for row in range(1, n + 1):
+            yield row, listing()
+
+    location = CITIES[3][0]
+    light = args.iterations
+    heavy = max(3, args.iterations // 20)
+    hashing = max(3, args.iterations // 40)
+
+    # (name, iterations, timed fn, untimed per-iteration setup)
+    benchmarks = [
+        ("PropertyService.create_property", light,
+         with_session(lambda db: property_service.create_property(
+             db, PropertyCreate(**listing()), agent_user)), None),
+        ("PropertyService.update_property", light,
+         with_session(lambda db, pid: property_service.update_property(
+             db, pid, PropertyCreate(**listing()), admin_user)),
+         lambda: (rng.randint(1, max_id),)),
+        ("PropertyService.delete_property", light,
+         with_session(lambda db, pid: property_service.delete_property(db, pid, agent_user)),
+         lambda: (scratch_ids(1)[0],)),
+        ("PropertyService.bulk_update[100 ids]", light,
+         with_session(lambda db, ids: property_service.bulk_update(
+             db, PropertyBulkUpdate(ids=ids, price_change_pct=0), admin_user)),
+         lambda: (random_ids(100),)),
+        ("PropertyService.bulk_delete[100 ids]", light,
+         with_session(lambda db, ids: property_service.bulk_delete(
+             db, PropertyBulkDelete(ids=ids), agent_user)),
+         lambda: (scratch_ids(100),)),
+        ("PropertyService.bulk_import[1000 rows]", heavy,
+         lambda: asyncio.run(property_service.bulk_import(records(1000), agent_user)), None),
+        ("PropertyService.get_my_properties", heavy,
+         with_session(lambda db: property_service.get_my_properties(db, agent_user)), None),
+        ("PropertyService.get_all_properties", max(3, heavy // 5),
+         with_session(property_service.get_all_properties), None),
+        ("PropertyService.get_properties_page", light,
+         with_session(property_service.get_properties_page), None),
+        ("PropertyService.get_properties_page[owner]", light,
+         with_session(lambda db: property_service.get_properties_page(
+             db, owner_id=agent_user["id"])), None),
+        ("PropertyService.iter_properties", max(3, heavy // 5),
+         with_session(consume(property_service.iter_properties)), None),
+        ("PropertyService.search_properties[location]", heavy,
+         with_session(lambda db: property_service.search_properties(db, location=location)), None),
+        ("PropertyService.search_properties[location+price]", heavy,
+         with_session(lambda db: property_service.search_properties(
+             db, location=location, min_price=5_000_000, max_price=8_000_000)), None),
+        ("PropertyService.search_properties[q]", heavy,
+         with_session(lambda db: property_service.search_properties(db, q="penthouse lakeside")), None),
+        ("PropertyService.iter_search_results[location]", heavy,
+         with_session(consume(lambda db: property_service.iter_search_results(
+             db, location=location))), None),
+        ("PropertyService.nearby_properties[5 km]", heavy,
+         with_session(lambda db: property_service.nearby_properties(
+             db, *CITY_CENTRES[location], 5)), None),
+        ("PropertyService.properties_within[bbox]", heavy,
+         with_session(lambda db: property_service.properties_within(
+             db, "73.80,18.45,73.90,18.55", status="available")), None),
+        ("PropertyService.property_stats", light,
+         with_session(property_service.property_stats), None),
+        ("PropertyService.suggest_locations", light,
+         lambda: property_service.suggest_locations("Pu"), None),
+        ("AuthService.register_user", hashing,
+         with_session(lambda db: auth_service.register_user(
+             db, f"bench-register-{time.time_ns()}-{next(emails)}@example.com", password, "agent")),
+         None),
+        ("AuthService.login_user", hashing,
+         with_session(lambda db: auth_service.login_user(db, agent_user["email"], password)), None),
+        ("AuthService.get_user_by_email", light,
+         with_session(lambda db: auth_service.get_user_by_email(db, agent_user["email"])), None),
+        ("AuthService.issue_token", light,
+         lambda: auth_service.issue_token(agent), None),
+    ]
+
+    results = {}
+    for name, iterations, fn, setup in benchmarks:
+        if args.only and args.only not in name:
+            continue
+        results[name] = run(fn, iterations, setup)
+
+    engine.dispose()
+
+    emit({
+        "benchmark": "services",
+        "database": os.path.abspath(args.db),
+        "properties": total,
+        "results": results,
+    }, args.output)
+
+
+if __name__ == "__main__":
+    main()
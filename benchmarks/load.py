@@ -0,0 +1,244 @@
+"""
+End-to-end load driver: replays a mixed workload against the ASGI `app`
+in-process (httpx ASGITransport, no sockets) at a given concurrency.
+
+Operations and default weights:
+    list    GET  /properties/?limit=50, following next_cursor per worker
+    search  GET  /properties/search with a random city and price band
+    stats   GET  /properties/stats
+    create  POST /properties/
+    update  PUT  /properties/{id} (admin, random seeded id)
+    login   POST /auth/login
+    nearby  GET  /properties/nearby within 5 km of a city centre (off by default)
+
+Reports p50/p95/p99 and throughput per operation and overall, plus the
+mean DB time taken from the Server-Timing header.
+
+Usage:
+    python -m benchmarks.seed --db bench.db
+    python -m benchmarks.load [--db bench.db] [--concurrency 16] [--requests 5000]
+                              [--mix list=40,search=25,stats=15,create=8,update=10,login=2]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import os
+import random
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+
+from benchmarks.support import DEFAULT_DB, emit, summarize, use_database
+
+
+DEFAULT_MIX = {"list": 40, "search": 25, "stats": 15, "create": 8, "update": 10, "login": 2}
+OPERATIONS = (*DEFAULT_MIX, "nearby")
+
+_DB_TIMING = re.compile(r"db;dur=([\d.]+)")
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"unknown operation {name!r}")
+        try:
+            mix[name] = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"bad weight for {name!r}: {weight!r}")
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+
+class Workload:
+
+    def __init__(self, client, rng, tokens, credentials, centres, max_id):
+        self.client = client
+        self.rng = rng
+        self.tokens = tokens
+        self.credentials = credentials
+        self.centres = centres
+        self.cities = list(centres)
+        self.max_id = max_id
+
+    def _auth(self, role="agent"):
+        return {"Authorization": f"Bearer {self.rng.choice(self.tokens[role])}"}
+
+    def _listing(self):
+        city = self.rng.choice(self.cities)
+        return {"title": f"Load test listing in {city}", "location": city,
+                "price": float(self.rng.randint(1_000_000, 30_000_000)), "status": "available"}
+
+    async def list(self, state):
+        params = {"limit": 50}
+        if state.get("cursor"):
+            params["after"] = state["cursor"]
+        response = await self.client.get("/properties/", params=params, headers=self._auth())
+        if response.status_code == 200:
+            state["cursor"] = response.json().get("next_cursor")
+        return response
+
+    async def search(self, state):
+        low = self.rng.randint(1, 20) * 1_000_000
+        return await self.client.get("/properties/search", params={
+            "location": self.rng.choice(self.cities),
+            "min_price": low,
+            "max_price": low + 5_000_000,
+        })
+
+    async def stats(self, state):
+        return await self.client.get("/properties/stats")
+
+    async def create(self, state):
+        return await self.client.post("/properties/", json=self._listing(), headers=self._auth())
+
+    async def update(self, state):
+        return await self.client.put(
+            f"/properties/{self.rng.randint(1, self.max_id)}",
+            json=self._listing(), headers=self._auth("admin"))
+
+    async def nearby(self, state):
+        lat, lon = self.centres[self.rng.choice(self.cities)]
+        return await self.client.get("/properties/nearby", params={
+            "lat": lat, "lon": lon, "radius_km": 5, "limit": 20,
+        })
+
+    async def login(self, state):
+        email, password = self.rng.choice(self.credentials)
+        return await self.client.post("/auth/login", json={"email": email, "password": password})
+
+
+async def drive(args, mix):
+    import httpx
+    from sqlalchemy import func, select
+
+    from app.core.database import SessionLocal
+    from app.main import app
+    from app.models.property_model import Property
+    from app.models.user_model import User
+    from benchmarks.seed import CITY_CENTRES, DEFAULT_PASSWORD
+
+    password = args.password or DEFAULT_PASSWORD
+    rng = random.Random(args.seed)
+    names, weights = zip(*mix.items())
+
+    samples = defaultdict(list)
+    db_ms = defaultdict(float)
+    statuses = defaultdict(Counter)
+    errors = Counter()
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+
+    async with app.router.lifespan_context(app), \
+            httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        with SessionLocal() as db:
+            max_id = db.scalar(select(func.max(Property.id)))
+            admins = db.scalars(select(User.email).where(User.role == "admin").limit(1)).all()
+            agents = db.scalars(select(User.email).where(User.role == "agent").limit(args.users)).all()
+
+        if not (max_id and admins and agents):
+            raise SystemExit("database needs an admin, agents and properties (see benchmarks.seed)")
+
+        # Untimed: one token per account used by the workload
+        tokens = {"admin": [], "agent": []}
+        for role, emails in (("admin", admins), ("agent", agents)):
+            for email in emails:
+                response = await client.post("/auth/login", json={"email": email, "password": password})
+                if response.status_code != 200:
+                    raise SystemExit(f"login failed for {email}: {response.status_code} {response.text}")
+                tokens[role].append(response.json()["access_token"])
+
+        workload = Workload(
+            client, rng, tokens, [(email, password) for email in agents],
+            CITY_CENTRES, max_id)
+
+        budget = {"remaining": args.warmup + args.requests}
+        deadline = time.perf_counter() + args.duration if args.duration else None
+
+        async def worker():
+            state = {}
+            while budget["remaining"] > 0 and (deadline is None or time.perf_counter() < deadline):
+                budget["remaining"] -= 1
+                record = budget["remaining"] < args.requests
+                name = rng.choices(names, weights=weights)[0]
+
+                start = time.perf_counter()
+                try:
+                    response = await getattr(workload, name)(state)
+                except Exception as e:
+                    if record:
+                        errors[f"{name}: {e.__class__.__name__}"] += 1
+                    continue
+                elapsed = time.perf_counter() - start
+
+                if record:
+                    samples[name].append(elapsed)
+                    statuses[name][response.status_code] += 1
+                    match = _DB_TIMING.search(response.headers.get("server-timing", ""))
+                    if match:
+                        db_ms[name] += float(match.group(1))
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+
+    operations = {}
+    for name in names:
+        if not samples[name]:
+            continue
+        operations[name] = {
+            **summarize(samples[name], elapsed),
+            "mean_db_ms": round(db_ms[name] / len(samples[name]), 3),
+            "status": {str(code): n for code, n in sorted(statuses[name].items())},
+        }
+
+    everything = [s for name in names for s in samples[name]]
+
+    return {
+        "benchmark": "load",
+        "database": os.path.abspath(args.db),
+        "db_async": os.environ.get("DB_ASYNC", "false"),
+        "concurrency": args.concurrency,
+        "mix": mix,
+        "elapsed_s": round(elapsed, 3),
+        "overall": summarize(everything, elapsed),
+        "operations": operations,
+        "errors": dict(errors),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load")
+    parser.add_argument("--db", default=DEFAULT_DB)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=5000, help="timed requests")
+    parser.add_argument("--warmup", type=int, default=200, help="untimed requests first")
+    parser.add_argument("--duration", type=float, default=None,
+                        help="stop after this many seconds even if requests remain")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX)
+    parser.add_argument("--users", type=int, default=8, help="agent accounts to spread load over")
+    parser.add_argument("--password", default=None, help="password the database was seeded with")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        parser.error(f"{args.db} not found; create it with python -m benchmarks.seed --db {args.db}")
+    if not args.mix:
+        parser.error("--mix needs at least one operation with a positive weight")
+
+    use_database(args.db)
+
+    # Startup banners go to stderr so stdout stays valid JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        report = asyncio.run(drive(args, args.mix))
+
+    emit(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Seed a scratch SQLite database with synthetic users and listings.
+
+Distributions are deterministic for a given --seed, so runs are comparable:
+- locations follow a Zipf-like popularity curve (a few big cities dominate)
+- prices are log-normal around a per-city base price
+- status is mostly "available", with "sold" / "rented" tails
+- coordinates scatter normally (~7 km) around the city centre
+
+Every user gets the password from --password (hashed once).
+Accounts are bench-user-<n>@example.com; the first --admins are admins,
+the rest agents.
+
+Usage:
+    python -m benchmarks.seed [--db bench.db] [--users 100] [--properties 50000]
+"""
+
+import argparse
+import os
+import random
+import time
+
+from benchmarks.support import DEFAULT_DB, emit, use_database
+
+
+# (city, base price) — base is the median listing price
+CITIES = [
+    ("Mumbai", 25_000_000), ("Delhi", 18_000_000), ("Bangalore", 14_000_000),
+    ("Pune", 9_000_000), ("Hyderabad", 8_500_000), ("Chennai", 8_000_000),
+    ("Kolkata", 6_500_000), ("Ahmedabad", 5_500_000), ("Gurgaon", 16_000_000),
+    ("Noida", 7_500_000), ("Jaipur", 4_500_000), ("Kochi", 5_000_000),
+    ("Chandigarh", 7_000_000), ("Lucknow", 4_000_000), ("Indore", 3_800_000),
+    ("Nagpur", 3_500_000), ("Goa", 9_500_000), ("Mysore", 3_200_000),
+    ("Coimbatore", 3_600_000), ("Bhopal", 3_000_000),
+]
+# City centres (lat, lon); listings scatter a few km around them
+CITY_CENTRES = {
+    "Mumbai": (19.076, 72.878), "Delhi": (28.614, 77.209), "Bangalore": (12.972, 77.595),
+    "Pune": (18.520, 73.857), "Hyderabad": (17.385, 78.487), "Chennai": (13.083, 80.271),
+    "Kolkata": (22.573, 88.364), "Ahmedabad": (23.023, 72.571), "Gurgaon": (28.459, 77.027),
+    "Noida": (28.535, 77.391), "Jaipur": (26.912, 75.787), "Kochi": (9.931, 76.267),
+    "Chandigarh": (30.734, 76.779), "Lucknow": (26.847, 80.947), "Indore": (22.720, 75.858),
+    "Nagpur": (21.146, 79.088), "Goa": (15.299, 74.124), "Mysore": (12.296, 76.639),
+    "Coimbatore": (11.017, 76.956), "Bhopal": (23.260, 77.413),
+}
+NEIGHBOURHOODS = ["Central", "North", "South", "East", "West", "Old Town", "Lakeside", "Hills"]
+KINDS = ["Apartment", "Villa", "Studio", "Penthouse", "Row House", "Independent House"]
+STATUSES = [("available", 0.7), ("sold", 0.2), ("rented", 0.1)]
+
+DEFAULT_PASSWORD = "bench-password"
+BATCH_SIZE = 5000
+
+
+def user_email(n):
+    return f"bench-user-{n}@example.com"
+
+
+def generate_properties(rng, count, owner_ids):
+    city_weights = [1 / (rank + 1) for rank in range(len(CITIES))]
+    statuses, status_weights = zip(*STATUSES)
+
+    for _ in range(count):
+        city, base = rng.choices(CITIES, weights=city_weights)[0]
+        bedrooms = rng.randint(1, 5)
+        kind = rng.choice(KINDS)
+        price = base * rng.lognormvariate(0, 0.45) * (0.6 + 0.2 * bedrooms)
+        lat, lon = CITY_CENTRES[city]
+
+        yield {
+            "title": f"{bedrooms} BHK {kind} in {rng.choice(NEIGHBOURHOODS)} {city}",
+            "location": city,
+            "price": round(price, -3),
+            "status": rng.choices(statuses, weights=status_weights)[0],
+            "owner_id": rng.choice(owner_ids),
+            "latitude": round(rng.gauss(lat, 0.06), 6),
+            "longitude": round(rng.gauss(lon, 0.06), 6),
+        }
+
+
+def _remove_scratch(path):
+    if os.path.abspath(path) == os.path.abspath("property.db"):
+        raise SystemExit("Refusing to overwrite property.db; pick a scratch file")
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+def seed(db_path, users, properties, admins=1, password=DEFAULT_PASSWORD, seed=42):
+    """
+    (Re)create `db_path` and fill it. Must run before `app` is imported
+    elsewhere in the process. Returns a summary dict.
+    """
+    _remove_scratch(db_path)
+    use_database(db_path)
+    # 5000-row batches are slow by design; don't flood the slow-query log
+    os.environ.setdefault("SLOW_QUERY_MS", "60000")
+
+    from sqlalchemy import insert
+
+    from app.core.database import engine
+    from app.core.migrations import analyze_database, run_migrations
+    from app.core.security import hash_password
+    from app.models.property_model import Property
+    from app.models.user_model import User
+
+    rng = random.Random(seed)
+    started = time.perf_counter()
+
+    run_migrations(engine, analyze=False)
+
+    password_hash = hash_password(password)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [
+            {
+                "email": user_email(n),
+                "password": password_hash,
+                "role": "admin" if n < admins else "agent",
+            }
+            for n in range(users)
+        ])
+        owner_ids = [row.id for row in conn.execute(User.__table__.select())]
+
+    # FTS, R*Tree and status-counter triggers fire on these inserts, as in production
+    batch = []
+    for row in generate_properties(rng, properties, owner_ids):
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            with engine.begin() as conn:
+                conn.execute(insert(Property), batch)
+            batch = []
+    if batch:
+        with engine.begin() as conn:
+            conn.execute(insert(Property), batch)
+
+    analyze_database(engine)
+    engine.dispose()
+
+    return {
+        "database": os.path.abspath(db_path),
+        "users": users,
+        "admins": min(admins, users),
+        "properties": properties,
+        "seed": seed,
+        "seconds": round(time.perf_counter() - started, 2),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.seed")
+    parser.add_argument("--db", default=DEFAULT_DB)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--admins", type=int, default=1)
+    parser.add_argument("--properties", type=int, default=50000)
+    parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    if args.users < 1:
+        parser.error("--users must be at least 1")
+
+    emit(seed(args.db, args.users, args.properties, args.admins, args.password, args.seed))
+
+
+if __name__ == "__main__":
+    main()
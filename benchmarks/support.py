@@ -0,0 +1,62 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Settings are read when `app` is first imported, so scripts call
+`use_database()` before importing anything from `app`.
+"""
+
+import json
+import math
+import os
+import sys
+
+
+DEFAULT_DB = "bench.db"
+
+
+def use_database(path):
+    """Point the app at a scratch SQLite file (must run before importing app)."""
+    if "app.core.config" in sys.modules:
+        raise RuntimeError("use_database() must be called before importing app")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.abspath(path)}"
+    # Keep benchmark output clean; timings still land in the JSON report
+    os.environ.setdefault("ACCESS_LOG_SAMPLE_RATE", "0")
+
+
+def percentile(sorted_samples, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_samples:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def summarize(samples, elapsed=None):
+    """
+    Latency summary (milliseconds) for a list of durations in seconds.
+    Throughput is per wall-clock `elapsed` if given, else per total busy time.
+    """
+    ordered = sorted(samples)
+    total = elapsed if elapsed is not None else sum(ordered)
+
+    def ms(value):
+        return None if value is None else round(value * 1000, 3)
+
+    return {
+        "count": len(ordered),
+        "mean_ms": ms(sum(ordered) / len(ordered)) if ordered else None,
+        "p50_ms": ms(percentile(ordered, 50)),
+        "p95_ms": ms(percentile(ordered, 95)),
+        "p99_ms": ms(percentile(ordered, 99)),
+        "max_ms": ms(ordered[-1]) if ordered else None,
+        "throughput_per_s": round(len(ordered) / total, 1) if total else None,
+    }
+
+
+def emit(report, output=None):
+    """Print the JSON report and optionally save it for comparison between runs."""
+    text = json.dumps(report, indent=2)
+    print(text)
+    if output:
+        with open(output, "w") as fh:
+            fh.write(text + "\n")
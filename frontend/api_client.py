@@ -1,5 +1,19 @@
+import asyncio
+import json
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Idempotent methods are retried on these statuses (and on connection errors)
+RETRY_STATUSES = (502, 503, 504)
+RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
 
 
 class APIError(Exception):
@@ -9,20 +23,87 @@ class APIError(Exception):
         self.detail = detail
 
 
-class APIClient:
-    def __init__(self, base_url: str | None = None):
+class _ETagCache:
+    """
+    Bounded LRU of GET responses by (path, params, token), kept with
+    their ETag so repeat requests can be revalidated with If-None-Match.
+    A 304 answer then costs no body transfer and no JSON parsing, and
+    returns the cached object itself: treat results as read-only.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()   # key -> (etag, data)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, etag: str, data):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (etag, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def record(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class _BaseClient:
+    """
+    Endpoint methods shared by APIClient and AsyncAPIClient. Each one
+    returns `self._request(...)`: the result for APIClient, an awaitable
+    of it for AsyncAPIClient.
+    """
+
+    def __init__(self, base_url: str | None, cache_size: int):
         base = base_url or os.getenv(
             "PROPERTY_PORTAL_API_URL", "http://127.0.0.1:8000")
         self.base_url = base.rstrip("/")
+        self.cache = _ETagCache(cache_size)
 
-    def _request(self, method: str, path: str, token: str | None = None, **kwargs):
-        url = f"{self.base_url}{path}"
+    def _prepare(self, method: str, path: str, token: str | None, kwargs: dict):
+        """Build the headers; for a GET, also the cache key and any cached entry to revalidate."""
         headers = kwargs.pop("headers", {}) or {}
         if token:
             headers["Authorization"] = f"Bearer {token}"
 
-        res = requests.request(
-            method, url, headers=headers, timeout=20, **kwargs)
+        key = cached = None
+        if method == "GET":
+            params = kwargs.get("params") or {}
+            key = (path, tuple(sorted(params.items())), token)
+            cached = self.cache.get(key)
+            if cached is not None:
+                headers["If-None-Match"] = cached[0]
+
+        return headers, key, cached
+
+    def _handle(self, res, key, cached):
+        """Turn a requests/httpx response into its JSON body, or raise APIError."""
+        if res.status_code == 304 and cached is not None:
+            self.cache.record(True)
+            return cached[1]
 
         if res.status_code >= 400:
             try:
@@ -35,7 +116,15 @@ class APIClient:
             return None
 
         # FastAPI usually returns JSON
-        return res.json()
+        data = res.json()
+
+        if key is not None:
+            self.cache.record(False)
+            etag = res.headers.get("ETag")
+            if etag:
+                self.cache.put(key, etag, data)
+
+        return data
 
     # ---------- Auth ----------
     def register(self, email: str, password: str, role: str):
@@ -59,37 +148,319 @@ class APIClient:
     def my_properties(self, token: str):
         return self._request("GET", "/properties/my-properties", token=token)
 
-    def search_properties(self, location: str | None = None, min_price: float | None = None, max_price: float | None = None):
+    def list_properties_page(self, token: str, after: str | None = None, limit: int | None = None,
+                             sort: str | None = None):
+        params = self._page_params(after, limit)
+        if sort:
+            params["sort"] = sort
+        return self._request("GET", "/properties/", token=token, params=params)
+
+    def my_properties_page(self, token: str, after: str | None = None, limit: int | None = None):
+        return self._request(
+            "GET", "/properties/my-properties", token=token, params=self._page_params(after, limit))
+
+    @staticmethod
+    def _page_params(after: str | None, limit: int | None):
         params = {}
+        if after:
+            params["after"] = after
+        if limit is not None:
+            params["limit"] = limit
+        return params
+
+    def get_property(self, token: str, property_id: int):
+        return self._request("GET", f"/properties/{property_id}", token=token)
+
+    def search_properties(self, location: str | None = None, min_price: float | None = None, max_price: float | None = None,
+                          q: str | None = None, statuses: list[str] | None = None, sort: str | None = None,
+                          after: str | None = None, limit: int | None = None, facets: str | None = None):
+        """
+        Matching properties: a list, or {"items", "next_cursor"} once
+        sort / after / limit is given, plus "facets" when asked for.
+        """
+        params = self._page_params(after, limit)
         if location:
             params["location"] = location
         if min_price is not None:
             params["min_price"] = min_price
         if max_price is not None:
             params["max_price"] = max_price
+        if q:
+            params["q"] = q
+        if statuses:
+            params["status"] = ",".join(statuses)
+        if sort:
+            params["sort"] = sort
+        if facets:
+            params["facets"] = facets
 
         return self._request("GET", "/properties/search", params=params)
 
-    def create_property(self, token: str, title: str, location: str, price: float, status: str = "available"):
+    def create_property(self, token: str, title: str, location: str, price: float, status: str = "available",
+                        latitude: float | None = None, longitude: float | None = None):
         return self._request(
             "POST",
             "/properties/",
             token=token,
             json={"title": title, "location": location,
-                  "price": price, "status": status},
+                  "price": price, "status": status,
+                  **self._coordinates(latitude, longitude)},
         )
 
-    def update_property(self, token: str, property_id: int, title: str, location: str, price: float, status: str):
+    def update_property(self, token: str, property_id: int, title: str, location: str, price: float, status: str,
+                        latitude: float | None = None, longitude: float | None = None):
+        """Coordinates left as None are not sent, so the stored ones are kept."""
         return self._request(
             "PUT",
             f"/properties/{property_id}",
             token=token,
             json={"title": title, "location": location,
-                  "price": price, "status": status},
+                  "price": price, "status": status,
+                  **self._coordinates(latitude, longitude)},
         )
 
+    @staticmethod
+    def _coordinates(latitude: float | None, longitude: float | None):
+        coordinates = {}
+        if latitude is not None:
+            coordinates["latitude"] = latitude
+        if longitude is not None:
+            coordinates["longitude"] = longitude
+        return coordinates
+
     def delete_property(self, token: str, property_id: int):
         return self._request("DELETE", f"/properties/{property_id}", token=token)
 
     def stats(self):
         return self._request("GET", "/properties/stats")
+
+    # ---------- Change feed ----------
+    def changes(self, token: str, since: int = 0, limit: int | None = None):
+        params = {"since": since}
+        if limit is not None:
+            params["limit"] = limit
+        return self._request("GET", "/properties/changes", token=token, params=params)
+
+
+class APIClient(_BaseClient):
+    """
+    Blocking client on one pooled keep-alive `requests.Session`, shared
+    by every call (and safe to share between threads). Idempotent
+    requests are retried with backoff on connection errors and 502/503/504.
+    """
+
+    def __init__(self, base_url: str | None = None, pool_size: int = 10, retries: int = 3,
+                 timeout: float = 20, cache_size: int = 256):
+        super().__init__(base_url, cache_size)
+        self.timeout = timeout
+        self.pool_size = pool_size
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=0.2,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=RETRY_METHODS,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _request(self, method: str, path: str, token: str | None = None, **kwargs):
+        headers, key, cached = self._prepare(method, path, token, kwargs)
+
+        res = self.session.request(
+            method, f"{self.base_url}{path}", headers=headers, timeout=self.timeout, **kwargs)
+
+        return self._handle(res, key, cached)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def fetch_many(self, calls: dict):
+        """
+        Run several zero-argument calls concurrently over the pool, e.g.
+        `api.fetch_many({"props": lambda: api.list_properties(token), "stats": api.stats})`.
+        Returns {name: result}; the first failure is raised.
+        """
+        if not calls:
+            return {}
+
+        workers = min(len(calls), self.pool_size)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {name: executor.submit(call) for name, call in calls.items()}
+            return {name: future.result() for name, future in futures.items()}
+
+    def iter_properties(self, token: str, page_size: int = 200):
+        """Yield every property, one page at a time."""
+        return self._iter_pages(self.list_properties_page, token, page_size)
+
+    def iter_my_properties(self, token: str, page_size: int = 200):
+        """Yield every property owned by the current user, one page at a time."""
+        return self._iter_pages(self.my_properties_page, token, page_size)
+
+    @staticmethod
+    def _iter_pages(fetch_page, token: str, page_size: int):
+        after = None
+        while True:
+            page = fetch_page(token, after=after, limit=page_size)
+            yield from page["items"]
+
+            after = page.get("next_cursor")
+            if not after:
+                return
+
+    def stream_changes(self, token: str, since: int | None = None):
+        """Yield change events from the SSE stream (blocks; runs until the connection drops)."""
+        params = {} if since is None else {"since": since}
+        url = f"{self.base_url}/properties/changes/stream"
+        headers = {"Authorization": f"Bearer {token}", "Accept": "text/event-stream"}
+
+        with self.session.get(url, headers=headers, params=params, stream=True, timeout=(10, None)) as res:
+            if res.status_code >= 400:
+                raise APIError(res.status_code, res.text)
+
+            event, data = "message", []
+            for line in res.iter_lines(decode_unicode=True):
+                if line:
+                    field, _, value = line.partition(":")
+                    if field == "event":
+                        event = value.strip()
+                    elif field == "data":
+                        data.append(value.lstrip())
+                    continue
+
+                # Blank line ends an event
+                if event == "change" and data:
+                    yield json.loads("\n".join(data))
+                event, data = "message", []
+
+    def property_mirror(self, token: str):
+        """Local copy of the catalogue, kept current from the change feed."""
+        return PropertyMirror(self, token)
+
+
+class AsyncAPIClient(_BaseClient):
+    """
+    asyncio client (httpx) for batch scripts driving the API at high
+    concurrency. Same endpoint methods as APIClient, awaited; up to
+    `pool_size` connections are kept alive and shared by every task.
+    """
+
+    def __init__(self, base_url: str | None = None, pool_size: int = 100, retries: int = 3,
+                 timeout: float = 20, cache_size: int = 256, transport=None):
+        super().__init__(base_url, cache_size)
+        self.retries = retries
+
+        limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            # The transport retries failed connects; statuses are retried in _request
+            transport=transport or httpx.AsyncHTTPTransport(retries=retries, limits=limits),
+        )
+
+    async def _request(self, method: str, path: str, token: str | None = None, **kwargs):
+        headers, key, cached = self._prepare(method, path, token, kwargs)
+
+        attempt = 0
+        while True:
+            res = await self.client.request(method, path, headers=headers, **kwargs)
+
+            if res.status_code in RETRY_STATUSES and method in RETRY_METHODS and attempt < self.retries:
+                await asyncio.sleep(0.2 * 2 ** attempt)
+                attempt += 1
+                continue
+
+            return self._handle(res, key, cached)
+
+    async def aclose(self):
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def fetch_many(self, calls: dict):
+        """
+        Await several calls concurrently, e.g.
+        `await api.fetch_many({"props": api.list_properties(token), "stats": api.stats()})`.
+        Returns {name: result}; the first failure is raised.
+        """
+        results = await asyncio.gather(*calls.values())
+        return dict(zip(calls, results))
+
+    async def iter_properties(self, token: str, page_size: int = 200):
+        """Yield every property, one page at a time."""
+        async for item in self._iter_pages(self.list_properties_page, token, page_size):
+            yield item
+
+    async def iter_my_properties(self, token: str, page_size: int = 200):
+        """Yield every property owned by the current user, one page at a time."""
+        async for item in self._iter_pages(self.my_properties_page, token, page_size):
+            yield item
+
+    @staticmethod
+    async def _iter_pages(fetch_page, token: str, page_size: int):
+        after = None
+        while True:
+            page = await fetch_page(token, after=after, limit=page_size)
+            for item in page["items"]:
+                yield item
+
+            after = page.get("next_cursor")
+            if not after:
+                return
+
+
+class PropertyMirror:
+    """
+    Local {id: property} copy of the catalogue. `sync()` pulls only the
+    changes since the last sync; `follow()` applies live SSE updates.
+    """
+
+    def __init__(self, client: APIClient, token: str):
+        self.client = client
+        self.token = token
+        self.items = {}
+        self.version = 0
+
+    def apply(self, change: dict):
+        if change["deleted"]:
+            self.items.pop(change["id"], None)
+        else:
+            self.items[change["id"]] = change["property"]
+        self.version = max(self.version, change["version"])
+
+    def sync(self, page_size: int = 500):
+        """Apply every change since the last sync; returns how many were applied."""
+        applied = 0
+        while True:
+            page = self.client.changes(self.token, since=self.version, limit=page_size)
+            for change in page["changes"]:
+                self.apply(change)
+            applied += len(page["changes"])
+            self.version = max(self.version, page["version"])
+
+            if not page["has_more"]:
+                return applied
+
+    def follow(self):
+        """Catch up, then apply (and yield) live changes as they arrive."""
+        self.sync()
+        for change in self.client.stream_changes(self.token, since=self.version):
+            self.apply(change)
+            yield change
+
+    def values(self):
+        return list(self.items.values())
@@ -81,7 +81,15 @@ if "api_url" not in st.session_state:
     st.session_state.api_url = os.getenv(
         "PROPERTY_PORTAL_API_URL", "http://127.0.0.1:8000")
 
-api = APIClient(st.session_state.api_url)
+
+
+@st.cache_resource
+def get_client(api_url: str) -> APIClient:
+    # One pooled client per URL, reused across reruns and sessions
+    return APIClient(api_url)
+
+
+api = get_client(st.session_state.api_url)
 
 
 def api_error_box(e: APIError):
@@ -95,6 +103,99 @@ def as_df(data):
     return pd.DataFrame()
 
 
+# ===== CACHED SERVER-SIDE QUERIES =====
+# Filtering, sorting and paging run in the API; a session holds one page.
+# Results are shared between sessions for CACHE_TTL seconds, keyed on
+# the arguments (filters, cursor, token), and dropped after our writes.
+CACHE_TTL = 30
+PAGE_SIZES = [25, 50, 100, 200]
+SORT_LABELS = {"id": "Newest id last", "price": "Price: low to high", "-price": "Price: high to low"}
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def load_overview(api_url: str):
+    """Status counts, plus status options and price bounds of the whole catalogue."""
+    client = get_client(api_url)
+    return client.fetch_many({
+        "stats": client.stats,
+        "facets": lambda: client.search_properties(facets="status,price", limit=1)["facets"],
+    })
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def load_search_page(api_url: str, location: str | None, q: str | None, statuses: tuple | None,
+                     min_price: float | None, max_price: float | None, sort: str,
+                     after: str | None, limit: int):
+    return get_client(api_url).search_properties(
+        location=location, min_price=min_price, max_price=max_price, q=q,
+        statuses=list(statuses) if statuses else None, sort=sort, after=after, limit=limit)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def load_list_page(api_url: str, token: str, sort: str, after: str | None, limit: int):
+    return get_client(api_url).list_properties_page(token, after=after, limit=limit, sort=sort)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def load_my_page(api_url: str, token: str, after: str | None, limit: int):
+    return get_client(api_url).my_properties_page(token, after=after, limit=limit)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def load_property(api_url: str, token: str, property_id: int):
+    return get_client(api_url).get_property(token, property_id)
+
+
+def paged_table(key: str, filters: tuple, fetch, height: int = 360):
+    """
+    One page of `fetch(after)` with Previous / Next buttons. The cursor
+    stack lives in session state and restarts when `filters` change.
+    """
+    state = st.session_state.setdefault(key, {"filters": None, "cursors": [None]})
+    if state["filters"] != filters:
+        state["filters"] = filters
+        state["cursors"] = [None]
+
+    try:
+        page = fetch(state["cursors"][-1])
+    except APIError as e:
+        api_error_box(e)
+        return None
+
+    st.dataframe(as_df(page["items"]), use_container_width=True, height=height)
+
+    prev_col, info_col, next_col = st.columns((1, 2, 1))
+    with prev_col:
+        if st.button("Previous", key=f"{key}_prev", disabled=len(state["cursors"]) == 1):
+            state["cursors"].pop()
+            st.rerun()
+    with info_col:
+        st.caption(f"Page {len(state['cursors'])} · {len(page['items'])} rows")
+    with next_col:
+        if st.button("Next", key=f"{key}_next", disabled=not page.get("next_cursor")):
+            state["cursors"].append(page["next_cursor"])
+            st.rerun()
+
+    return page
+
+
+def after_write(message: str, result):
+    """
+    Drop cached pages (they may include the changed row) and keep the
+    outcome for show_write_result(), since the caller reruns the script.
+    """
+    st.cache_data.clear()
+    st.session_state.write_result = (message, result)
+
+
+def show_write_result():
+    if "write_result" in st.session_state:
+        message, result = st.session_state.pop("write_result")
+        st.success(message)
+        if result is not None:
+            st.json(result)
+
+
 # ===== SIDEBAR NAV =====
 st.sidebar.image(
     "https://dummyimage.com/80x24/2563eb/ffffff&text=TMS",
@@ -120,7 +221,7 @@ st.sidebar.markdown("### API")
 st.session_state.api_url = st.sidebar.text_input(
     "FastAPI URL", value=st.session_state.api_url
 ).strip()
-api = APIClient(st.session_state.api_url)
+api = get_client(st.session_state.api_url)
 
 if st.session_state.token:
     st.sidebar.success(f"Logged in:\n{st.session_state.email}")
@@ -179,20 +280,7 @@ if not st.session_state.token:
 token = st.session_state.token
 
 # ===== COMMON DATA LOADS =====
-all_props = []
-stats = {}
-
-try:
-    all_props = api.list_properties(token)
-    stats = api.stats()
-except APIError as e:
-    api_error_box(e)
-    st.stop()
-
-df_all = as_df(all_props)
-
-if "price" in df_all.columns:
-    df_all["price"] = pd.to_numeric(df_all["price"], errors="coerce")
+api_url = st.session_state.api_url
 
 # ===== HELPER: STATUS COLORS =====
 
@@ -212,13 +300,19 @@ def status_chip(status: str) -> str:
 if page == "Dashboard":
     st.title("Dashboard")
 
-    total_properties = len(df_all)
-    total_available = int((df_all["status"].str.lower(
-    ) == "available").sum()) if "status" in df_all.columns else 0
-    total_sold = int((df_all["status"].str.lower() ==
-                     "sold").sum()) if "status" in df_all.columns else 0
-    total_rented = int((df_all["status"].str.lower() == "rented").sum(
-    )) if "status" in df_all.columns else 0
+    try:
+        overview = load_overview(api_url)
+    except APIError as e:
+        api_error_box(e)
+        st.stop()
+
+    stats, facets = overview["stats"], overview["facets"]
+    counts = {str(k).lower(): v for k, v in stats.items()}
+
+    total_properties = sum(stats.values())
+    total_available = counts.get("available", 0)
+    total_sold = counts.get("sold", 0)
+    total_rented = counts.get("rented", 0)
 
     c1, c2, c3, c4 = st.columns(4)
     with c1:
@@ -275,48 +369,45 @@ if page == "Dashboard":
         with f1:
             q = st.text_input("Search title/location", placeholder="e.g. Pune")
         with f2:
-            if "status" in df_all.columns:
-                status_options = sorted(
-                    df_all["status"].dropna().unique().tolist())
-            else:
-                status_options = []
+            status_options = sorted(
+                row["value"] for row in facets.get("status", []) if row["value"])
             status_filter = st.multiselect(
                 "Status", status_options, default=status_options)
         with f3:
-            if "price" in df_all.columns and df_all["price"].notna().any():
-                pmin = float(df_all["price"].min())
-                pmax = float(df_all["price"].max())
-                # Only show slider if we have a valid range (min < max)
-                if pmin < pmax:
-                    price_range = st.slider(
-                        "Price range", min_value=pmin, max_value=pmax, value=(pmin, pmax))
-                else:
-                    # If all prices are the same (or 0), use a default range or disable
-                    st.info(f"All prices: ${pmin:,.0f}")
-                    price_range = None
-            else:
+            price = facets.get("price") or {}
+            pmin, pmax = price.get("min"), price.get("max")
+            if pmin is None:
                 st.info("No price data")
                 price_range = None
+            # Only show slider if we have a valid range (min < max)
+            elif pmin < pmax:
+                price_range = st.slider(
+                    "Price range", min_value=float(pmin), max_value=float(pmax),
+                    value=(float(pmin), float(pmax)))
+            else:
+                # If all prices are the same (or 0), use a default range or disable
+                st.info(f"All prices: ${pmin:,.0f}")
+                price_range = None
 
-        df_view = df_all.copy()
-
-        if q:
-            mask = False
-            for col in [c for c in ["title", "location"] if c in df_view.columns]:
-                mask = mask | df_view[col].astype(
-                    str).str.contains(q, case=False, na=False)
-            df_view = df_view[mask]
-
-        if status_filter and "status" in df_view.columns:
-            df_view = df_view[df_view["status"].isin(status_filter)]
-
-        if price_range is not None and "price" in df_view.columns:
-            df_view = df_view[
-                (df_view["price"] >= price_range[0]) & (
-                    df_view["price"] <= price_range[1])
-            ]
-
-        st.dataframe(df_view, use_container_width=True, height=360)
+        s1, s2 = st.columns(2)
+        with s1:
+            sort = st.selectbox("Sort", list(SORT_LABELS), format_func=SORT_LABELS.get)
+        with s2:
+            page_size = st.selectbox("Rows per page", PAGE_SIZES, index=1)
+
+        # Full selections filter nothing: leave them out of the query
+        statuses = tuple(status_filter) if set(status_filter) != set(status_options) else None
+        min_price = max_price = None
+        if price_range is not None:
+            if price_range[0] > pmin:
+                min_price = price_range[0]
+            if price_range[1] < pmax:
+                max_price = price_range[1]
+
+        filters = (q.strip() or None, statuses, min_price, max_price, sort, page_size)
+        paged_table(
+            "dashboard_pages", filters,
+            lambda after: load_search_page(api_url, None, *filters[:5], after, page_size))
         st.markdown("</div>", unsafe_allow_html=True)
 
     # --- right: stats from /properties/stats ---
@@ -338,17 +429,24 @@ if page == "Dashboard":
 # ===== ALL PROPERTIES (SIMPLE TABLE) =====
 elif page == "All Properties":
     st.title("All Properties")
-    st.dataframe(df_all, use_container_width=True, height=520)
+
+    s1, s2 = st.columns(2)
+    with s1:
+        sort = st.selectbox("Sort", list(SORT_LABELS), format_func=SORT_LABELS.get)
+    with s2:
+        page_size = st.selectbox("Rows per page", PAGE_SIZES, index=1)
+
+    paged_table(
+        "all_pages", (sort, page_size),
+        lambda after: load_list_page(api_url, token, sort, after, page_size), height=520)
 
 # ===== MY PROPERTIES =====
 elif page == "My Properties":
     st.title("My Properties")
-    try:
-        my_props = api.my_properties(token)
-        df_my = as_df(my_props)
-        st.dataframe(df_my, use_container_width=True, height=520)
-    except APIError as e:
-        api_error_box(e)
+    page_size = st.selectbox("Rows per page", PAGE_SIZES, index=1)
+    paged_table(
+        "my_pages", (page_size,),
+        lambda after: load_my_page(api_url, token, after, page_size), height=520)
 
 # ===== SEARCH (USES /properties/search PUBLIC ENDPOINT) =====
 elif page == "Search":
@@ -366,21 +464,26 @@ elif page == "Search":
     with c4:
         run = st.button("Search", type="primary")
 
+    # Kept across reruns, so paging doesn't need the button pressed again
     if run:
-        try:
-            result = api.search_properties(
-                location=location or None,
-                min_price=min_price if min_price > 0 else None,
-                max_price=max_price if max_price > 0 else None,
-            )
-            df_search = as_df(result)
-            st.dataframe(df_search, use_container_width=True, height=520)
-        except APIError as e:
-            api_error_box(e)
+        st.session_state.search_filters = (
+            location or None,
+            min_price if min_price > 0 else None,
+            max_price if max_price > 0 else None,
+        )
+
+    if st.session_state.get("search_filters"):
+        s_location, s_min, s_max = st.session_state.search_filters
+        paged_table(
+            "search_pages", st.session_state.search_filters,
+            lambda after: load_search_page(
+                api_url, s_location, None, None, s_min, s_max, "id", after, PAGE_SIZES[1]),
+            height=520)
 
 # ===== MANAGE (CREATE / UPDATE / DELETE) =====
 elif page == "Manage (CRUD)":
     st.title("Manage Properties (Create / Update / Delete)")
+    show_write_result()
 
     left, right = st.columns((1.1, 1.4), gap="large")
 
@@ -404,8 +507,7 @@ elif page == "Manage (CRUD)":
                     price=float(price),
                     status=status,
                 )
-                st.success("Created")
-                st.json(res)
+                after_write("Created", res)
                 st.rerun()
             except APIError as e:
                 api_error_box(e)
@@ -416,14 +518,22 @@ elif page == "Manage (CRUD)":
         st.markdown(
             '<div class="pp-panel"><div class="pp-panel-title">Update / Delete</div>', unsafe_allow_html=True)
 
-        if df_all.empty or "id" not in df_all.columns:
-            st.info("No properties available.")
+        pid = st.number_input("Property id", min_value=1, step=1, value=None,
+                              placeholder="e.g. 42")
+
+        row = None
+        if pid is not None:
+            try:
+                row = load_property(api_url, token, int(pid))
+            except APIError as e:
+                if e.status_code == 404:
+                    st.info(f"No property with id {int(pid)}.")
+                else:
+                    api_error_box(e)
+
+        if row is None:
             st.markdown("</div>", unsafe_allow_html=True)
         else:
-            pid = st.selectbox("Select property (by id)",
-                               df_all["id"].tolist())
-            row = df_all[df_all["id"] == pid].iloc[0].to_dict()
-
             st.markdown("#### Selected")
             st.write(row)
 
@@ -436,7 +546,7 @@ elif page == "Manage (CRUD)":
                     "Price",
                     min_value=0.0,
                     step=1000.0,
-                    value=float(row.get("price", 0.0)),
+                    value=float(row.get("price") or 0.0),
                 )
                 u_status = st.selectbox(
                     "Status",
@@ -458,9 +568,10 @@ elif page == "Manage (CRUD)":
                         u_location,
                         float(u_price),
                         u_status,
+                        latitude=row.get("latitude"),
+                        longitude=row.get("longitude"),
                     )
-                    st.success("Updated")
-                    st.json(res)
+                    after_write("Updated", res)
                     st.rerun()
                 except APIError as e:
                     api_error_box(e)
@@ -468,8 +579,7 @@ elif page == "Manage (CRUD)":
             if st.button("Delete Property", type="secondary"):
                 try:
                     res = api.delete_property(token, int(pid))
-                    st.success("Deleted")
-                    st.json(res)
+                    after_write("Deleted", res)
                     st.rerun()
                 except APIError as e:
                     api_error_box(e)
@@ -0,0 +1,98 @@
+"""
+Shared fixtures: the app on a fresh SQLite file per test session.
+
+Settings are read and engines built when `app` is first imported, so
+the environment is set here, before any test module imports it.
+Tests share the database: each one works on its own users and a
+location of its own (`unique_location`) instead of assuming it's empty.
+"""
+
+import os
+import tempfile
+import uuid
+
+import pytest
+
+_tmp = tempfile.mkdtemp(prefix="property-portal-tests-")
+
+os.environ.update({
+    "DATABASE_URL": f"sqlite:///{os.path.join(_tmp, 'test.db')}",
+    "ACCESS_LOG_SAMPLE_RATE": "0",
+    "PRICE_ANALYTICS_REFRESH_SECONDS": "0",
+    "SLOW_QUERY_MS": "60000",
+    # Cheap hashes: login speed isn't what these tests measure
+    "ARGON2_TIME_COST": "1",
+    "ARGON2_MEMORY_COST_KIB": "1024",
+    "ARGON2_PARALLELISM": "1",
+})
+
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    # Entering the client runs the lifespan: migrations, indexes, background tasks
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def make_user(client):
+    def make(role="agent"):
+        email = f"{role}-{uuid.uuid4().hex[:12]}@example.com"
+        credentials = {"email": email, "password": "test-password"}
+
+        response = client.post("/auth/register", json={**credentials, "role": role})
+        assert response.status_code == 200, response.text
+
+        response = client.post("/auth/login", json=credentials)
+        assert response.status_code == 200, response.text
+
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    return make
+
+
+@pytest.fixture
+def agent(make_user):
+    return make_user("agent")
+
+
+@pytest.fixture
+def admin(make_user):
+    return make_user("admin")
+
+
+@pytest.fixture
+def unique_location():
+    return f"Testville {uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def create_property(client, unique_location):
+    def create(headers, **fields):
+        body = {
+            "title": "Test listing",
+            "location": unique_location,
+            "price": 1_000_000.0,
+            "status": "available",
+            **fields,
+        }
+        response = client.post("/properties/", json=body, headers=headers)
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    return create
+
+
+@pytest.fixture
+def db_session(client):
+    from app.core.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
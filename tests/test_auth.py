@@ -0,0 +1,78 @@
+import asyncio
+import threading
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.database import SessionLocal
+from app.core.hashing import HashingExecutor, password_hashing
+from app.services.auth_service import auth_service
+
+
+def login_cost(client, email, password):
+    """Status of a login and how many password verifies it ran."""
+    before = password_hashing.completed
+    response = client.post("/auth/login", json={"email": email, "password": password})
+    return response.status_code, password_hashing.completed - before
+
+
+def test_unknown_email_costs_a_verify_like_a_wrong_password(client):
+    email = f"known-{uuid.uuid4().hex[:12]}@example.com"
+    client.post("/auth/register", json={"email": email, "password": "right-password", "role": "agent"})
+
+    wrong_password = login_cost(client, email, "wrong-password")
+    unknown_email = login_cost(client, f"nobody-{uuid.uuid4().hex[:12]}@example.com", "wrong-password")
+
+    assert wrong_password == unknown_email == (401, 1)
+
+
+def test_sync_login_verifies_for_unknown_email(client, monkeypatch):
+    import app.services.auth_service as module
+
+    calls = []
+    monkeypatch.setattr(module, "verify_dummy_password", lambda password: calls.append(password) or False)
+
+    with SessionLocal() as db, pytest.raises(HTTPException) as excinfo:
+        auth_service.login_user(db, f"nobody-{uuid.uuid4().hex[:12]}@example.com", "secret")
+
+    assert excinfo.value.status_code == 401
+    assert calls == ["secret"]
+
+
+def test_failed_and_cancelled_hashes_are_not_counted_as_completed():
+    executor = HashingExecutor(concurrency=1, queue_depth=1)
+    release = threading.Event()
+
+    def fail():
+        raise ValueError("bad hash")
+
+    async def scenario():
+        assert await executor._submit(lambda: "ok") == "ok"
+
+        with pytest.raises(ValueError):
+            await executor._submit(fail)
+
+        slow = asyncio.ensure_future(executor._submit(release.wait))
+        await asyncio.sleep(0.05)
+        slow.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await slow
+        release.set()
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+    stats = executor.stats()
+    assert (stats["completed"], stats["failed"], stats["cancelled"]) == (1, 1, 1)
+    assert stats["in_flight"] == 0
+
+
+def test_hashing_stats_are_only_on_metrics(client):
+    assert client.get("/auth/hashing/stats").status_code == 404
+
+    metrics = client.get("/metrics").text
+    assert 'password_hashing{stat="failed"}' in metrics
+    assert 'password_hashing{stat="cancelled"}' in metrics
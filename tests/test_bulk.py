@@ -0,0 +1,75 @@
+import pytest
+
+
+def rows_at(client, location):
+    response = client.get("/properties/search", params={"location": location})
+    return {item["id"]: (item["price"], item["status"]) for item in response.json()}
+
+
+def test_agent_bulk_update_by_filter_touches_only_own_rows(
+        client, make_user, create_property, unique_location):
+    owner, other = make_user(), make_user()
+    mine = create_property(owner)["id"]
+    theirs = create_property(other)["id"]
+
+    response = client.patch("/properties/bulk", headers=owner, json={
+        "filter": {"location": unique_location}, "status": "sold"})
+
+    assert response.status_code == 200
+    assert response.json() == {"updated": 1}
+
+    rows = rows_at(client, unique_location)
+    assert rows[mine][1] == "sold"
+    assert rows[theirs][1] == "available"
+
+
+def test_agent_bulk_update_by_ids_skips_others_rows(client, make_user, create_property, unique_location):
+    owner, other = make_user(), make_user()
+    mine = create_property(owner, price=100.0)["id"]
+    theirs = create_property(other, price=100.0)["id"]
+
+    response = client.patch("/properties/bulk", headers=owner, json={
+        "ids": [mine, theirs, 999_999_999], "price_change_pct": 10})
+
+    assert response.json() == {"updated": 1, "skipped_ids": [theirs, 999_999_999]}
+
+    rows = rows_at(client, unique_location)
+    assert rows[mine][0] == pytest.approx(110.0)
+    assert rows[theirs][0] == 100.0
+
+
+def test_agent_bulk_delete_skips_others_rows(client, make_user, create_property, unique_location):
+    owner, other = make_user(), make_user()
+    mine = create_property(owner)["id"]
+    theirs = create_property(other)["id"]
+
+    response = client.request("DELETE", "/properties/bulk", headers=owner, json={
+        "ids": [mine, theirs]})
+
+    assert response.json() == {"deleted": 1, "skipped_ids": [theirs]}
+    assert set(rows_at(client, unique_location)) == {theirs}
+
+
+def test_admin_bulk_delete_by_filter_reaches_every_owner(
+        client, make_user, admin, create_property, unique_location):
+    create_property(make_user())
+    create_property(make_user())
+
+    response = client.request("DELETE", "/properties/bulk", headers=admin, json={
+        "filter": {"location": unique_location}})
+
+    assert response.json() == {"deleted": 2}
+    assert rows_at(client, unique_location) == {}
+
+
+def test_bulk_without_selection_is_rejected(client, admin):
+    assert client.patch("/properties/bulk", headers=admin, json={"status": "sold"}).status_code == 400
+    assert client.request("DELETE", "/properties/bulk", headers=admin, json={}).status_code == 400
+    assert client.request("DELETE", "/properties/bulk", headers=admin, json={"ids": []}).status_code == 400
+
+
+def test_bulk_requires_credentials(client):
+    response = client.request("DELETE", "/properties/bulk", json={"ids": [1]})
+
+    # HTTPBearer answers a missing Authorization header with 403
+    assert response.status_code == 403
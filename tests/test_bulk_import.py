@@ -0,0 +1,125 @@
+import asyncio
+import json
+
+import pytest
+
+from app.core.streaming import RecordError, iter_csv_records, iter_ndjson_records
+
+
+def parse(iterate, text, chunk_size):
+    """Run a record iterator over `text` sent in `chunk_size`-byte chunks."""
+    data = text.encode()
+
+    async def chunks():
+        for start in range(0, len(data), chunk_size):
+            yield data[start:start + chunk_size]
+
+    async def collect():
+        return [
+            (row, record.message if isinstance(record, RecordError) else record)
+            async for row, record in iterate(chunks())]
+
+    return asyncio.run(collect())
+
+
+CHUNK_SIZES = [1, 7, 4096]
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_csv_quote_inside_unquoted_field_is_literal(chunk_size):
+    text = 'title,location,price\nFlat with 12" tiles,Pune,10\nPlain,Goa,20\n'
+
+    assert parse(iter_csv_records, text, chunk_size) == [
+        (1, {"title": 'Flat with 12" tiles', "location": "Pune", "price": "10"}),
+        (2, {"title": "Plain", "location": "Goa", "price": "20"}),
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_csv_quoted_field_spans_lines(chunk_size):
+    text = 'title,location,price\r\n"Two\nlines, ""quoted""",Delhi,20\r\n\r\nLast,Goa,\r\n'
+
+    assert parse(iter_csv_records, text, chunk_size) == [
+        (1, {"title": 'Two\nlines, "quoted"', "location": "Delhi", "price": "20"}),
+        # Empty cells are dropped so schema defaults apply
+        (2, {"title": "Last", "location": "Goa"}),
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_csv_unterminated_record_at_eof_is_an_error(chunk_size):
+    text = 'title,location,price\nPlain,Goa,20\n"Never closed,Goa,30\nx,y,1'
+
+    assert parse(iter_csv_records, text, chunk_size) == [
+        (1, {"title": "Plain", "location": "Goa", "price": "20"}),
+        (2, "Invalid CSV: unexpected end of data"),
+    ]
+
+
+def test_csv_bad_rows_are_reported_and_parsing_continues():
+    text = 'title,location,price\nA,Goa,1,extra\n"B"x,Goa,2\nC,Goa,3\n'
+
+    assert parse(iter_csv_records, text, 4096) == [
+        (1, "Expected 3 columns, got 4"),
+        (2, "Invalid CSV: ',' expected after '\"'"),
+        (3, {"title": "C", "location": "Goa", "price": "3"}),
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_ndjson_records_and_errors(chunk_size):
+    text = '{"title": "A"}\n\n"hello"\n[1, 2]\nnot json\n{"title": "B"}'
+
+    rows = parse(iter_ndjson_records, text, chunk_size)
+
+    assert rows[0] == (1, {"title": "A"})
+    assert rows[1] == (2, "Expected a JSON object")
+    assert rows[2] == (3, "Expected a JSON object")
+    assert rows[3][0] == 4 and rows[3][1].startswith("Invalid JSON")
+    assert rows[4] == (5, {"title": "B"})
+
+
+def bulk(client, headers, body, content_type, **params):
+    response = client.post(
+        "/properties/bulk", content=body, params=params,
+        headers={**headers, "Content-Type": content_type})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def locations_count(client, location):
+    return len(client.get("/properties/search", params={"location": location}).json())
+
+
+def test_csv_import_reports_every_row(client, agent, unique_location):
+    body = (
+        "title,location,price\n"
+        f'Flat with 12" tiles,{unique_location},10\n'
+        f'"Two\nlines",{unique_location},20\n'
+        f"No price,{unique_location},\n"
+        f'"Never closed,{unique_location},30\n')
+
+    result = bulk(client, agent, body, "text/csv", batch_size=1)
+
+    assert result["inserted"] == 2
+    assert result["failed"] == 2
+    assert [error["row"] for error in result["errors"]] == [3, 4]
+    assert result["errors"][1]["error"] == "Invalid CSV: unexpected end of data"
+    assert locations_count(client, unique_location) == 2
+
+
+def test_ndjson_import_reports_every_row(client, agent, unique_location):
+    lines = [
+        {"title": "A", "location": unique_location, "price": 1},
+        "hello",
+        {"title": "B", "location": unique_location},
+        {"title": "C", "location": unique_location, "price": 3},
+    ]
+    body = "\n".join(json.dumps(line) for line in lines)
+
+    result = bulk(client, agent, body, "application/x-ndjson")
+
+    assert result["inserted"] == 2
+    assert result["errors"][0] == {"row": 2, "error": "Expected a JSON object"}
+    assert result["errors"][1]["row"] == 3
+    assert locations_count(client, unique_location) == 2
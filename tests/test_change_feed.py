@@ -0,0 +1,80 @@
+import pytest
+
+from app.core import change_log
+from app.core.database import SessionLocal
+
+
+@pytest.fixture
+def since(client):
+    """The latest version before the test's own writes."""
+    with SessionLocal() as db:
+        return change_log.latest_version(db)
+
+
+def changes(client, headers, since, **params):
+    response = client.get("/properties/changes", params={"since": since, **params}, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_changes_after_since_in_version_order(client, agent, create_property, since):
+    first = create_property(agent)["id"]
+    second = create_property(agent)["id"]
+
+    result = changes(client, agent, since)
+
+    assert [change["id"] for change in result["changes"]] == [first, second]
+    assert [change["version"] for change in result["changes"]] == [since + 1, since + 2]
+    assert result["version"] == since + 2
+    assert result["has_more"] is False
+    assert result["changes"][0]["property"]["id"] == first
+
+
+def test_since_latest_version_is_empty(client, agent, create_property, since):
+    create_property(agent)
+    latest = changes(client, agent, since)["version"]
+
+    result = changes(client, agent, latest)
+
+    assert result == {"changes": [], "version": latest, "has_more": False}
+
+
+def test_property_appears_once_with_its_last_write(client, agent, create_property, since):
+    prop = create_property(agent, title="Draft")
+    client.put(f"/properties/{prop['id']}", headers=agent,
+               json={"title": "Final", "location": prop["location"], "price": prop["price"]})
+
+    result = changes(client, agent, since)
+
+    assert [change["id"] for change in result["changes"]] == [prop["id"]]
+    assert result["changes"][0]["version"] == since + 2
+    assert result["changes"][0]["property"]["title"] == "Final"
+
+
+def test_delete_is_a_tombstone(client, agent, create_property, since):
+    prop = create_property(agent)
+    client.delete(f"/properties/{prop['id']}", headers=agent)
+
+    result = changes(client, agent, since)
+
+    assert result["changes"] == [
+        {"id": prop["id"], "version": since + 2, "deleted": True, "property": None}]
+
+
+def test_paging_with_limit_resumes_from_returned_version(client, agent, create_property, since):
+    created = [create_property(agent)["id"] for _ in range(5)]
+
+    seen, version = [], since
+    while True:
+        result = changes(client, agent, version, limit=2)
+        seen += [change["id"] for change in result["changes"]]
+        version = result["version"]
+        if not result["has_more"]:
+            break
+
+    assert seen == created
+    assert version == since + 5
+
+
+def test_changes_require_authentication(client):
+    assert client.get("/properties/changes").status_code == 403
@@ -0,0 +1,78 @@
+import pytest
+
+
+def facets(client, **params):
+    response = client.get("/properties/search", params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+@pytest.fixture
+def priced_listings(agent, create_property):
+    """Five listings around the edges 100 and 200; one sold."""
+    for price, status in [(50, "available"), (100, "available"), (199.99, "available"),
+                          (200, "sold"), (500, "available")]:
+        create_property(agent, price=price, status=status)
+
+
+def test_status_and_price_counts(client, priced_listings, unique_location):
+    result = facets(client, location=unique_location, facets="status,price", price_buckets="100,200")
+
+    assert len(result["items"]) == 5
+    assert result["facets"]["total"] == 5
+    assert result["facets"]["status"] == [
+        {"value": "available", "count": 4}, {"value": "sold", "count": 1}]
+    # Bucket edges are inclusive below, exclusive above
+    assert result["facets"]["price"] == {
+        "min": 50,
+        "max": 500,
+        "buckets": [
+            {"min": None, "max": 100, "count": 1},
+            {"min": 100, "max": 200, "count": 2},
+            {"min": 200, "max": None, "count": 2},
+        ],
+    }
+    assert "location" not in result["facets"]
+
+
+def test_facets_follow_the_search_filters(client, priced_listings, unique_location):
+    result = facets(client, location=unique_location, facets="status,price",
+                    price_buckets="100,200", status="available", max_price=300)
+
+    assert result["facets"]["total"] == 3
+    assert result["facets"]["status"] == [{"value": "available", "count": 3}]
+    assert [bucket["count"] for bucket in result["facets"]["price"]["buckets"]] == [1, 2, 0]
+
+
+def test_location_facet_is_ranked_and_capped(client, agent, create_property, unique_location):
+    for suffix, count in [("A", 3), ("B", 1), ("C", 2)]:
+        for _ in range(count):
+            create_property(agent, location=f"{unique_location} {suffix}")
+
+    result = facets(client, q=unique_location, facets="location", facet_size=2)
+
+    assert result["facets"]["location"] == [
+        {"value": f"{unique_location} A", "count": 3},
+        {"value": f"{unique_location} C", "count": 2},
+    ]
+
+
+def test_paged_search_with_facets(client, priced_listings, unique_location):
+    result = facets(client, location=unique_location, facets="status", sort="price", limit=2)
+
+    assert [item["price"] for item in result["items"]] == [50, 100]
+    assert result["next_cursor"]
+    assert result["facets"]["total"] == 5
+
+
+@pytest.mark.parametrize("params", [
+    {"facets": "price", "price_buckets": "100,abc"},
+    {"facets": "price", "price_buckets": "200,100"},
+    {"facets": "price", "price_buckets": "100,100"},
+    {"facets": "price", "price_buckets": ",".join(str(edge) for edge in range(51))},
+    {"facets": "status,colour"},
+])
+def test_bad_facet_parameters_are_rejected(client, params):
+    response = client.get("/properties/search", params=params)
+
+    assert response.status_code == 400
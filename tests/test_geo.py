@@ -0,0 +1,76 @@
+from app.core.config import settings
+
+PUNE = (18.520, 73.857)
+
+
+def nearby(client, radius_km, centre=PUNE, **params):
+    return client.get("/properties/nearby", params={
+        "lat": centre[0], "lon": centre[1], "radius_km": radius_km, **params})
+
+
+def test_nearby_orders_by_distance_within_radius(client, agent, create_property):
+    far = create_property(agent, latitude=18.60, longitude=73.857)["id"]        # ~8.9 km
+    near = create_property(agent, latitude=18.53, longitude=73.857)["id"]       # ~1.1 km
+    outside = create_property(agent, latitude=19.076, longitude=72.878)["id"]   # Mumbai
+
+    items = nearby(client, 10, limit=100).json()
+    ids = [item["id"] for item in items]
+
+    assert ids.index(near) < ids.index(far)
+    assert outside not in ids
+    assert [item["distance_km"] for item in items] == sorted(item["distance_km"] for item in items)
+    assert all(item["distance_km"] <= 10 for item in items)
+
+
+def test_nearby_limit_keeps_the_closest(client, agent, create_property):
+    # A centre no other test uses; listings spread out north of it, created farthest first
+    centre = (-33.9, 151.2)
+    created = [create_property(agent, latitude=centre[0] + step / 1000, longitude=centre[1])["id"]
+               for step in range(9, 0, -1)]
+
+    items = nearby(client, 2, centre, limit=3).json()
+
+    assert [item["id"] for item in items] == created[::-1][:3]
+
+
+def test_radius_is_capped(client):
+    assert nearby(client, settings.GEO_MAX_RADIUS_KM).status_code == 200
+    assert nearby(client, settings.GEO_MAX_RADIUS_KM + 1).status_code == 422
+
+
+def test_update_without_coordinates_keeps_them(client, agent, create_property):
+    prop = create_property(agent, latitude=PUNE[0], longitude=PUNE[1])
+
+    response = client.put(f"/properties/{prop['id']}", headers=agent, json={
+        "title": "Renamed", "location": prop["location"], "price": prop["price"]})
+
+    assert response.status_code == 200
+    assert (response.json()["latitude"], response.json()["longitude"]) == PUNE
+    assert prop["id"] in [item["id"] for item in nearby(client, 1, limit=100).json()]
+
+
+def test_update_with_coordinates_moves_the_property(client, agent, create_property):
+    prop = create_property(agent, latitude=PUNE[0], longitude=PUNE[1])
+
+    response = client.put(f"/properties/{prop['id']}", headers=agent, json={
+        "title": prop["title"], "location": prop["location"], "price": prop["price"],
+        "latitude": 19.076, "longitude": 72.878})
+
+    assert (response.json()["latitude"], response.json()["longitude"]) == (19.076, 72.878)
+    assert prop["id"] not in [item["id"] for item in nearby(client, 1, limit=100).json()]
+
+
+def test_status_list_filters_nearby_and_within(client, agent, create_property):
+    centre = (48.85, 2.35)
+    ids = {
+        status: create_property(agent, status=status, latitude=centre[0], longitude=centre[1])["id"]
+        for status in ("available", "sold", "rented")}
+    params = {"status": "available, sold", "limit": 100}
+
+    near = nearby(client, 1, centre, **params).json()
+    within = client.get("/properties/within", params={
+        "bbox": f"{centre[1] - 0.01},{centre[0] - 0.01},{centre[1] + 0.01},{centre[0] + 0.01}", **params}).json()
+
+    expected = sorted([ids["available"], ids["sold"]])
+    assert sorted(item["id"] for item in near) == expected
+    assert sorted(item["id"] for item in within) == expected
@@ -0,0 +1,81 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from sqlalchemy import text
+
+from app.core.database import create_db_engine, engine
+from app.core.migrations import MIGRATIONS, run_migrations, schema_report
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Migrates the DATABASE_URL database and prints what it applied
+WORKER = """
+import json
+import app.models.user_model, app.models.property_model
+from app.core.database import engine
+from app.core.migrations import run_migrations
+print(json.dumps(run_migrations(engine, analyze=False)))
+"""
+
+
+def test_rerun_applies_nothing(tmp_path):
+    db_engine = create_db_engine(f"sqlite:///{tmp_path / 'fresh.db'}")
+    try:
+        first = run_migrations(db_engine)
+        second = run_migrations(db_engine)
+        report = schema_report(db_engine)
+    finally:
+        db_engine.dispose()
+
+    assert [version for version, _ in first] == [version for version, _, _ in MIGRATIONS]
+    assert second == []
+    assert report["pending"] == []
+    assert "ix_properties_price_id" in report["indexes"]["properties"]
+
+
+def test_app_database_is_already_current(client):
+    assert run_migrations(engine) == []
+
+
+def test_rerun_keeps_data_and_derived_tables(tmp_path):
+    db_engine = create_db_engine(f"sqlite:///{tmp_path / 'data.db'}")
+    try:
+        run_migrations(db_engine)
+        with db_engine.begin() as conn:
+            conn.execute(text(
+                "INSERT INTO properties (title, location, price, status) "
+                "VALUES ('Lake view flat', 'Pune', 5000000, 'available')"))
+
+        run_migrations(db_engine)
+
+        with db_engine.connect() as conn:
+            fts = conn.execute(text(
+                "SELECT count(*) FROM properties_fts WHERE properties_fts MATCH 'lake'")).scalar()
+            versions = conn.execute(text("SELECT count(*) FROM property_versions")).scalar()
+            applied = conn.execute(text("SELECT count(*) FROM schema_migrations")).scalar()
+    finally:
+        db_engine.dispose()
+
+    assert (fts, versions, applied) == (1, 1, len(MIGRATIONS))
+
+
+def test_concurrent_workers_apply_each_migration_once(tmp_path):
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{tmp_path / 'race.db'}")
+
+    workers = [
+        subprocess.Popen(
+            [sys.executable, "-c", WORKER], cwd=ROOT, env=env,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        for _ in range(4)
+    ]
+    results = [worker.communicate(timeout=120) for worker in workers]
+
+    assert [worker.returncode for worker in workers] == [0] * 4, [err for _, err in results]
+
+    # Workers may share out the steps, but each one runs exactly once
+    applied = [json.loads(out.strip().splitlines()[-1]) for out, _ in results]
+    versions = sorted(version for steps in applied for version, _ in steps)
+    assert versions == [version for version, _, _ in MIGRATIONS]
@@ -0,0 +1,83 @@
+import pytest
+
+from app.core.pagination import encode_cursor
+
+
+def walk(client, path, headers=None, **params):
+    """Follow next_cursor to the end; returns (ids, pages)."""
+    ids, pages, after = [], 0, None
+
+    while True:
+        query = dict(params, **({"after": after} if after else {}))
+        response = client.get(path, params=query, headers=headers)
+        assert response.status_code == 200, response.text
+
+        page = response.json()
+        ids += [item["id"] for item in page["items"]]
+        pages += 1
+
+        after = page["next_cursor"]
+        if not after:
+            return ids, pages
+
+
+def test_my_properties_cursor_round_trip(client, agent, create_property):
+    created = [create_property(agent, title=f"Listing {n}")["id"] for n in range(5)]
+
+    ids, pages = walk(client, "/properties/my-properties", agent, limit=2)
+
+    assert ids == created
+    assert pages == 3
+
+
+def test_list_cursor_continues_after_last_seen_id(client, agent, create_property):
+    first, second = (create_property(agent)["id"] for _ in range(2))
+
+    response = client.get(
+        "/properties/", params={"after": encode_cursor({"id": first}), "limit": 1}, headers=agent)
+
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()["items"]] == [second]
+
+
+def test_plain_list_without_paging_params(client, agent, create_property):
+    created = create_property(agent)["id"]
+
+    response = client.get("/properties/", headers=agent)
+
+    assert isinstance(response.json(), list)
+    assert created in [item["id"] for item in response.json()]
+
+
+@pytest.mark.parametrize("after", [
+    "not a cursor!",
+    encode_cursor({"id": "7"}),
+    encode_cursor({"id": True}),
+    encode_cursor({"price": 10}),
+    "WzEsMiwzXQ",   # base64 of [1,2,3]: JSON, but not an object
+])
+@pytest.mark.parametrize("path", ["/properties/", "/properties/my-properties", "/properties/search"])
+def test_bad_cursor_is_rejected(client, agent, path, after):
+    response = client.get(path, params={"after": after}, headers=agent)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+@pytest.mark.parametrize("sort", ["price", "-price"])
+def test_price_sorted_search_pages_include_unpriced_rows(
+        client, agent, create_property, db_session, unique_location, sort):
+    from app.models.property_model import Property
+
+    props = [create_property(agent, price=price) for price in (300.0, 100.0, 200.0, 100.0, 400.0)]
+    unpriced = [props[2]["id"], props[4]["id"]]
+    db_session.query(Property).filter(Property.id.in_(unpriced)).update({"price": None})
+    db_session.commit()
+
+    ids, _ = walk(client, "/properties/search", location=unique_location, sort=sort, limit=2)
+
+    priced = {props[0]["id"]: 300.0, props[1]["id"]: 100.0, props[3]["id"]: 100.0}
+    descending = sort == "-price"
+    expected = sorted(priced, key=lambda id_: (priced[id_], id_), reverse=descending)
+    expected += sorted(unpriced, reverse=descending)
+    assert ids == expected
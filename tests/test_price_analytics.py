@@ -0,0 +1,110 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.core.config import settings
+from app.services import price_analytics as price_analytics_module
+from app.services.price_analytics import PriceAnalytics
+
+MAX_AGE = 300
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = time.time()
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    # Only the analytics' wall clock moves; perf_counter stays real
+    monkeypatch.setattr(price_analytics_module, "time",
+                        SimpleNamespace(time=clock, perf_counter=time.perf_counter))
+    monkeypatch.setattr(settings, "PRICE_ANALYTICS_MAX_STALENESS_SECONDS", MAX_AGE)
+    return clock
+
+
+@pytest.fixture
+def analytics(client):
+    return PriceAnalytics()
+
+
+def report(analytics, location):
+    return asyncio.run(analytics.report(location))
+
+
+def group(result, status):
+    return next(g for g in result["groups"] if g["status"] == status)
+
+
+def test_report_computes_on_first_use(client, analytics, clock, agent, create_property, unique_location):
+    prices = [100.0, 200.0, 300.0, 400.0, 1000.0]
+    for price in prices:
+        create_property(agent, price=price)
+
+    result = report(analytics, unique_location.upper())
+
+    overall = group(result, "*")
+    assert overall["count"] == 5
+    assert (overall["min"], overall["max"], overall["mean"]) == (100.0, 1000.0, 400.0)
+    assert overall["median"] == np.percentile(prices, 50)
+    assert overall["p10"] == pytest.approx(np.percentile(prices, 10))
+    assert overall["p90"] == pytest.approx(np.percentile(prices, 90))
+    assert group(result, "available")["count"] == 5
+    assert result["up_to_date"] is True
+
+
+def test_fresh_summary_is_reused_until_max_age(
+        client, analytics, clock, agent, create_property, unique_location):
+    create_property(agent, price=100.0)
+    first = report(analytics, unique_location)
+
+    create_property(agent, price=200.0)
+    clock.now += MAX_AGE - 1
+    reused = report(analytics, unique_location)
+
+    assert reused["computed_at"] == first["computed_at"]
+    assert group(reused, "*")["count"] == 1
+    # Written since, and this process knows it
+    assert reused["up_to_date"] is False
+
+    clock.now += 2
+    refreshed = report(analytics, unique_location)
+
+    assert refreshed["computed_at"] != first["computed_at"]
+    assert refreshed["age_seconds"] == 0
+    assert group(refreshed, "*")["count"] == 2
+    assert refreshed["up_to_date"] is True
+
+
+def test_refresh_with_max_age_keeps_a_fresh_summary(client, analytics, clock):
+    summary = analytics.refresh()
+
+    clock.now += 10
+    assert analytics.refresh(max_age=60) is summary
+
+    clock.now += 60
+    assert analytics.refresh(max_age=60) is not summary
+
+
+def test_report_endpoint_filters_by_location_and_status(
+        client, monkeypatch, agent, create_property, unique_location):
+    # Whatever an earlier test left behind would still be fresh
+    monkeypatch.setattr(price_analytics_module.price_analytics, "_summary", None)
+
+    create_property(agent, price=100.0, status="available")
+    create_property(agent, price=300.0, status="sold")
+
+    response = client.get("/properties/analytics/prices", params={
+        "location": unique_location, "status": "sold"})
+
+    assert response.status_code == 200
+    assert [(g["location"], g["status"], g["count"]) for g in response.json()["groups"]] == [
+        (unique_location, "sold", 1)]
@@ -0,0 +1,76 @@
+def get(client, path, headers=None, etag=None, **params):
+    headers = dict(headers or {})
+    if etag:
+        headers["If-None-Match"] = etag
+    return client.get(path, params=params, headers=headers)
+
+
+def test_unchanged_response_is_not_modified(client, agent, create_property):
+    prop = create_property(agent)
+
+    first = get(client, f"/properties/{prop['id']}", agent)
+    again = get(client, f"/properties/{prop['id']}", agent, etag=first.headers["ETag"])
+
+    assert first.status_code == 200
+    assert again.status_code == 304
+    assert again.headers["ETag"] == first.headers["ETag"]
+    assert again.content == b""
+
+
+def test_update_invalidates_cached_property(client, agent, create_property):
+    prop = create_property(agent, title="Before")
+    etag = get(client, f"/properties/{prop['id']}", agent).headers["ETag"]
+
+    response = client.put(
+        f"/properties/{prop['id']}", headers=agent,
+        json={"title": "After", "location": prop["location"], "price": prop["price"]})
+    assert response.status_code == 200
+
+    after = get(client, f"/properties/{prop['id']}", agent, etag=etag)
+
+    assert after.status_code == 200
+    assert after.json()["title"] == "After"
+    assert after.headers["ETag"] != etag
+
+
+def test_create_invalidates_search_and_stats(client, agent, create_property, unique_location):
+    create_property(agent)
+    search = get(client, "/properties/search", location=unique_location)
+    stats = get(client, "/properties/stats")
+
+    create_property(agent, status="sold")
+
+    search_after = get(client, "/properties/search", etag=search.headers["ETag"], location=unique_location)
+    stats_after = get(client, "/properties/stats", etag=stats.headers["ETag"])
+
+    assert search_after.status_code == 200
+    assert len(search_after.json()) == len(search.json()) + 1
+    assert stats_after.status_code == 200
+    assert stats_after.json()["sold"] == stats.json().get("sold", 0) + 1
+
+
+def test_owner_scoped_entry_follows_its_owner_writes(client, make_user, create_property):
+    owner, other = make_user(), make_user()
+    create_property(owner)
+
+    mine = get(client, "/properties/my-properties", owner)
+    etag = mine.headers["ETag"]
+
+    # Someone else's write leaves the owner's list valid
+    create_property(other)
+    assert get(client, "/properties/my-properties", owner, etag=etag).status_code == 304
+
+    create_property(owner)
+    after = get(client, "/properties/my-properties", owner, etag=etag)
+
+    assert after.status_code == 200
+    assert len(after.json()) == len(mine.json()) + 1
+
+
+def test_delete_invalidates_cached_property(client, agent, create_property):
+    prop = create_property(agent)
+    etag = get(client, f"/properties/{prop['id']}", agent).headers["ETag"]
+
+    assert client.delete(f"/properties/{prop['id']}", headers=agent).status_code == 200
+
+    assert get(client, f"/properties/{prop['id']}", agent, etag=etag).status_code == 404
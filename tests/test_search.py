@@ -0,0 +1,44 @@
+import json
+
+
+def test_query_without_terms_falls_back_to_like(client, agent, create_property, unique_location):
+    deal = create_property(agent, title="Deal!! corner flat")["id"]
+    create_property(agent, title="Quiet corner flat")
+
+    response = client.get("/properties/search", params={"q": "!!", "location": unique_location})
+
+    assert [item["id"] for item in response.json()] == [deal]
+
+
+def test_query_without_terms_still_filters(client, agent, create_property):
+    create_property(agent)
+
+    # Nothing to MATCH in "***": the filter must not be dropped
+    assert client.get("/properties/search", params={"q": "***"}).json() == []
+
+    response = client.get("/properties/export", params={"q": "***"}, headers=agent)
+    assert response.status_code == 200
+    assert response.text == ""
+
+
+def test_export_applies_text_query(client, agent, create_property):
+    wanted = create_property(agent, title="Sunlit loft")["id"]
+    create_property(agent, title="Basement studio")
+
+    response = client.get("/properties/export", params={"q": "sunlit loft"}, headers=agent)
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert wanted in [row["id"] for row in rows]
+    assert all("sunlit" in row["title"].lower() for row in rows)
+
+
+def test_export_filters_by_status_list(client, agent, create_property, unique_location):
+    available = create_property(agent, status="available")["id"]
+    sold = create_property(agent, status="sold")["id"]
+    create_property(agent, status="rented")
+
+    response = client.get("/properties/export", headers=agent, params={
+        "location": unique_location, "status": "available, sold"})
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(row["id"] for row in rows) == [available, sold]
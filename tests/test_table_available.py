@@ -0,0 +1,37 @@
+import sqlite3
+
+from sqlalchemy.orm import Session
+
+from app.core import change_log, geo_index, search_index, status_counts
+from app.core.database import create_db_engine, table_available
+from app.core.migrations import run_migrations
+
+
+def test_table_created_later_is_picked_up(tmp_path):
+    path = tmp_path / "late.db"
+    db_engine = create_db_engine(f"sqlite:///{path}")
+    try:
+        with Session(db_engine) as db:
+            assert not table_available(db, "late_table")
+
+            # Created behind the app's back, e.g. by a migrate run in another process
+            with sqlite3.connect(path) as conn:
+                conn.execute("CREATE TABLE late_table (id INTEGER PRIMARY KEY)")
+
+            assert table_available(db, "late_table")
+    finally:
+        db_engine.dispose()
+
+
+def test_derived_tables_available_after_migrating(tmp_path):
+    db_engine = create_db_engine(f"sqlite:///{tmp_path / 'unmigrated.db'}")
+    modules = [change_log, geo_index, search_index, status_counts]
+    try:
+        with Session(db_engine) as db:
+            assert not any(module.is_available(db) for module in modules)
+
+            run_migrations(db_engine)
+
+            assert all(module.is_available(db) for module in modules)
+    finally:
+        db_engine.dispose()
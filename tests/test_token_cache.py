@@ -0,0 +1,119 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.core import token_cache as token_cache_module
+from app.core.token_cache import TokenCache
+
+
+class Clock:
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    # Only the cache's view of time moves
+    monkeypatch.setattr(token_cache_module, "time", SimpleNamespace(time=clock))
+    return clock
+
+
+def counting(payload=None):
+    """A verify function that records the tokens it was asked about."""
+    calls = []
+
+    def verify(token):
+        calls.append(token)
+        if payload is None:
+            raise HTTPException(status_code=401, detail="Invalid token")
+        return dict(payload)
+
+    return verify, calls
+
+
+def test_second_lookup_is_a_hit(clock):
+    cache = TokenCache(max_entries=10, ttl_seconds=60)
+    verify, calls = counting({"sub": "a@example.com", "exp": clock.now + 3600})
+
+    first = cache.get_or_verify("token-a", verify)
+    first["sub"] = "changed by the caller"
+    second = cache.get_or_verify("token-a", verify)
+
+    assert calls == ["token-a"]
+    assert second["sub"] == "a@example.com"
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (1, 1)
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = TokenCache(max_entries=10, ttl_seconds=60)
+    verify, calls = counting({"sub": "a", "exp": clock.now + 3600})
+
+    cache.get_or_verify("token-a", verify)
+    clock.now += 59
+    cache.get_or_verify("token-a", verify)
+    clock.now += 2
+    cache.get_or_verify("token-a", verify)
+
+    assert calls == ["token-a", "token-a"]
+
+
+def test_entry_never_outlives_token_exp(clock):
+    cache = TokenCache(max_entries=10, ttl_seconds=3600)
+    verify, calls = counting({"sub": "a", "exp": clock.now + 5})
+
+    cache.get_or_verify("token-a", verify)
+    clock.now += 6
+    cache.get_or_verify("token-a", verify)
+
+    assert calls == ["token-a", "token-a"]
+
+
+def test_invalid_token_is_not_cached(clock):
+    cache = TokenCache(max_entries=10, ttl_seconds=60)
+    verify, calls = counting(None)
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as excinfo:
+            cache.get_or_verify("bad-token", verify)
+        assert excinfo.value.status_code == 401
+
+    assert calls == ["bad-token", "bad-token"]
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = TokenCache(max_entries=2, ttl_seconds=60)
+    verify, calls = counting({"sub": "x", "exp": clock.now + 3600})
+
+    cache.get_or_verify("a", verify)
+    cache.get_or_verify("b", verify)
+    cache.get_or_verify("a", verify)     # a is now the most recent
+    cache.get_or_verify("c", verify)     # evicts b
+    cache.get_or_verify("a", verify)
+    cache.get_or_verify("b", verify)
+
+    assert calls == ["a", "b", "c", "b"]
+    assert cache.stats()["evictions"] == 2
+
+
+def test_disabled_cache_always_verifies(clock):
+    cache = TokenCache(max_entries=0, ttl_seconds=60)
+    verify, calls = counting({"sub": "a"})
+
+    cache.get_or_verify("token-a", verify)
+    cache.get_or_verify("token-a", verify)
+
+    assert calls == ["token-a", "token-a"]
+
+
+def test_invalid_bearer_token_is_rejected(client):
+    response = client.get("/properties/my-properties", headers={"Authorization": "Bearer not-a-jwt"})
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Invalid token"